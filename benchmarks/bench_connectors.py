@@ -0,0 +1,213 @@
+"""
+Throughput benchmark for the HTTP connectors.
+
+Starts MockSinkServer locally, sends synthetic issues through each connector and reports events/sec, p50/p99 delivery
+latency and how many requests the mock sink throttled or rejected. Connectors whose SDK is not installed are skipped.
+
+Usage:
+    python benchmarks/bench_connectors.py --events 2000 --latency 0.005 --throttle-ratio 0.01
+    python benchmarks/bench_connectors.py --connectors panther webhook --concurrency 8
+    python benchmarks/bench_connectors.py --connectors panther panther-batch
+"""
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixtures import generate_issues  # noqa: E402
+from mock_sinks import MockSinkServer  # noqa: E402
+from socketsync.connectors import get_connector  # noqa: E402
+
+
+# Mock sink that receives the requests of a sender, when it is not named after it
+sink_names = {
+    "panther-batch": "panther",
+    "webhook-batch": "webhook",
+    "otlp-json": "otlp",
+}
+
+
+def create_senders(url: str) -> dict:
+    """
+    Creates a function per connector that delivers a single issue to the mock sink
+    :param url: Base URL of the mock sink server
+    :return: Dict of connector name to send function
+    """
+    def sentinel():
+        Sentinel = get_connector("sentinel")
+        client = Sentinel("mock-workspace", base64.b64encode(b"mock-shared-key").decode())
+        client.uri = f"{url}/api/logs?api-version=2016-04-01"
+        return lambda issue: client.send_event(issue)
+
+    def sumologic():
+        Sumologic = get_connector("sumologic")
+        client = Sumologic(f"{url}/receiver/v1/http/mock-token")
+        return lambda issue: client.send_events([issue], "socket-siem-connector")
+
+    def panther():
+        Panther = get_connector("panther")
+        client = Panther(url=f"{url}/panther/mock-source", token="mock-token")
+        return lambda issue: client.send(str(issue))
+
+    def panther_batch():
+        Panther = get_connector("panther")
+        client = Panther(url=f"{url}/panther/mock-source", token="mock-token")
+        return batched(client.send_batch)
+
+    def webhook():
+        Webhook = get_connector("webhook")
+        client = Webhook(f"{url}/webhook/mock")
+        return lambda issue: client.send(json.loads(str(issue)))
+
+    def webhook_batch():
+        Webhook = get_connector("webhook")
+        client = Webhook(f"{url}/webhook/mock")
+        return batched(client.send_batch)
+
+    def otlp():
+        OTLP = get_connector("otlp")
+        client = OTLP(url)
+        return batched(client.send_events)
+
+    def otlp_json():
+        OTLP = get_connector("otlp")
+        client = OTLP(url, encoding="json")
+        return batched(client.send_events)
+
+    def slack():
+        import slack_sdk  # noqa: F401
+        Slack = get_connector("slack")
+        client = Slack(f"{url}/slack/services/mock")
+        return lambda issue: client.send(json.loads(str(issue)))
+
+    def splunk():
+        Splunk = get_connector("splunk")
+        client = Splunk(url, token="mock-token", ack=True, ack_interval=0.05)
+        return batched(client.send_events)
+
+    return {
+        "sentinel": sentinel,
+        "sumologic": sumologic,
+        "panther": panther,
+        "panther-batch": panther_batch,
+        "webhook": webhook,
+        "webhook-batch": webhook_batch,
+        "slack": slack,
+        "splunk": splunk,
+        "otlp": otlp,
+        "otlp-json": otlp_json,
+    }
+
+
+def batched(send):
+    """
+    Marks a sender that takes the whole list of issues, for connectors that batch the events themselves
+    :param send: Function that delivers a list of issues
+    :return:
+    """
+    def send_batch(issues: list):
+        return send(issues)
+
+    send_batch.batched = True
+    return send_batch
+
+
+def percentile(values: list, percent: float) -> float:
+    if len(values) == 0:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_connector(name: str, send, issues: list, concurrency: int) -> dict:
+    def timed_send(issue) -> float:
+        start = time.perf_counter()
+        send(issue)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    if getattr(send, "batched", False):
+        latencies = [timed_send(issues)]
+    elif concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            latencies = list(executor.map(timed_send, issues))
+    else:
+        latencies = [timed_send(issue) for issue in issues]
+    seconds = time.perf_counter() - start
+    return {
+        "connector": name,
+        "events": len(issues),
+        "seconds": seconds,
+        "events_per_second": len(issues) / seconds if seconds > 0 else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the HTTP connectors against local mock sinks")
+    parser.add_argument("--events", type=int, default=1000, help="Number of issues to send per connector")
+    parser.add_argument("--connectors", nargs="*", help="Connectors to run, defaults to all")
+    parser.add_argument("--concurrency", type=int, default=1, help="Number of threads sending at the same time")
+    parser.add_argument("--latency", type=float, default=0.0, help="Injected sink latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum random extra latency in seconds")
+    parser.add_argument("--throttle-ratio", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--rate-limit", type=float, help="Requests per second per sink before answering with 429")
+    parser.add_argument("--max-payload-bytes", type=int, help="Reject larger request bodies with 413")
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    server = MockSinkServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        throttle_ratio=args.throttle_ratio,
+        rate_limit=args.rate_limit,
+        max_payload_bytes=args.max_payload_bytes
+    ).start()
+    issues = generate_issues(args.events)
+    senders = create_senders(server.url)
+    names = args.connectors or list(senders)
+    results = []
+    try:
+        for name in names:
+            try:
+                send = senders[name]()
+            except ImportError as error:
+                print(f"Skipping {name}: {error}")
+                continue
+            server.reset()
+            result = run_connector(name, send, issues, args.concurrency)
+            stats = server.get_stats()
+            sink = stats.get(sink_names.get(name, name), {})
+            result["requests"] = sink.get("requests", 0)
+            result["delivered"] = sink.get("events", 0)
+            result["throttled"] = sink.get("throttled", 0)
+            result["rejected"] = sink.get("rejected_too_large", 0)
+            results.append(result)
+    finally:
+        server.stop()
+
+    print(
+        f"{'connector':<15}{'events':>8}{'events/sec':>12}{'p50 ms':>10}{'p99 ms':>10}"
+        f"{'requests':>10}{'delivered':>11}{'throttled':>11}{'rejected':>10}"
+    )
+    for result in results:
+        print(
+            f"{result['connector']:<15}{result['events']:>8}{result['events_per_second']:>12.0f}"
+            f"{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['requests']:>10}"
+            f"{result['delivered']:>11}{result['throttled']:>11}{result['rejected']:>10}"
+        )
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"arguments": vars(args), "results": results}, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
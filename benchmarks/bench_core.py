@@ -0,0 +1,185 @@
+"""
+Offline throughput benchmark for Core.
+
+Runs Core against FakeSocketDev with synthetic full scans and reports, per stage, the wall time, items per second,
+peak traced memory, net allocated blocks and the process peak RSS. Results can be saved and compared against a
+previous run to catch performance regressions before a release.
+
+Usage:
+    python benchmarks/bench_core.py --reports 20 --packages 5000 --alert-density 0.5 --fanout 4
+    python benchmarks/bench_core.py --save baseline.json
+    python benchmarks/bench_core.py --compare baseline.json --tolerance 0.2
+"""
+import argparse
+import gc
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fake_socket  # noqa: E402
+from fake_socket import FakeConfig  # noqa: E402
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak / 1024 / 1024
+    return peak / 1024
+
+
+def measure(name: str, function, count_items, repeat: int = 3) -> dict:
+    """
+    Runs a stage for timing and then once more under tracemalloc for memory, so tracing does not skew the timing
+    :param name: Stage name
+    :param function: Callable running the stage and returning its result
+    :param count_items: Callable returning the number of items produced from the result
+    :param repeat: Number of timing runs, the fastest one is reported
+    :return:
+    """
+    seconds = None
+    items = 0
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        if seconds is None or elapsed < seconds:
+            seconds = elapsed
+        items = count_items(result)
+        del result
+
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    result = function()
+    _, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks_before
+    del result
+    return {
+        "stage": name,
+        "seconds": seconds,
+        "items": items,
+        "items_per_second": items / seconds if seconds > 0 else 0.0,
+        "peak_traced_mb": peak_traced / 1024 / 1024,
+        "allocated_blocks": blocks,
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+
+def run(args) -> list:
+    FakeConfig.orgs = [f"synthetic-org-{index}" for index in range(args.orgs)]
+    FakeConfig.reports = args.reports
+    FakeConfig.repos = args.repos
+    FakeConfig.packages = args.packages
+    FakeConfig.alert_density = args.alert_density
+    FakeConfig.ancestor_fanout = args.fanout
+    FakeConfig.direct_ratio = args.direct_ratio
+    FakeConfig.unknown_alert_ratio = args.unknown_ratio
+    FakeConfig.churn = args.churn
+    fake_socket.install()
+
+    import socketsync.core
+    from socketsync.core import Core
+    from socketsync.classes import Package
+    from socketsync.graph import ScanIndex
+
+    core_options = {"api_key": "synthetic", "enable_all_alerts": args.all_alerts}
+    if args.process_workers:
+        core_options["process_workers"] = args.process_workers
+    if args.orgs > 1:
+        core_options["all_orgs"] = True
+    core = Core(**core_options)
+    client = socketsync.core.socket
+    org = socketsync.core.org_slug
+
+    reports = core.get_reports(org)
+    streams = {report.id: client.fullscans.stream(org, report.id) for report in reports}
+
+    def create_issue_alerts() -> list:
+        issues = []
+        seen = set()
+        socketsync.core.issue_templates.clear()
+        for report in reports:
+            packages = streams[report.id]
+            index = ScanIndex(packages)
+            for package_id in packages:
+                package = Package(**packages[package_id])
+                issues = Core.create_issue_alerts(package, issues, packages, report, seen=seen, index=index)
+        return issues
+
+    stages = [
+        measure("get_reports", lambda: core.get_reports(org), len, args.repeat),
+        measure("create_issue_alerts", create_issue_alerts, len, args.repeat),
+        measure("handle_reports", lambda: Core.handle_reports(reports, [], org), len, args.repeat),
+        measure("get_issues", core.get_issues, len, args.repeat),
+    ]
+    return stages
+
+
+def compare(stages: list, baseline_file: str, tolerance: float) -> list:
+    with open(baseline_file, "r") as file:
+        baseline = {stage["stage"]: stage for stage in json.load(file)["stages"]}
+    regressions = []
+    for stage in stages:
+        previous = baseline.get(stage["stage"])
+        if previous is None:
+            continue
+        if stage["items_per_second"] < previous["items_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{stage['stage']}: {stage['items_per_second']:.0f} items/sec is below the baseline "
+                f"{previous['items_per_second']:.0f} items/sec"
+            )
+        if stage["peak_traced_mb"] > previous["peak_traced_mb"] * (1 + tolerance):
+            regressions.append(
+                f"{stage['stage']}: peak traced memory {stage['peak_traced_mb']:.1f}MB is above the baseline "
+                f"{previous['peak_traced_mb']:.1f}MB"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline Core throughput benchmark")
+    parser.add_argument("--orgs", type=int, default=1, help="Number of synthetic orgs")
+    parser.add_argument("--reports", type=int, default=10, help="Number of scans per org")
+    parser.add_argument("--repos", type=int, default=5, help="Number of repos the scans are spread over")
+    parser.add_argument("--packages", type=int, default=2000, help="Packages per scan")
+    parser.add_argument("--alert-density", type=float, default=0.5, help="Average alerts per package")
+    parser.add_argument("--fanout", type=int, default=3, help="Maximum top level ancestors per transitive package")
+    parser.add_argument("--direct-ratio", type=float, default=0.1, help="Share of direct packages")
+    parser.add_argument("--unknown-ratio", type=float, default=0.05, help="Share of alerts with unknown types")
+    parser.add_argument("--churn", type=float, default=0.0, help="Share of packages that change between scans")
+    parser.add_argument("--all-alerts", action="store_true", help="Run Core with enable_all_alerts")
+    parser.add_argument("--process-workers", type=int, default=0, help="Extract alerts in this many worker processes")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs per stage, the fastest is reported")
+    parser.add_argument("--save", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Compare against results saved with --save")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed regression ratio for --compare")
+    args = parser.parse_args()
+
+    stages = run(args)
+    print(f"{'stage':<22}{'seconds':>10}{'items':>10}{'items/sec':>12}{'traced MB':>12}{'blocks':>12}{'RSS MB':>10}")
+    for stage in stages:
+        print(
+            f"{stage['stage']:<22}{stage['seconds']:>10.3f}{stage['items']:>10}{stage['items_per_second']:>12.0f}"
+            f"{stage['peak_traced_mb']:>12.1f}{stage['allocated_blocks']:>12}{stage['peak_rss_mb']:>10.1f}"
+        )
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"arguments": vars(args), "stages": stages}, file, indent=2)
+    if args.compare:
+        regressions = compare(stages, args.compare, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
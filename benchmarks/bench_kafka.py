@@ -0,0 +1,80 @@
+"""
+Throughput benchmark for the Kafka connector against the in-memory broker stand-in.
+
+Reports events/sec, the number of produce requests the batching settings lead to, delivery latency from the delivery
+reports and whether the issues of every repo kept their order within their partition.
+
+Usage:
+    python benchmarks/bench_kafka.py --events 50000 --request-latency 0.002
+    python benchmarks/bench_kafka.py --linger-ms 0 --batch-bytes 16384
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fake_kafka  # noqa: E402
+from fixtures import generate_issues  # noqa: E402
+from socketsync import metrics  # noqa: E402
+from socketsync.connectors import get_connector  # noqa: E402
+
+
+def check_order(broker: fake_kafka.FakeBroker, topic: str, issues: list) -> bool:
+    expected = defaultdict(list)
+    for issue in issues:
+        expected[f"{issue.owner}/{issue.repo}"].append(f"{issue.report_id}/{issue.pkg_id}/{issue.key}")
+    received = defaultdict(list)
+    for partition in broker.topics[topic]:
+        for message in partition:
+            issue = json.loads(message.value())
+            received[message.key().decode()].append(f"{issue['report_id']}/{issue['pkg_id']}/{issue['key']}")
+    return expected == received
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Kafka connector against an in-memory broker")
+    parser.add_argument("--events", type=int, default=20000, help="Number of issues to publish")
+    parser.add_argument("--partitions", type=int, default=6, help="Partitions of the topic")
+    parser.add_argument("--linger-ms", type=int, default=50, help="linger.ms of the producer")
+    parser.add_argument("--batch-bytes", type=int, default=1000000, help="batch.size of the producer")
+    parser.add_argument("--request-latency", type=float, default=0.0, help="Seconds each produce request takes")
+    parser.add_argument("--fail-ratio", type=float, default=0.0, help="Share of produce requests that fail")
+    args = parser.parse_args()
+
+    broker = fake_kafka.install(fake_kafka.FakeBroker(
+        partitions=args.partitions,
+        request_latency=args.request_latency,
+        fail_ratio=args.fail_ratio
+    ))
+    recorder = metrics.InMemoryRecorder()
+    metrics.set_recorder(recorder)
+    issues = generate_issues(args.events)
+    Kafka = get_connector("kafka")
+    kafka = Kafka("localhost:9092", "socket-issues", linger_ms=args.linger_ms, batch_bytes=args.batch_bytes)
+    start = time.perf_counter()
+    errors = kafka.send_events(issues)
+    seconds = time.perf_counter() - start
+    snapshot = recorder.snapshot()
+    labels = (("sink", "kafka"),)
+    delivered = snapshot["counters"].get("socketsync_sink_events_total", {}).get(labels, 0)
+    failed = snapshot["counters"].get("socketsync_sink_failures_total", {}).get(labels, 0)
+    latency = snapshot["histograms"].get("socketsync_sink_send_seconds", {}).get(labels, {"count": 0, "sum": 0.0})
+    print(f"events:            {args.events}")
+    print(f"events/sec:        {args.events / seconds:.0f}")
+    print(f"produce requests:  {broker.requests}")
+    print(f"delivery errors:   {len(errors)}")
+    print(f"delivered:         {delivered:.0f}")
+    print(f"failed:            {failed:.0f}")
+    if latency["count"] > 0:
+        print(f"mean latency ms:   {latency['sum'] / latency['count'] * 1000:.2f}")
+    if args.fail_ratio == 0:
+        print(f"per repo order:    {'kept' if check_order(broker, 'socket-issues', issues) else 'BROKEN'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
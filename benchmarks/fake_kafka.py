@@ -0,0 +1,177 @@
+"""
+In-memory stand-in for a single-node Kafka broker and the confluent_kafka Producer used by the Kafka connector.
+
+FakeProducer follows the librdkafka producer behaviour the connector relies on: messages are partitioned by a CRC32 of
+their key, queued per partition, sent in batches once linger.ms passes or batch.size bytes are queued, and delivery
+reports are served from poll and flush. produce raises BufferError once queue.buffering.max.messages are queued.
+Install it with `install()` before creating the connector.
+"""
+import sys
+import threading
+import time
+import types
+import zlib
+from collections import defaultdict
+
+
+class FakeKafkaError(Exception):
+    pass
+
+
+class FakeMessage:
+    def __init__(self, topic: str, partition: int, key: bytes, value: bytes):
+        self._topic = topic
+        self._partition = partition
+        self._key = key
+        self._value = value
+        self._produced = time.perf_counter()
+        self._delivered = None
+        self._offset = None
+
+    def topic(self) -> str:
+        return self._topic
+
+    def partition(self) -> int:
+        return self._partition
+
+    def key(self) -> bytes:
+        return self._key
+
+    def value(self) -> bytes:
+        return self._value
+
+    def offset(self) -> int:
+        return self._offset
+
+    def error(self):
+        return None
+
+    def latency(self) -> float:
+        if self._delivered is None:
+            return None
+        return self._delivered - self._produced
+
+
+class FakeBroker:
+    def __init__(self, partitions: int = 6, request_latency: float = 0.0, fail_ratio: float = 0.0):
+        """
+        Single broker keeping the messages of every topic in memory
+
+        :param partitions: Number of partitions of each topic
+        :param request_latency: Seconds each produce request to the broker takes
+        :param fail_ratio: Share of produce requests that fail, their messages get an error delivery report
+        """
+        self.partitions = partitions
+        self.request_latency = request_latency
+        self.fail_ratio = fail_ratio
+        self.topics = defaultdict(lambda: [[] for _ in range(self.partitions)])
+        self.requests = 0
+        self.failed_requests = 0
+        self.lock = threading.Lock()
+
+    def append(self, topic: str, partition: int, batch: list) -> bool:
+        if self.request_latency > 0:
+            time.sleep(self.request_latency)
+        with self.lock:
+            self.requests += 1
+            if self.fail_ratio > 0 and (self.requests * self.fail_ratio) % 1 + self.fail_ratio >= 1:
+                self.failed_requests += 1
+                return False
+            log = self.topics[topic][partition]
+            for message in batch:
+                message._offset = len(log)
+                log.append(message)
+        return True
+
+
+class FakeProducer:
+    def __init__(self, config: dict, broker: FakeBroker):
+        self.config = config
+        self.broker = broker
+        self.linger = float(config.get("linger.ms", 5)) / 1000
+        self.batch_size = int(config.get("batch.size", 1000000))
+        self.max_messages = int(config.get("queue.buffering.max.messages", 100000))
+        self.queues = defaultdict(list)
+        self.queue_bytes = defaultdict(int)
+        self.queue_started = {}
+        self.reports = []
+        self.queued = 0
+
+    def partition_for(self, key: bytes) -> int:
+        if key is None:
+            return 0
+        return zlib.crc32(key) % self.broker.partitions
+
+    def produce(self, topic: str, value: bytes = None, key: bytes = None, on_delivery=None, **kwargs) -> None:
+        if self.queued >= self.max_messages:
+            raise BufferError("Local: Queue full")
+        partition = self.partition_for(key)
+        message = FakeMessage(topic, partition, key, value)
+        queue = (topic, partition)
+        if not self.queues[queue]:
+            self.queue_started[queue] = time.perf_counter()
+        self.queues[queue].append((message, on_delivery))
+        self.queue_bytes[queue] += len(value or b"") + len(key or b"")
+        self.queued += 1
+        if self.queue_bytes[queue] >= self.batch_size:
+            self.send_queue(queue)
+
+    def send_queue(self, queue: tuple) -> None:
+        batch = self.queues.pop(queue, [])
+        self.queue_bytes.pop(queue, None)
+        self.queue_started.pop(queue, None)
+        if not batch:
+            return
+        delivered = self.broker.append(queue[0], queue[1], [message for message, _ in batch])
+        now = time.perf_counter()
+        error = None if delivered else FakeKafkaError("Broker: Request failed")
+        for message, on_delivery in batch:
+            message._delivered = now
+            self.reports.append((on_delivery, error, message))
+
+    def send_ready(self, force: bool = False) -> None:
+        now = time.perf_counter()
+        for queue, started in list(self.queue_started.items()):
+            if force or now - started >= self.linger:
+                self.send_queue(queue)
+
+    def serve_reports(self) -> int:
+        reports = self.reports
+        self.reports = []
+        for on_delivery, error, _ in reports:
+            self.queued -= 1
+            if on_delivery is not None:
+                on_delivery(error, _)
+        return len(reports)
+
+    def poll(self, timeout: float = 0) -> int:
+        self.send_ready()
+        served = self.serve_reports()
+        if served == 0 and timeout and self.queue_started:
+            time.sleep(min(timeout, self.linger))
+            self.send_ready()
+            served = self.serve_reports()
+        return served
+
+    def flush(self, timeout: float = None) -> int:
+        self.send_ready(force=True)
+        self.serve_reports()
+        return self.queued
+
+    def __len__(self) -> int:
+        return self.queued
+
+
+def install(broker: FakeBroker = None) -> FakeBroker:
+    """
+    Registers a fake confluent_kafka module whose Producer writes to the broker
+    :param broker: FakeBroker, a new one is created if not set
+    :return: The broker
+    """
+    if broker is None:
+        broker = FakeBroker()
+    module = types.ModuleType("confluent_kafka")
+    module.Producer = lambda config: FakeProducer(config, broker)
+    module.KafkaError = FakeKafkaError
+    sys.modules["confluent_kafka"] = module
+    return broker
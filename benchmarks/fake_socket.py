@@ -0,0 +1,145 @@
+"""
+In-memory stand-in for the socketdev client used by the offline benchmarks.
+
+FakeSocketDev answers the same calls Core makes against the Socket API from the synthetic fixtures, so Core can be
+benchmarked without network access or a live Socket org. Install it with `install()` before creating Core. Streams are
+cached per scan id by default so that generating the fixtures is not measured as part of Core.
+"""
+import copy
+from collections import Counter
+
+from fixtures import generate_full_scan, generate_reports, generate_security_policy, scan_seed
+
+
+class FakeConfig:
+    orgs: list = ["synthetic-org"]
+    reports: int = 10
+    repos: int = 5
+    branches: list = ["main"]
+    packages: int = 1000
+    alert_density: float = 0.3
+    ancestor_fanout: int = 3
+    direct_ratio: float = 0.1
+    unknown_alert_ratio: float = 0.05
+    churn: float = 0.0
+    per_page: int = 100
+    cache_streams: bool = True
+
+
+calls = Counter()
+
+
+class FakeOrgs:
+    def get(self) -> dict:
+        calls["org.get"] += 1
+        organizations = {}
+        for org_slug in FakeConfig.orgs:
+            organizations[f"{org_slug}-id"] = {"id": f"{org_slug}-id", "name": org_slug, "slug": org_slug}
+        return {"organizations": organizations}
+
+
+class FakeSettings:
+    def get(self, org_slug: str) -> dict:
+        calls["settings.get"] += 1
+        return {"securityPolicyRules": generate_security_policy()}
+
+
+class FakeFullScans:
+    def __init__(self):
+        self.reports = {}
+        self.streams = {}
+
+    def org_reports(self, org_slug: str) -> list:
+        if org_slug not in self.reports:
+            self.reports[org_slug] = generate_reports(
+                org_slug=org_slug,
+                count=FakeConfig.reports,
+                repos=FakeConfig.repos,
+                branches=FakeConfig.branches
+            )
+        return self.reports[org_slug]
+
+    def get(self, org_slug: str, params: dict) -> dict:
+        calls["fullscans.get"] += 1
+        reports = self.org_reports(org_slug)
+        if params.get("repo") is not None:
+            reports = [report for report in reports if report["repo"] == params["repo"]]
+        if params.get("branch") is not None:
+            reports = [report for report in reports if report["branch"] == params["branch"]]
+        if params.get("direction") == "desc":
+            reports = list(reversed(reports))
+        page = params.get("page")
+        if page == 0:
+            return {"results": [], "nextPage": 0}
+        if page is None:
+            page = 1
+        per_page = int(params.get("per_page") or FakeConfig.per_page)
+        start = (page - 1) * per_page
+        results = copy.deepcopy(reports[start:start + per_page])
+        next_page = page + 1 if start + per_page < len(reports) else 0
+        return {"results": results, "nextPage": next_page}
+
+    def metadata(self, org_slug: str, full_scan_id: str) -> dict:
+        calls["fullscans.metadata"] += 1
+        for report in self.org_reports(org_slug):
+            if report["id"] == full_scan_id:
+                return copy.deepcopy(report)
+        return {}
+
+    def stream(self, org_slug: str, full_scan_id: str) -> dict:
+        calls["fullscans.stream"] += 1
+        if full_scan_id in self.streams:
+            return self.streams[full_scan_id]
+        artifacts = generate_full_scan(
+            packages=FakeConfig.packages,
+            alert_density=FakeConfig.alert_density,
+            ancestor_fanout=FakeConfig.ancestor_fanout,
+            direct_ratio=FakeConfig.direct_ratio,
+            unknown_alert_ratio=FakeConfig.unknown_alert_ratio,
+            churn=FakeConfig.churn,
+            seed=scan_seed(full_scan_id)
+        )
+        if FakeConfig.cache_streams:
+            self.streams[full_scan_id] = artifacts
+        return artifacts
+
+
+class FakeRepos:
+    def __init__(self, fullscans: FakeFullScans):
+        self.fullscans = fullscans
+
+    def get(self, org_slug: str, **params) -> dict:
+        calls["repos.get"] += 1
+        latest = {}
+        for report in self.fullscans.org_reports(org_slug):
+            latest[report["repo"]] = report
+        results = []
+        for repo_name, report in sorted(latest.items()):
+            results.append({
+                "id": report["repository_id"],
+                "name": repo_name,
+                "head_full_scan_id": report["id"],
+                "default_branch": report["branch"]
+            })
+        return {"results": results, "nextPage": None}
+
+
+class FakeSocketDev:
+    def __init__(self, token: str = None, timeout: int = None):
+        self.org = FakeOrgs()
+        self.settings = FakeSettings()
+        self.fullscans = FakeFullScans()
+        self.repos = FakeRepos(self.fullscans)
+
+    @staticmethod
+    def set_timeout(timeout: int):
+        pass
+
+
+def install() -> None:
+    """
+    Replaces the socketdev client used by socketsync.core with FakeSocketDev
+    :return:
+    """
+    import socketsync.core
+    socketsync.core.socketdev = FakeSocketDev
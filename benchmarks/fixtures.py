@@ -0,0 +1,224 @@
+"""
+Synthetic Socket data for the offline benchmarks.
+
+Everything is generated from a seed so the same arguments always produce the same full scans, which keeps benchmark
+runs comparable between commits.
+"""
+import random
+import zlib
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+
+from socketsync.issues import issue_types
+
+socket_date_format = "%Y-%m-%dT%H:%M:%S.%fZ"
+ecosystems = ["npm", "pypi", "maven", "golang"]
+severities = ["critical", "high", "middle", "low"]
+categories = ["supplyChainRisk", "vulnerability", "quality", "maintenance", "license"]
+policy_actions = ["error", "warn", "monitor", "ignore"]
+
+
+def generate_security_policy(seed: int = 0) -> dict:
+    """
+    Creates a security policy rule for every known alert type
+    :param seed: Seed for the random action of each alert type
+    :return:
+    """
+    rand = random.Random(seed)
+    return {alert_type: {"action": rand.choice(policy_actions)} for alert_type in issue_types}
+
+
+@lru_cache(maxsize=8)
+def generate_catalog(
+        packages: int,
+        alert_density: float,
+        unknown_alert_ratio: float,
+        seed: int = 0
+) -> tuple:
+    """
+    Creates the packages every synthetic scan draws from. A package id always has the same name, version and alerts,
+    like the same package@version does across real repos
+    :param packages: Number of packages in the catalog
+    :param alert_density: Average number of alerts per package
+    :param unknown_alert_ratio: Share of alerts that use an alert type missing from the alert type registry
+    :param seed: Seed for the generator
+    :return: Tuple of package data
+    """
+    rand = random.Random(seed)
+    alert_names = list(issue_types)
+    catalog = []
+    for index in range(packages):
+        package_id = f"{index:012x}"
+        alerts = []
+        alert_count = int(alert_density) + (1 if rand.random() < alert_density % 1 else 0)
+        for alert_index in range(alert_count):
+            if rand.random() < unknown_alert_ratio:
+                alert_type = f"syntheticUnknown{alert_index}"
+            else:
+                alert_type = rand.choice(alert_names)
+            alerts.append({
+                "key": f"{package_id}-{alert_type}-{alert_index}",
+                "type": alert_type,
+                "severity": rand.choice(severities),
+                "category": rand.choice(categories),
+                "props": {"note": f"synthetic alert {alert_index}"}
+            })
+        catalog.append({
+            "id": package_id,
+            "type": ecosystems[index % len(ecosystems)],
+            "name": f"synthetic-package-{index}",
+            "version": f"{rand.randint(0, 9)}.{rand.randint(0, 20)}.{rand.randint(0, 50)}",
+            "alerts": alerts,
+            "license": "MIT",
+            "size": rand.randint(1000, 500000),
+            "author": [f"author{rand.randint(0, 500)}"],
+            "score": {
+                "supplyChain": rand.random(),
+                "quality": rand.random(),
+                "maintenance": rand.random(),
+                "license": rand.random(),
+                "overall": rand.random(),
+                "vulnerability": rand.random()
+            }
+        })
+    return tuple(catalog)
+
+
+def generate_full_scan(
+        packages: int = 1000,
+        alert_density: float = 0.3,
+        ancestor_fanout: int = 3,
+        direct_ratio: float = 0.1,
+        unknown_alert_ratio: float = 0.05,
+        churn: float = 0.0,
+        seed: int = 0
+) -> dict:
+    """
+    Creates the artifacts of a full scan in the same shape as socketdev.fullscans.stream returns them
+    :param packages: Number of packages in the scan
+    :param alert_density: Average number of alerts per package
+    :param ancestor_fanout: Maximum number of top level ancestors for each transitive package
+    :param direct_ratio: Share of packages that are direct dependencies
+    :param unknown_alert_ratio: Share of alerts that use an alert type missing from the alert type registry
+    :param churn: Share of packages whose last alert is dropped in this scan, used to simulate changes between scans
+    :param seed: Seed for the dependency graph and churn of this scan
+    :return: Dict of package id to package data
+    """
+    rand = random.Random(seed)
+    catalog = generate_catalog(packages, alert_density, unknown_alert_ratio)
+    direct_count = max(1, int(packages * direct_ratio))
+    direct_ids = [package["id"] for package in catalog[:direct_count]]
+    artifacts = {}
+    for index, package in enumerate(catalog):
+        artifact = dict(package)
+        artifact["alerts"] = list(package["alerts"])
+        if churn > 0 and artifact["alerts"] and rand.random() < churn:
+            artifact["alerts"].pop()
+        artifact["direct"] = index < direct_count
+        if artifact["direct"]:
+            artifact["manifestFiles"] = [{"file": "package.json"}, {"file": "package-lock.json"}]
+            artifact["topLevelAncestors"] = []
+        else:
+            fanout = rand.randint(1, min(ancestor_fanout, len(direct_ids)))
+            artifact["manifestFiles"] = []
+            artifact["topLevelAncestors"] = rand.sample(direct_ids, fanout)
+        artifacts[artifact["id"]] = artifact
+    return artifacts
+
+
+def generate_reports(
+        org_slug: str = "synthetic-org",
+        count: int = 10,
+        repos: int = 5,
+        branches: list = None,
+        start: datetime = None
+) -> list:
+    """
+    Creates full scan metadata in the same shape as the results of socketdev.fullscans.get
+    :param org_slug: Org the reports belong to
+    :param count: Number of reports
+    :param repos: Number of distinct repos to spread the reports over
+    :param branches: Branch names to spread the reports over
+    :param start: Creation time of the oldest report
+    :return:
+    """
+    if branches is None:
+        branches = ["main"]
+    if start is None:
+        start = datetime.now(timezone.utc) - timedelta(hours=1)
+    reports = []
+    for index in range(count):
+        created_at = (start + timedelta(seconds=index)).strftime(socket_date_format)
+        reports.append({
+            "id": f"{org_slug}-scan-{index:06d}",
+            "created_at": created_at,
+            "updated_at": created_at,
+            "organization_id": f"{org_slug}-id",
+            "organization_slug": org_slug,
+            "repository_id": f"repo-id-{index % repos}",
+            "repo": f"repo-{index % repos}",
+            "branch": branches[index % len(branches)],
+            "commit_hash": f"{index:040x}",
+            "commit_message": "synthetic commit",
+            "committers": ["synthetic"],
+            "pull_request": 0,
+            "html_report_url": f"https://socket.dev/dashboard/org/{org_slug}/sbom/{index}"
+        })
+    return reports
+
+
+def scan_seed(scan_id: str) -> int:
+    """
+    Stable seed for a scan id so the same scan always streams the same packages
+    :param scan_id:
+    :return:
+    """
+    return zlib.crc32(scan_id.encode())
+
+
+def generate_issues(count: int = 1000, seed: int = 0) -> list:
+    """
+    Creates IssueRecords shaped like the output of Core.get_issues for the connector benchmarks
+    :param count: Number of issues
+    :param seed: Seed for the generator
+    :return:
+    """
+    from socketsync.classes import IssueRecord
+
+    rand = random.Random(seed)
+    alert_names = list(issue_types)
+    created_at = datetime.now(timezone.utc).strftime(socket_date_format)
+    issues = []
+    for index in range(count):
+        alert_type = rand.choice(alert_names)
+        metadata = issue_types[alert_type]
+        action = rand.choice(policy_actions)
+        issue = IssueRecord(
+            owner="synthetic-org",
+            repo=f"repo-{index % 20}",
+            branch="main",
+            report_id=f"synthetic-org-scan-{index // 100:06d}",
+            pr="0",
+            commit=f"{index // 100:040x}",
+            created_at=created_at,
+            pkg_type=ecosystems[index % len(ecosystems)],
+            pkg_name=f"synthetic-package-{index % 500}",
+            pkg_version="1.0.0",
+            pkg_id=f"{index % 500:012x}",
+            type=alert_type,
+            severity=rand.choice(severities),
+            category=rand.choice(categories),
+            key=f"synthetic-{index}",
+            props={"note": f"synthetic alert {index}"},
+            description=metadata.get("description", ""),
+            title=metadata.get("title"),
+            suggestion=metadata.get("suggestion", ""),
+            next_step_title=metadata.get("nextStepTitle", ""),
+            introduced_by=[("direct", "package.json")],
+            is_error=action == "error",
+            direct=True
+        )
+        setattr(issue, action, True)
+        issue.action = action
+        issues.append(issue)
+    return issues
@@ -0,0 +1,82 @@
+"""
+Import time benchmark for the connector registry.
+
+Resolves a connector in a fresh interpreter several times and reports the best wall time and peak RSS. Connectors only
+import their SDK when they are constructed, so the run fails if any of the optional SDKs were imported while resolving
+or if the best time is above the budget. This guards startup time before a release.
+
+Usage:
+    python benchmarks/import_time.py --connector csv --budget 0.5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+heavy_modules = [
+    "google.cloud.bigquery",
+    "elasticsearch",
+    "slack_sdk",
+    "pyarrow",
+    "confluent_kafka",
+]
+
+child_script = """
+import json
+import resource
+import sys
+import time
+start = time.perf_counter()
+from socketsync.connectors import get_connector
+get_connector({connector!r})
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy_modules!r} if name in sys.modules]
+print(json.dumps({{
+    "seconds": elapsed,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "heavy_modules": heavy
+}}))
+"""
+
+
+def run_once(connector: str) -> dict:
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [repo_root, env.get("PYTHONPATH")]))
+    script = child_script.format(connector=connector, heavy_modules=heavy_modules)
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env
+    )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure connector registry import time")
+    parser.add_argument("--connector", default="csv", help="Connector to resolve")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters to measure")
+    parser.add_argument("--budget", type=float, default=0.5, help="Maximum allowed seconds for the best run")
+    args = parser.parse_args()
+
+    results = [run_once(args.connector) for _ in range(args.runs)]
+    best = min(result["seconds"] for result in results)
+    max_rss = max(result["max_rss_kb"] for result in results)
+    heavy = sorted({name for result in results for name in result["heavy_modules"]})
+    print(f"connector={args.connector} runs={args.runs} best={best:.3f}s peak_rss={max_rss / 1024:.1f}MB")
+
+    failed = False
+    if heavy:
+        print(f"FAIL: optional SDKs imported while resolving {args.connector}: {', '.join(heavy)}")
+        failed = True
+    if best > args.budget:
+        print(f"FAIL: best import time {best:.3f}s is above the budget of {args.budget:.3f}s")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
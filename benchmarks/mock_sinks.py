@@ -0,0 +1,314 @@
+"""
+Local stand-in for the ingestion APIs of the HTTP connectors.
+
+MockSinkServer accepts the requests the Sentinel, Sumologic, Panther, Webhook, Slack, Splunk and OTLP connectors send
+and counts the events that were delivered. Latency, 429 throttling and payload size limits can be injected so
+connector throughput can be measured without any SaaS endpoint.
+
+Routes:
+    POST /api/logs              Microsoft Sentinel Data Collector API
+    POST /receiver/v1/http/*    Sumo Logic HTTP source
+    POST /panther/*             Panther HTTP log source
+    POST /webhook/*             Generic Webhook
+    POST /slack/*               Slack incoming webhook
+    POST /services/collector/*  Splunk HTTP Event Collector, gzip bodies and indexer acknowledgement included
+    POST /v1/logs               OTLP/HTTP logs, protobuf or JSON encoded
+    GET  /_stats                Counters for every sink as JSON
+
+Usage:
+    python benchmarks/mock_sinks.py --port 8080 --latency 0.02 --throttle-ratio 0.01 --max-payload-bytes 1048576
+"""
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+routes = [
+    ("/api/logs", "sentinel"),
+    ("/receiver/v1/http", "sumologic"),
+    ("/panther", "panther"),
+    ("/webhook", "webhook"),
+    ("/slack", "slack"),
+    ("/services/collector/ack", "splunk_ack"),
+    ("/services/collector", "splunk"),
+    ("/v1/logs", "otlp"),
+]
+
+
+class TokenBucket:
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+def read_varint(data: bytes, position: int) -> tuple:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return value, position
+
+
+def read_messages(data: bytes, field: int) -> list:
+    """
+    Returns the embedded messages of a field of a protobuf message, skipping the other fields
+    :param data: Encoded message
+    :param field: Field number of the embedded messages
+    :return:
+    """
+    messages = []
+    position = 0
+    while position < len(data):
+        tag, position = read_varint(data, position)
+        wire_type = tag & 7
+        if wire_type == 0:
+            _, position = read_varint(data, position)
+        elif wire_type == 1:
+            position += 8
+        elif wire_type == 5:
+            position += 4
+        else:
+            length, position = read_varint(data, position)
+            if tag >> 3 == field:
+                messages.append(data[position:position + length])
+            position += length
+    return messages
+
+
+def count_otlp_records(content_type: str, body: bytes) -> int:
+    if content_type.startswith("application/json"):
+        request = json.loads(body)
+        return sum(
+            len(scope_logs.get("logRecords", []))
+            for resource_logs in request.get("resourceLogs", [])
+            for scope_logs in resource_logs.get("scopeLogs", [])
+        )
+    return sum(
+        len(read_messages(scope_logs, 2))
+        for resource_logs in read_messages(body, 1)
+        for scope_logs in read_messages(resource_logs, 2)
+    )
+
+
+def count_events(sink: str, content_type: str, body: bytes) -> int:
+    """
+    Counts the events in a request body the way the matching sink would split them
+    :param sink: Name of the sink the request was sent to
+    :param content_type: Content-Type header of the request
+    :param body: Raw request body
+    :return:
+    """
+    if sink == "otlp":
+        return count_otlp_records(content_type, body)
+    if sink == "sumologic" or content_type.startswith("multipart/"):
+        return sum(1 for line in body.splitlines() if line.startswith(b"{"))
+    text = body.strip()
+    if not text:
+        return 0
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return sum(1 for line in text.splitlines() if line.strip())
+    if isinstance(data, list):
+        return len(data)
+    return 1
+
+
+class MockSinkServer:
+    def __init__(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            latency: float = 0.0,
+            jitter: float = 0.0,
+            throttle_ratio: float = 0.0,
+            rate_limit: float = None,
+            max_payload_bytes: int = None,
+            retry_after: int = 1
+    ):
+        """
+        Local HTTP server emulating the sink ingestion APIs
+
+        :param host: Address to listen on
+        :param port: Port to listen on, 0 picks a free port
+        :param latency: Seconds to wait before answering each request
+        :param jitter: Maximum random seconds added to the latency
+        :param throttle_ratio: Share of requests answered with 429
+        :param rate_limit: Requests per second allowed for each sink before answering with 429
+        :param max_payload_bytes: Requests with a larger body are answered with 413
+        :param retry_after: Value of the Retry-After header on 429 responses
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_ratio = throttle_ratio
+        self.rate_limit = rate_limit
+        self.max_payload_bytes = max_payload_bytes
+        self.retry_after = retry_after
+        self.buckets = {}
+        self.ack_ids = 0
+        self.stats = defaultdict(lambda: defaultdict(int))
+        self.lock = threading.Lock()
+        self.thread = None
+        self.httpd = ThreadingHTTPServer((host, port), self.create_handler())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockSinkServer":
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def record(self, sink: str, **counters) -> None:
+        with self.lock:
+            for name, value in counters.items():
+                self.stats[sink][name] += value
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {sink: dict(counters) for sink, counters in self.stats.items()}
+
+    def reset(self) -> None:
+        with self.lock:
+            self.stats.clear()
+
+    def throttled(self, sink: str) -> bool:
+        if self.throttle_ratio > 0 and random.random() < self.throttle_ratio:
+            return True
+        if self.rate_limit is not None:
+            with self.lock:
+                if sink not in self.buckets:
+                    self.buckets[sink] = TokenBucket(self.rate_limit)
+                bucket = self.buckets[sink]
+            return not bucket.take()
+        return False
+
+    def create_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def respond(self, status: int, body: bytes = b"", headers: dict = None) -> None:
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def find_sink(self) -> str:
+                path = self.path.split("?", 1)[0]
+                for prefix, sink in routes:
+                    if path.startswith(prefix):
+                        return sink
+                return None
+
+            def do_GET(self):
+                if self.path.split("?", 1)[0] == "/_stats":
+                    self.respond(200, json.dumps(server.get_stats()).encode(), {"Content-Type": "application/json"})
+                else:
+                    self.respond(404)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                sink = self.find_sink()
+                if sink is None:
+                    self.respond(404)
+                    return
+                if sink == "splunk_ack":
+                    acks = json.loads(body or b"{}").get("acks", [])
+                    response = {"acks": {str(ack_id): True for ack_id in acks}}
+                    self.respond(200, json.dumps(response).encode(), {"Content-Type": "application/json"})
+                    return
+                server.record(sink, requests=1, bytes=len(body))
+                delay = server.latency
+                if server.jitter > 0:
+                    delay += random.uniform(0, server.jitter)
+                if delay > 0:
+                    time.sleep(delay)
+                if server.max_payload_bytes is not None and len(body) > server.max_payload_bytes:
+                    server.record(sink, rejected_too_large=1)
+                    self.respond(413, b"Payload Too Large")
+                    return
+                if server.throttled(sink):
+                    server.record(sink, throttled=1)
+                    self.respond(429, b"Too Many Requests", {"Retry-After": str(server.retry_after)})
+                    return
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                events = count_events(sink, self.headers.get("Content-Type") or "", body)
+                server.record(sink, events=events)
+                if sink == "slack":
+                    self.respond(200, b"ok", {"Content-Type": "text/plain"})
+                elif sink == "splunk":
+                    with server.lock:
+                        server.ack_ids += 1
+                        ack_id = server.ack_ids
+                    response = {"text": "Success", "code": 0, "ackId": ack_id}
+                    self.respond(200, json.dumps(response).encode(), {"Content-Type": "application/json"})
+                else:
+                    self.respond(200, b'{"success": true}', {"Content-Type": "application/json"})
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the mock sink server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait before each response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Maximum random extra latency in seconds")
+    parser.add_argument("--throttle-ratio", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--rate-limit", type=float, help="Requests per second per sink before answering with 429")
+    parser.add_argument("--max-payload-bytes", type=int, help="Reject larger bodies with 413")
+    args = parser.parse_args()
+    server = MockSinkServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        throttle_ratio=args.throttle_ratio,
+        rate_limit=args.rate_limit,
+        max_payload_bytes=args.max_payload_bytes
+    )
+    print(f"Mock sinks listening on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ if [ -z $ENABLE_PYPI_BUILD ]; then
   exit
 fi
 
+python scripts/generate_licenses.py || exit 1
+
 if [ "$ENABLE_PYPI_BUILD" = "pypi-prod=enable" ]; then
   echo "Doing production build of version $VERSION"
   python -m build --wheel --sdist
@@ -0,0 +1,109 @@
+"""
+Generates socketsync/licenses.bin from the SPDX license list.
+
+Downloads the license list and the text of every license from the pinned release of the spdx/license-list-data
+repository, or reads them from a local checkout of it, and writes them with socketsync.licenses.write_table. Run it
+before building a release.
+
+The downloaded data is checked against the sha256 in scripts/licenses.sha256, once it is recorded, so that every build
+ships the same texts. After changing spdx_version run it once with --update-checksum to record the checksum of the new
+release. The release workflows run it before building the package.
+
+Usage:
+    python scripts/generate_licenses.py
+    python scripts/generate_licenses.py --source ../license-list-data --output socketsync/licenses.bin
+    python scripts/generate_licenses.py --update-checksum
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from socketsync.licenses import default_table_file, write_table  # noqa: E402
+
+spdx_version = "3.25.0"
+spdx_url = f"https://raw.githubusercontent.com/spdx/license-list-data/v{spdx_version}/json"
+checksum_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "licenses.sha256")
+
+
+def load_data(session: requests.Session, source: str, path: str) -> bytes:
+    if source is not None:
+        with open(os.path.join(source, "json", path), "rb") as file:
+            return file.read()
+    response = session.get(f"{spdx_url}/{path}", timeout=30)
+    response.raise_for_status()
+    return response.content
+
+
+def read_checksum() -> tuple:
+    """
+    Reads the recorded checksum
+    :return: (sha256, SPDX version) or (None, None) if it was not recorded
+    """
+    if not os.path.exists(checksum_file):
+        return None, None
+    with open(checksum_file, "r") as file:
+        checksum, version = file.read().split()
+    return checksum, version
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate the SPDX license table")
+    parser.add_argument("--source", help="Local checkout of spdx/license-list-data instead of downloading it")
+    parser.add_argument("--output", default=default_table_file, help="Path of the license table")
+    parser.add_argument("--workers", type=int, default=8, help="Parallel downloads")
+    parser.add_argument(
+        "--update-checksum",
+        action="store_true",
+        help=f"Record the checksum of the SPDX data in {checksum_file} instead of checking it"
+    )
+    args = parser.parse_args()
+
+    session = requests.Session()
+    list_data = load_data(session, args.source, "licenses.json")
+    license_list = json.loads(list_data)
+    if license_list.get("licenseListVersion") != spdx_version:
+        print(f"Expected SPDX license list {spdx_version}, got {license_list.get('licenseListVersion')}")
+        return 1
+
+    def load_license(entry: dict) -> tuple:
+        return entry, load_data(session, args.source, f"details/{entry['licenseId']}.json")
+
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        details = list(executor.map(load_license, license_list["licenses"]))
+
+    # Hashed in the order of the license list, which the downloads keep
+    digest = hashlib.sha256(list_data)
+    licenses = []
+    for entry, data in details:
+        digest.update(data)
+        licenses.append((entry["licenseId"], entry["name"], json.loads(data).get("licenseText", "")))
+    checksum = digest.hexdigest()
+
+    if args.update_checksum:
+        with open(checksum_file, "w") as file:
+            file.write(f"{checksum}  {spdx_version}\n")
+        print(f"Recorded checksum {checksum} of SPDX license list {spdx_version}")
+    else:
+        recorded = read_checksum()
+        if recorded == (None, None):
+            print(f"No checksum recorded in {checksum_file} for SPDX license list {spdx_version}, got {checksum}")
+            print("Record it with --update-checksum so later builds are checked against it")
+        elif recorded != (checksum, spdx_version):
+            print(f"Checksum {checksum} of SPDX license list {spdx_version} does not match {checksum_file}")
+            print("Run with --update-checksum after changing spdx_version")
+            return 1
+
+    write_table(licenses, args.output, spdx_version)
+    print(f"Wrote {len(licenses)} licenses to {args.output} ({os.path.getsize(args.output)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
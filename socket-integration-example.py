@@ -1,14 +1,7 @@
 import json
 import os
 from socketsync.core import Core
-from socketsync.connectors.elastic import Elastic
-from socketsync.connectors.bigquery import BigQuery
-from socketsync.connectors.panther import Panther
-from socketsync.connectors.csv import CSV
-from socketsync.connectors.webhook import Webhook
-from socketsync.connectors.slack import Slack
-from socketsync.connectors.sumologic import Sumologic
-from socketsync.connectors.sentinel import Sentinel
+from socketsync.connectors import get_connector
 
 from datetime import datetime, timezone
 start_time = datetime.strptime("2025-02-20 10:00", "%Y-%m-%d %H:%M").replace(tzinfo=timezone.utc)
@@ -34,6 +27,7 @@ if __name__ == '__main__':
 
     # CSV Example
     csv_file = "example.csv"
+    CSV = get_connector("csv")
     csv = CSV(
         file=csv_file
     )
@@ -43,10 +37,12 @@ if __name__ == '__main__':
     if not ms_sentinel_workspace_id or not ms_sentinel_shared_key:
         print("MS_SENTINEL_WORKSPACE_ID and MS_SENTINEL_SHARED_KEY must be set.")
         exit(1)
+    Sentinel = get_connector("sentinel")
     sentinel = Sentinel(ms_sentinel_workspace_id, ms_sentinel_shared_key)
     sentinel.send_events(issue_data, "SocketSiemConnector")
     # Sumologic Example
     sumo_logic_http_source_url = os.getenv("SUMO_LOGIC_HTTP_SOURCE_URL", None)
+    Sumologic = get_connector("sumologic")
     sumo = Sumologic(sumo_logic_http_source_url)
     sumo_status = sumo.send_events(issue_data, "socket-siem-connector")
     print(f"Sumologic Result: {sumo_status}")
@@ -55,6 +51,7 @@ if __name__ == '__main__':
     elastic_token = os.getenv('ELASTIC_TOKEN') or exit(1)
     elastic_cloud_id = os.getenv('ELASTIC_CLOUD_ID') or exit(1)
     elastic_index = os.getenv('ELASTIC_ID') or exit(1)
+    Elastic = get_connector("elastic")
     es = Elastic(
         api_key=elastic_token,
         cloud_id=elastic_cloud_id
@@ -64,12 +61,14 @@ if __name__ == '__main__':
 
     # Big Query Example
     bigquery_table = os.getenv('GOOGLE_TABLE') or exit(1)
+    BigQuery = get_connector("bigquery")
     bigquery = BigQuery(bigquery_table)
     errors = bigquery.add_dataset(issue_data, streaming=True)
 
     # Panther SIEM Integration
     panther_url = os.getenv('PANTHER_URL') or exit(1)
     panther_token = os.getenv('PANTHER_TOKEN') or exit(1)
+    Panther = get_connector("panther")
     panther = Panther(
         token=panther_token,
         url=panther_url
@@ -84,12 +83,14 @@ if __name__ == '__main__':
     webhook_auth_headers = os.getenv("WEBHOOK_AUTH_HEADERS") or {
         'Authorization': 'Bearer EXAMPLE'
     }
+    Webhook = get_connector("webhook")
     webhook = Webhook(webhook_url)
     for issue in issue_data:
         issue_json = json.loads(str(issue))
         webhook.send(issue_json)
 
     slack_url = os.getenv("SLACK_WEBHOOK_URL") or exit(1)
+    Slack = get_connector("slack")
     slack = Slack(slack_url)
     for issue in issue_data:
         issue_json = json.loads(str(issue))
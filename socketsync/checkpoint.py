@@ -0,0 +1,81 @@
+import json
+import os
+import threading
+from socketsync import log
+
+
+__all__ = ["Checkpoint"]
+
+
+class Checkpoint:
+    file: str
+    orgs: dict
+
+    def __init__(self, file: str):
+        """
+        Tracks the timestamp of the last successful sync for each Org in a JSON file so that the next run resumes
+        where the previous one stopped. A sync is staged with stage and only saved once commit is called after its
+        issues were delivered.
+
+        :param file: Path of the JSON checkpoint file. Created on the first save if it does not exist
+        """
+        self.file = file
+        self.orgs = {}
+        self.pending = {}
+        self.lock = threading.Lock()
+        if os.path.exists(self.file):
+            try:
+                with open(self.file, "r") as checkpoint_file:
+                    self.orgs = json.load(checkpoint_file)
+            except (OSError, ValueError) as error:
+                log.error(f"Unable to load checkpoint file {self.file}, starting without checkpoints")
+                log.error(error)
+
+    def get(self, org_slug: str, default: int = None) -> int:
+        """
+        Gets the last successful sync timestamp for an Org
+        :param org_slug: Org Slug to look up
+        :param default: Value to return if the Org has not been synced before
+        :return:
+        """
+        with self.lock:
+            return self.orgs.get(org_slug, default)
+
+    def stage(self, org_slug: str, timestamp: int) -> None:
+        """
+        Records a sync for an Org without saving it, commit advances the checkpoint once the issues were delivered
+        :param org_slug: Org Slug that was synced
+        :param timestamp: Unix timestamp the sync started at
+        :return:
+        """
+        with self.lock:
+            self.pending[org_slug] = int(timestamp)
+
+    def commit(self) -> None:
+        """
+        Advances the checkpoints of the staged syncs and saves the checkpoint file
+        :return:
+        """
+        with self.lock:
+            pending = self.pending
+            self.pending = {}
+        for org_slug, timestamp in pending.items():
+            self.set(org_slug, timestamp)
+
+    def set(self, org_slug: str, timestamp: int) -> None:
+        """
+        Records a successful sync for an Org and saves the checkpoint file. The file is written to a temporary path and
+        renamed so that a crash mid-write does not corrupt the existing checkpoints.
+        :param org_slug: Org Slug that was synced
+        :param timestamp: Unix timestamp the sync started at
+        :return:
+        """
+        with self.lock:
+            self.orgs[org_slug] = int(timestamp)
+            tmp_file = f"{self.file}.tmp"
+            with open(tmp_file, "w") as checkpoint_file:
+                json.dump(self.orgs, checkpoint_file)
+            os.replace(tmp_file, self.file)
+
+    def __str__(self):
+        return json.dumps(self.orgs)
@@ -143,11 +143,38 @@ class Package:
         self.error_alerts = []
         if not hasattr(self, "license"):
             self.license = "NoLicenseFound"
-        if not hasattr(self, "license_text"):
+        if "_license_text" not in self.__dict__:
             self.license_text = ""
 
+    @property
+    def license_text(self) -> str:
+        """
+        Text of the license. A license set with set_license is only decompressed from the license table when the text
+        is first read
+        """
+        if self._license_text is None:
+            license_obj = self.__dict__.pop("_license")
+            self._license_text = license_obj.licenseText
+        return self._license_text
+
+    @license_text.setter
+    def license_text(self, text: str) -> None:
+        self.__dict__.pop("_license", None)
+        self._license_text = text
+
+    def set_license(self, license_obj) -> None:
+        """
+        Sets the license from the license table without reading its text
+        :param license_obj: License - SPDX license from socketsync.licenses
+        :return:
+        """
+        self._license = license_obj
+        self._license_text = None
+
     def __str__(self):
-        return json.dumps(self.__dict__)
+        values = {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
+        values["license_text"] = self.license_text
+        return json.dumps(values)
 
 
 class Issue:
@@ -239,6 +266,35 @@ class IssueRecord(Issue):
         self.report_id = report_id
         super().__init__(**kwargs)
 
+    @classmethod
+    def from_template(
+            cls,
+            report_fields: dict,
+            template: tuple,
+            introduced_by: list,
+            is_error: bool,
+            direct: bool
+    ) -> "IssueRecord":
+        """
+        Creates an IssueRecord without going through __init__, with the same attributes in the same order
+        :param report_fields: dict - owner, pr, commit, created_at, repo, branch and report_id of the report, with
+            created_at already cleaned up
+        :param template: tuple - (package and alert fields from pkg_type to next_step_title, defaults and pkg_url)
+        :param introduced_by: list - Source data of the package in the report
+        :param is_error: bool - Whether the alert is an error in the security policy
+        :param direct: bool - Whether the package is a direct dependency
+        :return:
+        """
+        issue = cls.__new__(cls)
+        values = issue.__dict__
+        values.update(report_fields)
+        values.update(template[0])
+        values["introduced_by"] = introduced_by
+        values["is_error"] = is_error
+        values["direct"] = direct
+        values.update(template[1])
+        return issue
+
 
 class YamlFile:
     path: str
@@ -365,6 +421,7 @@ class Diff:
     new_capabilities: dict
     removed_packages: list
     new_alerts: list
+    removed_alerts: list
     id: str
     sbom: str
     packages: dict
@@ -379,6 +436,8 @@ class Diff:
             self.removed_packages = []
         if not hasattr(self, "new_alerts"):
             self.new_alerts = []
+        if not hasattr(self, "removed_alerts"):
+            self.removed_alerts = []
         if not hasattr(self, "new_capabilities"):
             self.new_capabilities = {}
 
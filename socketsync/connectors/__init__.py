@@ -1 +1,91 @@
+import importlib
+
+
 __author__ = 'socket.dev'
+__all__ = ["connectors", "get_connector", "register_connector", "create_session"]
+
+# Connector name -> (module, class). Modules are only imported when the connector is first requested so that the
+# optional SDKs (google-cloud-bigquery, elasticsearch, slack-sdk, pyarrow, confluent-kafka) are never loaded by
+# processes that don't use them.
+connectors = {
+    "bigquery": ("socketsync.connectors.bigquery", "BigQuery"),
+    "csv": ("socketsync.connectors.csv", "CSV"),
+    "elastic": ("socketsync.connectors.elastic", "Elastic"),
+    "kafka": ("socketsync.connectors.kafka", "Kafka"),
+    "ndjson": ("socketsync.connectors.ndjson", "NDJSON"),
+    "otlp": ("socketsync.connectors.otlp", "OTLP"),
+    "panther": ("socketsync.connectors.panther", "Panther"),
+    "parquet": ("socketsync.connectors.parquet", "Parquet"),
+    "sentinel": ("socketsync.connectors.sentinel", "Sentinel"),
+    "slack": ("socketsync.connectors.slack", "Slack"),
+    "splunk": ("socketsync.connectors.splunk", "Splunk"),
+    "sqlite": ("socketsync.connectors.sqlite", "SQLite"),
+    "sumologic": ("socketsync.connectors.sumologic", "Sumologic"),
+    "syslog": ("socketsync.connectors.syslog", "Syslog"),
+    "webhook": ("socketsync.connectors.webhook", "Webhook"),
+}
+loaded_connectors = {}
+default_status_forcelist = (429, 500, 502, 503, 504)
+
+
+def get_connector(name: str):
+    """
+    Resolves a connector class by name, importing the connector module and its backing SDK on first use
+    :param name: str - Name of the connector, I.E. csv, panther, bigquery
+    :return: The connector class
+    """
+    name = name.lower()
+    connector = loaded_connectors.get(name)
+    if connector is None:
+        if name not in connectors:
+            available = ", ".join(sorted(connectors))
+            raise ValueError(f"Unknown connector {name}. Available connectors: {available}")
+        module_name, class_name = connectors[name]
+        module = importlib.import_module(module_name)
+        connector = getattr(module, class_name)
+        loaded_connectors[name] = connector
+    return connector
+
+
+def register_connector(name: str, module_name: str, class_name: str) -> None:
+    """
+    Registers an additional connector that can be resolved with get_connector
+    :param name: str - Name to resolve the connector by
+    :param module_name: str - Module that contains the connector class
+    :param class_name: str - Name of the connector class in the module
+    :return:
+    """
+    name = name.lower()
+    connectors[name] = (module_name, class_name)
+    loaded_connectors.pop(name, None)
+
+
+def create_session(retries: int, pool_size: int, status_forcelist: tuple = default_status_forcelist):
+    """
+    Creates the pooled requests Session used by the HTTP connectors. Requests answered with one of status_forcelist
+    are retried with backoff, honouring Retry-After. POST requests are retried too, so a request that reached the sink
+    before it failed, I.E. a 502 from a proxy or a 503 after the events were indexed, can deliver its events twice.
+    Use retries=0 where duplicates are worse than a failed send.
+    :param retries: int - Number of retries of a request
+    :param pool_size: int - Number of pooled connections per host
+    :param status_forcelist: tuple - Response status codes that are retried
+    :return: requests.Session
+    """
+    # Imported here so that resolving connectors that don't use HTTP does not load requests
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=status_forcelist,
+        allowed_methods=None,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
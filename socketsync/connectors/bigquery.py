@@ -1,12 +1,17 @@
 import json
-from google.cloud import bigquery
+from typing import TYPE_CHECKING
+from socketsync import metrics
+
+if TYPE_CHECKING:
+    from google.cloud import bigquery
 
 
 class BigQuery:
-    client: bigquery.Client
+    client: "bigquery.Client"
     table: str
 
     def __init__(self, table: str):
+        from google.cloud import bigquery
         try:
             self.client = bigquery.Client()
         except EnvironmentError:
@@ -29,7 +34,9 @@ class BigQuery:
             issue_json = json.loads(str(issue))
             table_rows.append(issue_json)
         try:
-            errors = self.client.insert_rows_json(self.table, table_rows)
+            with metrics.sink_send("bigquery", len(table_rows)) as send_status:
+                errors = self.client.insert_rows_json(self.table, table_rows)
+                send_status["failed"] = len(errors) > 0
             return errors
         except Exception as error:
             print(error)
@@ -59,7 +66,8 @@ class BigQuery:
             query += f"({value_str}),"
         query = query.rstrip(",")
         try:
-            results = self.client.query(query)
+            with metrics.sink_send("bigquery", len(values)):
+                results = self.client.query(query)
             return results
         except Exception as error:
             print(error)
@@ -1,35 +1,148 @@
-import json
 import csv
+import gzip
+import io
+import os
+from itertools import islice
+from operator import attrgetter
+from typing import Iterable
 from socketsync.classes import IssueRecord
 from socketsync import columns as default_columns
+from socketsync import metrics
 
 
 class CSV:
     file: str
     columns: list
+    compression: str
+    max_rows: int
+    max_bytes: int
+    chunk_rows: int
 
-    def __init__(self, file: str, columns: list = None):
+    def __init__(
+            self,
+            file: str,
+            columns: list = None,
+            compression: str = None,
+            max_rows: int = None,
+            max_bytes: int = None,
+            chunk_rows: int = 1000
+    ):
+        """
+        Writes the issues to CSV files
+
+        :param file: Path of the CSV file. With rotation the segments are named after it, I.E. example-00001.csv
+        :param columns: Issue attributes to write, defaults to socketsync.columns
+        :param compression: gzip or zstd, defaults to gzip for .gz files and zstd for .zst files
+        :param max_rows: Start a new file after this many rows
+        :param max_bytes: Start a new file once this many bytes of uncompressed CSV were written
+        :param chunk_rows: Number of rows formatted and written at a time
+        """
         self.file = file
         self.columns = columns
         if self.columns is None:
             self.columns = default_columns
+        self.compression = compression
+        if self.compression is None:
+            if self.file.endswith(".gz"):
+                self.compression = "gzip"
+            elif self.file.endswith(".zst"):
+                self.compression = "zstd"
+        for name, value in (("max_rows", max_rows), ("max_bytes", max_bytes)):
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be a positive number, got {value}")
+        if chunk_rows is None or chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be a positive number, got {chunk_rows}")
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.chunk_rows = chunk_rows
+        self.get_row = None
+        if self.columns:
+            self.get_row = attrgetter(*self.columns)
+        self.files = []
+
+    def write_csv(self, data: Iterable) -> list:
+        return self.write_stream(data)
+
+    def write_stream(self, data: Iterable) -> list:
+        """
+        Writes issues from a list or any iterator without loading them all into memory
+        :param data: Iterable of IssueRecords
+        :return: Paths of the files that were written
+        """
+        self.files = []
+        rotate = self.max_rows is not None or self.max_bytes is not None
+        issues = iter(data)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        create_row = self.create_row
+        pending = next(issues, None)
+        segment = 0
+        while True:
+            segment += 1
+            file_name = self.segment_name(segment) if rotate else self.file
+            rows = 0
+            size = 0
+            with self.open_stream(file_name) as stream:
+                self.files.append(file_name)
+                if self.columns is not None:
+                    writer.writerow(self.columns)
+                while pending is not None:
+                    chunk_size = self.chunk_rows
+                    if self.max_rows is not None:
+                        chunk_size = min(chunk_size, self.max_rows - rows)
+                    chunk = [pending]
+                    chunk.extend(islice(issues, chunk_size - 1))
+                    pending = next(issues, None)
+                    with metrics.sink_send("csv", len(chunk)):
+                        writer.writerows(map(create_row, chunk))
+                        size += self.flush(buffer, stream)
+                    rows += len(chunk)
+                    if self.max_rows is not None and rows >= self.max_rows:
+                        break
+                    if self.max_bytes is not None and size >= self.max_bytes:
+                        break
+                size += self.flush(buffer, stream)
+            if pending is None:
+                break
+        return self.files
+
+    @staticmethod
+    def flush(buffer: io.StringIO, stream) -> int:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        if data:
+            stream.write(data)
+        return len(data)
+
+    def segment_name(self, segment: int) -> str:
+        base, extension = self.file, ""
+        for suffix in (".gz", ".zst"):
+            if base.endswith(suffix):
+                base, extension = base[:-len(suffix)], suffix
+        base, csv_extension = os.path.splitext(base)
+        return f"{base}-{segment:05d}{csv_extension}{extension}"
 
-    def write_csv(self, data: list):
-        with open(self.file, 'w', newline='') as file:
-            writer = csv.writer(file)
-            if self.columns is not None:
-                writer.writerow(self.columns)
-            for issue in data:
-                writer.writerow(self.create_row(issue))
+    def open_stream(self, file_name: str):
+        if self.compression == "gzip":
+            return gzip.open(file_name, "wb")
+        if self.compression == "zstd":
+            try:
+                from compression import zstd
+                return zstd.open(file_name, "wb")
+            except ImportError:
+                import zstandard
+                return zstandard.open(file_name, "wb")
+        if self.compression is not None:
+            raise ValueError(f"Unsupported compression {self.compression}, use gzip or zstd")
+        return open(file_name, "wb", buffering=1024 * 1024)
 
     def create_row(self, issue: IssueRecord) -> tuple:
-        row = ()
+        if self.get_row is not None:
+            row = self.get_row(issue)
+            if len(self.columns) == 1:
+                return (row,)
+            return row
         if self.columns is not None:
-            for column in self.columns:
-                value = getattr(issue, column)
-                row += (value,)
-        else:
-            data = json.loads(str(issue))
-            for value in data:
-                row += (value,)
-        return row
+            return ()
+        return tuple(issue.__dict__.values())
@@ -1,7 +1,11 @@
 import json
-from elasticsearch import Elasticsearch
+from typing import TYPE_CHECKING
+from socketsync import metrics
 from socketsync.classes import IssueRecord
 
+if TYPE_CHECKING:
+    from elasticsearch import Elasticsearch
+
 
 class Elastic:
     def __init__(self, **kwargs):
@@ -13,14 +17,16 @@ class Elastic:
     def __str__(self):
         return json.dumps(self.__dict__)
 
-    def load_client(self) -> Elasticsearch:
+    def load_client(self) -> "Elasticsearch":
+        from elasticsearch import Elasticsearch
         es = Elasticsearch(**self.__dict__)
         return es
 
     def add_document(self, issue: IssueRecord, index: str):
         issue_json = json.loads(str(issue))
-        self.es.index(
-            index=index,
-            id=issue.id,
-            document=issue_json
-        )
+        with metrics.sink_send("elastic"):
+            self.es.index(
+                index=index,
+                id=issue.id,
+                document=issue_json
+            )
@@ -0,0 +1,125 @@
+import json
+from typing import TYPE_CHECKING, Iterable
+from socketsync import log, metrics
+from socketsync.classes import IssueRecord
+
+if TYPE_CHECKING:
+    import confluent_kafka
+
+
+class Kafka:
+    bootstrap_servers: str
+    topic: str
+    key_fields: list
+    linger_ms: int
+    batch_bytes: int
+    compression: str
+    flush_timeout: float
+
+    def __init__(
+            self,
+            bootstrap_servers: str,
+            topic: str,
+            key_fields: list = None,
+            linger_ms: int = 50,
+            batch_bytes: int = 1000000,
+            compression: str = "lz4",
+            acks: str = "all",
+            flush_timeout: float = 30.0,
+            config: dict = None
+    ):
+        """
+        Publishes the issues to a Kafka topic, or any broker that speaks the Kafka protocol. Messages are keyed by repo
+        so the issues of a repo keep their order within a partition. Requires confluent-kafka.
+
+        :param bootstrap_servers: Comma separated host:port list of brokers
+        :param topic: Topic to publish to
+        :param key_fields: Issue attributes the message key is built from, defaults to ["owner", "repo"]
+        :param linger_ms: Milliseconds the producer waits for more messages before sending a batch
+        :param batch_bytes: Maximum size of a batch of messages for a partition in bytes
+        :param compression: none, gzip, snappy, lz4 or zstd
+        :param acks: Broker acknowledgements required for a message to be delivered, all, 1 or 0
+        :param flush_timeout: Seconds send_events waits for the outstanding messages to be delivered
+        :param config: Additional librdkafka configuration, I.E. security.protocol and sasl settings, overrides the
+            settings above
+        """
+        self.bootstrap_servers = bootstrap_servers
+        self.topic = topic
+        self.key_fields = key_fields
+        if self.key_fields is None:
+            self.key_fields = ["owner", "repo"]
+        self.linger_ms = linger_ms
+        self.batch_bytes = batch_bytes
+        self.compression = compression
+        self.flush_timeout = flush_timeout
+        self.config = {
+            "bootstrap.servers": bootstrap_servers,
+            "linger.ms": linger_ms,
+            "batch.size": batch_bytes,
+            "compression.type": compression,
+            "acks": acks,
+            # Retries can't reorder the messages of a partition with idempotence
+            "enable.idempotence": acks == "all",
+        }
+        self.config.update(config or {})
+        self.errors = []
+        self.producer = self.load_producer()
+
+    def load_producer(self) -> "confluent_kafka.Producer":
+        from confluent_kafka import Producer
+        return Producer(self.config)
+
+    def create_key(self, issue: IssueRecord) -> bytes:
+        return "/".join(str(getattr(issue, field, "")) for field in self.key_fields).encode("utf-8")
+
+    def on_delivery(self, error, message) -> None:
+        """
+        Delivery report of a message, called from poll and flush
+        :param error: KafkaError or None if the message was delivered
+        :param message: Message
+        :return:
+        """
+        latency = message.latency()
+        if latency is not None:
+            metrics.observe("socketsync_sink_send_seconds", latency, sink="kafka")
+        metrics.increment("socketsync_sink_requests_total", 1, sink="kafka")
+        if error is None:
+            metrics.increment("socketsync_sink_events_total", 1, sink="kafka")
+        else:
+            metrics.increment("socketsync_sink_failures_total", 1, sink="kafka")
+            self.errors.append({"key": message.key(), "error": str(error)})
+
+    def send_events(self, events: Iterable) -> list:
+        """
+        Publishes the issues, which can be a list or any iterator, and waits for them to be delivered
+        :param events: Iterable of IssueRecords
+        :return: List of errors, empty if every message was delivered
+        """
+        self.errors = []
+        for issue in events:
+            self.send(issue)
+        remaining = self.producer.flush(self.flush_timeout)
+        if remaining > 0:
+            log.error(f"{remaining} messages were not delivered to {self.topic} within {self.flush_timeout} seconds")
+            self.errors.append({"key": None, "error": f"{remaining} messages not delivered"})
+        return self.errors
+
+    def send(self, issue: IssueRecord) -> None:
+        """
+        Queues an issue, the producer sends it with the next batch of its partition
+        :param issue: IssueRecord
+        :return:
+        """
+        key = self.create_key(issue)
+        value = json.dumps(issue.__dict__).encode("utf-8")
+        while True:
+            try:
+                self.producer.produce(self.topic, value=value, key=key, on_delivery=self.on_delivery)
+                break
+            except BufferError:
+                # The local queue is full, wait for deliveries to make room
+                self.producer.poll(0.1)
+        self.producer.poll(0)
+
+    def close(self) -> None:
+        self.producer.flush(self.flush_timeout)
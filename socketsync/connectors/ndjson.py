@@ -0,0 +1,188 @@
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+from socketsync import log, metrics
+from socketsync.classes import IssueRecord
+
+
+class NDJSON:
+    file: str
+    max_bytes: int
+    max_seconds: int
+    compress: bool
+    buffer_bytes: int
+
+    def __init__(
+            self,
+            file: str,
+            max_bytes: int = 100 * 1024 * 1024,
+            max_seconds: int = None,
+            compress: bool = False,
+            buffer_bytes: int = 1024 * 1024
+    ):
+        """
+        Appends the issues as NDJSON to a file for a log shipper to tail. The file is rotated by renaming it, I.E.
+        issues.ndjson to issues-20240910T100000-00001.ndjson, and a new one is started in its place.
+
+        :param file: Path of the active file, issues are appended if it already exists
+        :param max_bytes: Rotate once the file reaches this size, None to not rotate by size
+        :param max_seconds: Rotate once the file has been written to for this many seconds, None to not rotate by time
+        :param compress: Gzip the rotated files, I.E. issues-20240910T100000-00001.ndjson.gz. Files are compressed in
+            the background and appear under the .gz name once they are complete
+        :param buffer_bytes: Lines are buffered until this many bytes are pending
+        """
+        self.file = file
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.compress = compress
+        self.buffer_bytes = buffer_bytes
+        self.buffer = []
+        self.buffered_bytes = 0
+        self.stream = None
+        self.size = 0
+        self.opened = None
+        self.segment = 0
+        self.files = []
+        self.compressor = None
+        self.compressions = []
+        self.lock = threading.Lock()
+
+    def write(self, issues: Iterable) -> int:
+        """
+        Appends the issues, which can be a list or any iterator, and flushes them to the file
+        :param issues: Iterable of IssueRecords
+        :return: Number of issues written
+        """
+        count = 0
+        for issue in issues:
+            self.add(issue)
+            count += 1
+        self.flush()
+        return count
+
+    def add(self, issue: IssueRecord) -> None:
+        """
+        Buffers an issue, writing the buffer once it is full and rotating the file when it is due
+        :param issue: IssueRecord
+        :return:
+        """
+        line = (json.dumps(issue.__dict__) + "\n").encode("utf-8")
+        with self.lock:
+            if self.stream is None:
+                self.open()
+            if self.rotation_due(len(line)):
+                self.flush_buffer()
+                self.rotate_file()
+                self.open()
+            self.buffer.append(line)
+            self.buffered_bytes += len(line)
+            if self.buffered_bytes >= self.buffer_bytes:
+                self.flush_buffer()
+
+    def rotation_due(self, line_bytes: int) -> bool:
+        pending = self.size + self.buffered_bytes
+        if pending == 0:
+            return False
+        if self.max_bytes is not None and pending + line_bytes > self.max_bytes:
+            return True
+        if self.max_seconds is not None and time.monotonic() - self.opened >= self.max_seconds:
+            return True
+        return False
+
+    def open(self) -> None:
+        self.stream = open(self.file, "ab")
+        self.size = self.stream.tell()
+        self.opened = time.monotonic()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered issues to the file
+        :return:
+        """
+        with self.lock:
+            self.flush_buffer()
+
+    def flush_buffer(self) -> None:
+        if not self.buffer:
+            return
+        data = b"".join(self.buffer)
+        events = len(self.buffer)
+        self.buffer = []
+        self.buffered_bytes = 0
+        with metrics.sink_send("ndjson", events):
+            self.stream.write(data)
+            self.stream.flush()
+        self.size += len(data)
+
+    def rotate(self) -> str:
+        """
+        Writes the buffered issues and rotates the file, a new one is started with the next issue
+        :return: Path of the rotated file, None if there was nothing to rotate
+        """
+        with self.lock:
+            if self.stream is None:
+                if not os.path.exists(self.file) or os.path.getsize(self.file) == 0:
+                    return None
+                self.open()
+            self.flush_buffer()
+            if self.size == 0:
+                return None
+            return self.rotate_file()
+
+    def segment_name(self) -> str:
+        self.segment += 1
+        base, extension = os.path.splitext(self.file)
+        timestamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+        return f"{base}-{timestamp}-{self.segment:05d}{extension}"
+
+    def rotate_file(self) -> str:
+        self.stream.close()
+        self.stream = None
+        rotated = self.segment_name()
+        while os.path.exists(rotated) or os.path.exists(f"{rotated}.gz"):
+            rotated = self.segment_name()
+        # A rename within the folder is atomic, a tailing agent sees the complete file under the new name
+        os.replace(self.file, rotated)
+        if self.compress:
+            if self.compressor is None:
+                self.compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ndjson-gzip")
+            for future in [future for future in self.compressions if future.done()]:
+                self.compressions.remove(future)
+                if future.exception() is not None:
+                    log.error(f"Unable to compress a rotated file: {future.exception()}")
+            self.compressions.append(self.compressor.submit(NDJSON.compress_file, rotated))
+            rotated = f"{rotated}.gz"
+        self.files.append(rotated)
+        log.debug(f"Rotated {self.file} to {rotated}")
+        return rotated
+
+    @staticmethod
+    def compress_file(file: str) -> str:
+        compressed = f"{file}.gz"
+        tmp_file = f"{compressed}.tmp"
+        with open(file, "rb") as source, gzip.open(tmp_file, "wb", compresslevel=6) as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+        os.replace(tmp_file, compressed)
+        os.remove(file)
+        return compressed
+
+    def close(self) -> None:
+        """
+        Writes the buffered issues and closes the file without rotating it, and waits for the rotated files to be
+        compressed
+        :return:
+        """
+        with self.lock:
+            if self.stream is not None:
+                self.flush_buffer()
+                self.stream.close()
+                self.stream = None
+            compressions = self.compressions
+            self.compressions = []
+        for future in compressions:
+            future.result()
@@ -0,0 +1,381 @@
+import gzip
+import json
+import struct
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timezone
+from typing import Iterable
+
+import requests
+
+from socketsync import log, metrics
+from socketsync.classes import IssueRecord
+from socketsync.connectors import create_session
+
+socket_date_format = "%Y-%m-%dT%H:%M:%S.%fZ"
+# OpenTelemetry SeverityNumber of each Socket severity
+severity_numbers = {
+    "critical": 21,
+    "high": 17,
+    "middle": 13,
+    "low": 9,
+}
+# Log record attribute name of each issue attribute
+attribute_names = [
+    ("socket.owner", "owner"),
+    ("socket.repo", "repo"),
+    ("socket.branch", "branch"),
+    ("socket.commit", "commit"),
+    ("socket.pr", "pr"),
+    ("socket.report_id", "report_id"),
+    ("socket.alert.type", "type"),
+    ("socket.alert.severity", "severity"),
+    ("socket.alert.category", "category"),
+    ("socket.alert.key", "key"),
+    ("socket.alert.title", "title"),
+    ("socket.alert.action", "action"),
+    ("socket.alert.is_error", "is_error"),
+    ("socket.package.id", "pkg_id"),
+    ("socket.package.type", "pkg_type"),
+    ("socket.package.name", "pkg_name"),
+    ("socket.package.version", "pkg_version"),
+    ("socket.package.url", "pkg_url"),
+    ("socket.package.direct", "direct"),
+    ("socket.manifests", "manifests"),
+]
+# Attributes shared by many issues, their encoding is cached
+repeated_attributes = {
+    "socket.owner",
+    "socket.repo",
+    "socket.branch",
+    "socket.commit",
+    "socket.pr",
+    "socket.report_id",
+    "socket.alert.type",
+    "socket.alert.severity",
+    "socket.alert.category",
+    "socket.alert.title",
+    "socket.alert.action",
+    "socket.alert.is_error",
+    "socket.package.type",
+    "socket.package.direct",
+}
+fixed64 = struct.Struct("<Q")
+double = struct.Struct("<d")
+
+
+def encode_varint(value: int) -> bytes:
+    if 0 <= value < 0x80:
+        return bytes((value,))
+    if value < 0:
+        value += 1 << 64
+    data = bytearray()
+    while value > 0x7F:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+    data.append(value)
+    return bytes(data)
+
+
+def encode_bytes(field: int, value: bytes) -> bytes:
+    """
+    Encodes a length delimited protobuf field, used for strings, bytes and embedded messages
+    :param field: Field number
+    :param value: Encoded value
+    :return:
+    """
+    return encode_varint(field << 3 | 2) + encode_varint(len(value)) + value
+
+
+def encode_any_value(value) -> bytes:
+    """
+    Encodes a value as an OTLP AnyValue message
+    :param value: str, bool, int, float, list, dict or None
+    :return:
+    """
+    if value is None:
+        return b""
+    if isinstance(value, str):
+        return encode_bytes(1, value.encode("utf-8"))
+    if isinstance(value, bool):
+        return b"\x10" + (b"\x01" if value else b"\x00")
+    if isinstance(value, int):
+        return b"\x18" + encode_varint(value)
+    if isinstance(value, float):
+        return b"\x21" + double.pack(value)
+    if isinstance(value, (list, tuple)):
+        return encode_bytes(5, b"".join(encode_bytes(1, encode_any_value(item)) for item in value))
+    if isinstance(value, dict):
+        values = b"".join(encode_bytes(1, encode_key_value(str(key), item)) for key, item in value.items())
+        return encode_bytes(6, values)
+    return encode_bytes(1, str(value).encode("utf-8"))
+
+
+def encode_key_value(key: str, value) -> bytes:
+    return encode_bytes(1, key.encode("utf-8")) + encode_bytes(2, encode_any_value(value))
+
+
+def json_any_value(value) -> dict:
+    """
+    Converts a value to an OTLP/JSON AnyValue
+    :param value: str, bool, int, float, list, dict or None
+    :return:
+    """
+    if value is None:
+        return {}
+    if isinstance(value, str):
+        return {"stringValue": value}
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [json_any_value(item) for item in value]}}
+    if isinstance(value, dict):
+        return {"kvlistValue": {"values": [
+            {"key": str(key), "value": json_any_value(item)} for key, item in value.items()
+        ]}}
+    return {"stringValue": str(value)}
+
+
+def create_purl(issue: IssueRecord) -> str:
+    name = urllib.parse.quote(str(issue.pkg_name), safe="/")
+    version = urllib.parse.quote(str(issue.pkg_version), safe="")
+    return f"pkg:{issue.pkg_type}/{name}@{version}"
+
+
+class OTLP:
+    url: str
+    encoding: str
+    compress: bool
+    batch_size: int
+    batch_bytes: int
+    flush_interval: float
+    timeout: int
+
+    def __init__(
+            self,
+            url: str = "http://localhost:4318",
+            encoding: str = "protobuf",
+            compress: bool = True,
+            headers: dict = None,
+            service_name: str = "socket-sync",
+            resource_attributes: dict = None,
+            batch_size: int = 512,
+            batch_bytes: int = 4000000,
+            flush_interval: float = 5.0,
+            timeout: int = 10,
+            retries: int = 3,
+            pool_size: int = 4
+    ):
+        """
+        Exports the issues as OpenTelemetry log records to an OTLP/HTTP endpoint, I.E. an OpenTelemetry Collector.
+        The protobuf encoding is written by hand so no OpenTelemetry package is needed.
+
+        :param url: Base URL of the OTLP/HTTP endpoint, /v1/logs is appended unless the URL already ends with it
+        :param encoding: protobuf or json
+        :param compress: Gzip the requests
+        :param headers: Additional request headers, I.E. for authentication
+        :param service_name: service.name resource attribute
+        :param resource_attributes: Additional resource attributes
+        :param batch_size: Maximum number of log records per request
+        :param batch_bytes: Maximum uncompressed size of the log records of a request in bytes
+        :param flush_interval: Seconds a log record waits in the buffer before the buffer is sent, checked when
+            records are added
+        :param timeout: Request timeout in seconds
+        :param retries: Number of retries of requests answered with 429, 502, 503 or 504, see create_session
+        :param pool_size: Number of pooled connections
+        """
+        url = url.rstrip("/")
+        if not url.endswith("/v1/logs"):
+            url = f"{url}/v1/logs"
+        self.url = url
+        self.encoding = encoding.lower()
+        if self.encoding not in ("protobuf", "json"):
+            raise ValueError(f"Unsupported encoding {encoding}, use protobuf or json")
+        self.compress = compress
+        self.batch_size = batch_size
+        self.batch_bytes = batch_bytes
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.resource_attributes = {"service.name": service_name}
+        self.resource_attributes.update(resource_attributes or {})
+        self.session = create_session(retries, pool_size, (429, 502, 503, 504))
+        self.session.headers.update({
+            "User-Agent": "SocketPythonScript/0.0.1",
+            "Content-Type": "application/x-protobuf" if self.encoding == "protobuf" else "application/json"
+        })
+        if self.compress:
+            self.session.headers["Content-Encoding"] = "gzip"
+        self.session.headers.update(headers or {})
+        self.buffer = []
+        self.buffered_bytes = 0
+        self.buffered_at = None
+        self.errors = []
+        self.key_values = {}
+        self.last_timestamp = None
+        self.lock = threading.Lock()
+
+    def get_time(self, created_at: str) -> int:
+        # The issues of a report share its created_at, so the last one parsed is kept
+        last = self.last_timestamp
+        if created_at is None or last is None or created_at != last[0]:
+            try:
+                date = datetime.strptime(created_at, socket_date_format).replace(tzinfo=timezone.utc)
+                nanos = int(date.timestamp()) * 1000000000 + date.microsecond * 1000
+            except (TypeError, ValueError):
+                nanos = time.time_ns()
+            last = (created_at, nanos)
+            self.last_timestamp = last
+        return last[1]
+
+    def get_attributes(self, issue: IssueRecord) -> list:
+        attributes = []
+        for name, attribute in attribute_names:
+            value = getattr(issue, attribute, None)
+            if value is not None and value != "":
+                attributes.append((name, value))
+        attributes.append(("socket.package.purl", create_purl(issue)))
+        props = getattr(issue, "props", None)
+        if props:
+            attributes.append(("socket.alert.props", props))
+        return attributes
+
+    def encode_attribute(self, name: str, value) -> bytes:
+        if name not in repeated_attributes:
+            return encode_bytes(6, encode_key_value(name, value))
+        key = (name, value)
+        data = self.key_values.get(key)
+        if data is None:
+            if len(self.key_values) > 10000:
+                self.key_values.clear()
+            data = encode_bytes(6, encode_key_value(name, value))
+            self.key_values[key] = data
+        return data
+
+    def create_record(self, issue: IssueRecord):
+        """
+        Maps an issue to an OTLP LogRecord
+        :param issue: IssueRecord
+        :return: Encoded LogRecord message for protobuf, the LogRecord object for json
+        """
+        timestamp = self.get_time(getattr(issue, "created_at", None))
+        severity = getattr(issue, "severity", None) or ""
+        body = getattr(issue, "description", None) or getattr(issue, "title", None) or issue.type
+        attributes = self.get_attributes(issue)
+        if self.encoding == "json":
+            return json.dumps({
+                "timeUnixNano": str(timestamp),
+                "observedTimeUnixNano": str(time.time_ns()),
+                "severityNumber": severity_numbers.get(severity, 0),
+                "severityText": severity,
+                "body": json_any_value(body),
+                "attributes": [{"key": name, "value": json_any_value(value)} for name, value in attributes],
+                "eventName": f"socket.alert.{issue.type}",
+            }).encode("utf-8")
+        record = bytearray(b"\x09")
+        record += fixed64.pack(timestamp)
+        record += b"\x10" + encode_varint(severity_numbers.get(severity, 0))
+        record += encode_bytes(3, severity.encode("utf-8"))
+        record += encode_bytes(5, encode_any_value(body))
+        for name, value in attributes:
+            record += self.encode_attribute(name, value)
+        record += b"\x59" + fixed64.pack(time.time_ns())
+        record += encode_bytes(12, f"socket.alert.{issue.type}".encode("utf-8"))
+        return encode_bytes(2, bytes(record))
+
+    def create_body(self, records: list) -> bytes:
+        """
+        Wraps log records into an ExportLogsServiceRequest
+        :param records: Records created with create_record
+        :return:
+        """
+        scope_name = "socketsync"
+        if self.encoding == "json":
+            resource = json.dumps({"attributes": [
+                {"key": name, "value": json_any_value(value)} for name, value in self.resource_attributes.items()
+            ]})
+            scope = json.dumps({"name": scope_name})
+            prefix = f'{{"resourceLogs": [{{"resource": {resource}, "scopeLogs": [{{"scope": {scope}, "logRecords": ['
+            return prefix.encode("utf-8") + b", ".join(records) + b"]}]}]}"
+        resource = b"".join(
+            encode_bytes(1, encode_key_value(name, value)) for name, value in self.resource_attributes.items()
+        )
+        scope_logs = encode_bytes(1, encode_bytes(1, scope_name.encode("utf-8"))) + b"".join(records)
+        resource_logs = encode_bytes(1, resource) + encode_bytes(2, scope_logs)
+        return encode_bytes(1, resource_logs)
+
+    def send_events(self, events: Iterable) -> list:
+        """
+        Exports the issues, which can be a list or any iterator, and flushes the buffer
+        :param events: Iterable of IssueRecords
+        :return: List of errors, empty if every request was delivered
+        """
+        for issue in events:
+            self.add(issue)
+        self.flush()
+        with self.lock:
+            errors = self.errors
+            self.errors = []
+        return errors
+
+    def add(self, issue: IssueRecord) -> None:
+        """
+        Buffers an issue, the buffer is sent once it holds batch_size records or batch_bytes, or once its oldest
+        record has waited flush_interval seconds
+        :param issue: IssueRecord
+        :return:
+        """
+        record = self.create_record(issue)
+        size = len(record)
+        with self.lock:
+            if self.buffer and self.buffered_bytes + size > self.batch_bytes:
+                self.send_buffer()
+            if not self.buffer:
+                self.buffered_at = time.monotonic()
+            self.buffer.append(record)
+            self.buffered_bytes += size
+            if len(self.buffer) >= self.batch_size:
+                self.send_buffer()
+            elif time.monotonic() - self.buffered_at >= self.flush_interval:
+                self.send_buffer()
+
+    def flush(self) -> None:
+        """
+        Sends the buffered issues
+        :return:
+        """
+        with self.lock:
+            self.send_buffer()
+
+    def send_buffer(self) -> None:
+        if not self.buffer:
+            return
+        records = self.buffer
+        self.buffer = []
+        self.buffered_bytes = 0
+        body = self.create_body(records)
+        if self.compress:
+            body = gzip.compress(body, compresslevel=6)
+        try:
+            with metrics.sink_send("otlp", len(records)) as send_status:
+                response = self.session.post(self.url, data=body, timeout=self.timeout)
+                send_status["failed"] = response.status_code != 200
+        except requests.exceptions.RequestException as error:
+            log.error(f"Failed to export {len(records)} issues to {self.url}: {error}")
+            self.errors.append({"status_code": None, "response_text": str(error), "events": len(records)})
+            return
+        if response.status_code != 200:
+            log.error(f"Failed to export {len(records)} issues to {self.url}: {response.status_code} {response.text}")
+            self.errors.append({
+                "status_code": response.status_code,
+                "response_text": response.text,
+                "events": len(records)
+            })
+
+    def close(self) -> None:
+        self.flush()
+        self.session.close()
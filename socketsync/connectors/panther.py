@@ -1,16 +1,59 @@
+import gzip
 import json
+from typing import Iterable
+
 import requests
 
+from socketsync import log, metrics
+from socketsync.classes import IssueRecord
+from socketsync.connectors import create_session
+
 
 class Panther:
     token: str
     url: str
     timeout: int
+    batch_bytes: int
+    compress: bool
+    retries: int
+    pool_size: int
+    schema: str
 
-    def __init__(self, url: str, token: str = None, timeout: int = 10):
+    def __init__(
+            self,
+            url: str,
+            token: str = None,
+            timeout: int = 10,
+            batch_bytes: int = 5000000,
+            compress: bool = True,
+            retries: int = 3,
+            pool_size: int = 10,
+            schema: str = None
+    ):
+        """
+        Sends issues to a Panther HTTP log source
+
+        :param url: Panther HTTP log source URL
+        :param token: Bearer token of the log source
+        :param timeout: Request timeout in seconds
+        :param batch_bytes: Maximum uncompressed size of a send_batch request in bytes
+        :param compress: Gzip the send_batch requests
+        :param retries: Number of retries of send_batch requests answered with 429 or a 5xx status, see create_session
+        :param pool_size: Number of pooled connections used by send_batch
+        :param schema: Path of the Panther schema of the log source, I.E. panther/socket.schema. The fields of the
+            first issue sent with send_batch are checked against it. The check is advisory, problems are logged as
+            warnings and the issues are still sent
+        """
         self.token = token
         self.url = url
         self.timeout = timeout
+        self.batch_bytes = batch_bytes
+        self.compress = compress
+        self.retries = retries
+        self.pool_size = pool_size
+        self.schema = schema
+        self.session = None
+        self.validated = schema is None
 
     def do_request(
             self,
@@ -27,13 +70,15 @@ class Panther:
             }
             if self.token is not None:
                 headers['Authorization'] = f"Bearer {self.token}"
-        response = requests.request(
-            method.upper(),
-            self.url,
-            headers=headers,
-            data=payload,
-            timeout=self.timeout
-        )
+        with metrics.sink_send("panther") as send_status:
+            response = requests.request(
+                method.upper(),
+                self.url,
+                headers=headers,
+                data=payload,
+                timeout=self.timeout
+            )
+            send_status["failed"] = response.status_code != 200
         if response.status_code != 200:
             print("Failed to post data")
             print(response.text)
@@ -50,3 +95,102 @@ class Panther:
         )
         return response
 
+    @staticmethod
+    def load_schema(file: str) -> dict:
+        """
+        Reads the top level field names of a Panther schema file
+        :param file: Path of the schema file
+        :return: Dict of field name to whether the field is required
+        """
+        fields = {}
+        name = None
+        with open(file) as schema_file:
+            for line in schema_file:
+                if line.startswith("- name:"):
+                    name = line.split(":", 1)[1].strip().strip("'\"")
+                    fields[name] = False
+                elif name is not None and line.startswith("  required:"):
+                    fields[name] = line.split(":", 1)[1].strip().lower() == "true"
+                elif not line.startswith(" "):
+                    name = None
+        return fields
+
+    def validate(self, issue: IssueRecord) -> list:
+        """
+        Compares the fields of an issue with the schema of the log source, Panther fails to classify records missing
+        a required field and drops fields that are not in the schema
+        :param issue: IssueRecord
+        :return: List of problems, empty if the issue matches the schema
+        """
+        fields = Panther.load_schema(self.schema)
+        record = issue.__dict__
+        problems = []
+        missing = [name for name, required in fields.items() if required and name not in record]
+        if missing:
+            problems.append(f"required fields missing from the issues: {', '.join(missing)}")
+        unknown = [name for name in record if name not in fields]
+        if unknown:
+            problems.append(f"issue fields not in the schema: {', '.join(unknown)}")
+        return problems
+
+    def get_session(self) -> requests.Session:
+        if self.session is None:
+            session = create_session(self.retries, self.pool_size)
+            session.headers.update({
+                'User-Agent': 'SocketPythonScript/0.0.1',
+                "accept": "application/json",
+                'Content-Type': "application/x-ndjson"
+            })
+            if self.token is not None:
+                session.headers['Authorization'] = f"Bearer {self.token}"
+            if self.compress:
+                session.headers["Content-Encoding"] = "gzip"
+            self.session = session
+        return self.session
+
+    def create_batches(self, issues: Iterable) -> Iterable:
+        batch = []
+        size = 0
+        for issue in issues:
+            if not self.validated:
+                self.validated = True
+                for problem in self.validate(issue):
+                    log.warning(f"Panther schema {self.schema}: {problem}")
+            line = json.dumps(issue.__dict__).encode("utf-8")
+            if batch and size + len(line) + 1 > self.batch_bytes:
+                yield batch
+                batch = []
+                size = 0
+            batch.append(line)
+            size += len(line) + 1
+        if batch:
+            yield batch
+
+    def send_batch(self, issues: Iterable) -> list:
+        """
+        Sends the issues, which can be a list or any iterator, as NDJSON in requests of up to batch_bytes
+        :param issues: Iterable of IssueRecords
+        :return: List of errors, empty if every request was delivered
+        """
+        session = self.get_session()
+        errors = []
+        for batch in self.create_batches(issues):
+            body = b"\n".join(batch)
+            if self.compress:
+                body = gzip.compress(body, compresslevel=6)
+            try:
+                with metrics.sink_send("panther", len(batch)) as send_status:
+                    response = session.post(self.url, data=body, timeout=self.timeout)
+                    send_status["failed"] = response.status_code != 200
+            except requests.exceptions.RequestException as error:
+                log.error(f"Failed to send {len(batch)} issues to Panther: {error}")
+                errors.append({"status_code": None, "response_text": str(error), "events": len(batch)})
+                continue
+            if response.status_code != 200:
+                log.error(f"Failed to send {len(batch)} issues to Panther: {response.status_code} {response.text}")
+                errors.append({
+                    "status_code": response.status_code,
+                    "response_text": response.text,
+                    "events": len(batch)
+                })
+        return errors
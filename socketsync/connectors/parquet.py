@@ -0,0 +1,196 @@
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Iterable
+from socketsync import log, metrics
+
+if TYPE_CHECKING:
+    import pyarrow
+
+string_columns = [
+    "pr",
+    "commit",
+    "report_id",
+    "pkg_version",
+    "pkg_id",
+    "key",
+    "manifests",
+    "pkg_url",
+]
+dictionary_columns = [
+    "owner",
+    "repo",
+    "branch",
+    "pkg_type",
+    "pkg_name",
+    "type",
+    "severity",
+    "category",
+    "description",
+    "title",
+    "suggestion",
+    "next_step_title",
+    "action",
+    "delta",
+]
+bool_columns = [
+    "is_error",
+    "direct",
+    "warn",
+    "error",
+    "ignore",
+    "monitor",
+]
+socket_date_format = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+class Parquet:
+    path: str
+    partition_by: list
+    row_group_size: int
+    compression: str
+    file_prefix: str
+
+    def __init__(
+            self,
+            path: str,
+            partition_by: list = None,
+            row_group_size: int = 50000,
+            compression: str = "zstd",
+            file_prefix: str = "issues"
+    ):
+        """
+        Writes the issues to Parquet files in a folder partitioned Hive style, I.E. date=2024-09-10/org=example
+
+        :param path: Folder to write the Parquet files to
+        :param partition_by: Partition columns, date and/or org. Defaults to ["date", "org"]
+        :param row_group_size: Rows per row group, rows are buffered per partition until a row group is full
+        :param compression: Parquet compression codec, I.E. zstd, snappy, gzip or none
+        :param file_prefix: Prefix of the file names, a timestamp is appended so runs don't overwrite each other
+        """
+        import pyarrow
+        import pyarrow.parquet
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.partition_by = partition_by
+        if self.partition_by is None:
+            self.partition_by = ["date", "org"]
+        for partition in self.partition_by:
+            if partition not in ("date", "org"):
+                raise ValueError(f"Unsupported partition {partition}, use date or org")
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.file_prefix = file_prefix
+        self.schema = Parquet.create_schema(pyarrow)
+        self.writers = {}
+        self.buffers = {}
+        self.files = []
+
+    @staticmethod
+    def create_schema(pa: "pyarrow") -> "pyarrow.Schema":
+        fields = [pa.field("created_at", pa.timestamp("us", tz="UTC"))]
+        for column in dictionary_columns:
+            fields.append(pa.field(column, pa.dictionary(pa.int32(), pa.string())))
+        for column in string_columns:
+            fields.append(pa.field(column, pa.string()))
+        for column in bool_columns:
+            fields.append(pa.field(column, pa.bool_()))
+        fields.append(pa.field("props", pa.map_(pa.string(), pa.string())))
+        fields.append(pa.field(
+            "introduced_by",
+            pa.list_(pa.struct([pa.field("purl", pa.string()), pa.field("manifests", pa.string())]))
+        ))
+        return pa.schema(fields)
+
+    @staticmethod
+    def parse_date(created_at: str) -> datetime:
+        if not created_at:
+            return None
+        try:
+            return datetime.strptime(created_at, socket_date_format).replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+    def write(self, issues: Iterable) -> list:
+        """
+        Writes the issues, which can be a list or any iterator, and closes the files
+        :param issues: Iterable of IssueRecords
+        :return: Paths of the files that were written
+        """
+        self.files = []
+        for issue in issues:
+            self.add(issue)
+        self.close()
+        return self.files
+
+    def add(self, issue) -> None:
+        """
+        Adds an issue to the buffer of its partition, and writes a row group once the buffer is full
+        :param issue: IssueRecord
+        :return:
+        """
+        created_at = Parquet.parse_date(getattr(issue, "created_at", None))
+        partition = []
+        for name in self.partition_by:
+            if name == "date":
+                partition.append(("date", created_at.strftime("%Y-%m-%d") if created_at else "unknown"))
+            else:
+                partition.append(("org", getattr(issue, "owner", None) or "unknown"))
+        partition = tuple(partition)
+        buffer = self.buffers.get(partition)
+        if buffer is None:
+            buffer = {field.name: [] for field in self.schema}
+            self.buffers[partition] = buffer
+        buffer["created_at"].append(created_at)
+        for column in dictionary_columns:
+            buffer[column].append(getattr(issue, column, None))
+        for column in string_columns:
+            value = getattr(issue, column, None)
+            buffer[column].append(value if value is None else str(value))
+        for column in bool_columns:
+            buffer[column].append(bool(getattr(issue, column, False)))
+        props = getattr(issue, "props", None) or {}
+        buffer["props"].append([
+            (str(name), value if isinstance(value, str) else json.dumps(value)) for name, value in props.items()
+        ])
+        buffer["introduced_by"].append([
+            {"purl": source[0], "manifests": source[1]} for source in getattr(issue, "introduced_by", None) or []
+        ])
+        if len(buffer["created_at"]) >= self.row_group_size:
+            self.write_row_group(partition)
+
+    def write_row_group(self, partition: tuple) -> None:
+        buffer = self.buffers.pop(partition, None)
+        if buffer is None or len(buffer["created_at"]) == 0:
+            return
+        rows = len(buffer["created_at"])
+        with metrics.sink_send("parquet", rows):
+            table = self.pa.Table.from_pydict(buffer, schema=self.schema)
+            writer = self.writers.get(partition)
+            if writer is None:
+                folder = os.path.join(self.path, *[f"{name}={value}" for name, value in partition])
+                os.makedirs(folder, exist_ok=True)
+                file_name = os.path.join(folder, f"{self.file_prefix}-{time.time_ns()}.parquet")
+                writer = self.pq.ParquetWriter(
+                    file_name,
+                    self.schema,
+                    compression=self.compression,
+                    use_dictionary=dictionary_columns
+                )
+                self.writers[partition] = writer
+                self.files.append(file_name)
+            writer.write_table(table, row_group_size=self.row_group_size)
+        log.debug(f"Wrote {rows} issues to {writer.where}")
+
+    def close(self) -> None:
+        """
+        Writes the remaining buffered issues and closes the files
+        :return:
+        """
+        for partition in list(self.buffers):
+            self.write_row_group(partition)
+        for writer in self.writers.values():
+            writer.close()
+        self.writers = {}
@@ -5,6 +5,7 @@ import base64
 import requests
 from datetime import datetime, timezone
 
+from socketsync import metrics
 from socketsync.classes import IssueRecord
 
 default_log_type = 'SocketSiemConnector'
@@ -88,7 +89,9 @@ class Sentinel:
             "x-ms-date": rfc1123date
         }
 
-        response = requests.post(self.uri, data=body, headers=headers)
+        with metrics.sink_send("sentinel") as send_status:
+            response = requests.post(self.uri, data=body, headers=headers)
+            send_status["failed"] = response.status_code != 200
         return {
             "status_code": response.status_code,
             "response_text": response.text
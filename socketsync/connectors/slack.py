@@ -5,7 +5,7 @@ import urllib
 from socketsync.classes import IssueRecord
 from socketsync import log
 from socketsync import default_headers
-from slack_sdk.webhook import WebhookClient
+from socketsync import metrics
 
 
 class Slack:
@@ -37,11 +37,14 @@ class Slack:
         self.url = url
 
     def send(self, payload: dict):
+        from slack_sdk.webhook import WebhookClient
         url = self.create_url(self.url, self.params)
         webhook = WebhookClient(url)
         blocks = Slack.generate_slack_body(payload)
         try:
-            response = webhook.send(blocks=blocks)
+            with metrics.sink_send("slack") as send_status:
+                response = webhook.send(blocks=blocks)
+                send_status["failed"] = response.status_code != 200
             sent = True
         except Exception as error:
             log.error("Unable to send slack webhook")
@@ -0,0 +1,227 @@
+import gzip
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Iterable
+
+import requests
+
+from socketsync import log, metrics
+from socketsync.classes import IssueRecord
+from socketsync.connectors import create_session
+
+socket_date_format = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+class Splunk:
+    url: str
+    index: str
+    sourcetype: str
+    source: str
+    host: str
+    batch_events: int
+    batch_bytes: int
+    compress: bool
+    ack: bool
+    ack_timeout: int
+    ack_interval: float
+    timeout: int
+
+    def __init__(
+            self,
+            url: str,
+            token: str,
+            index: str = None,
+            sourcetype: str = "socket:alert",
+            source: str = "socket-sync",
+            host: str = None,
+            batch_events: int = 500,
+            batch_bytes: int = 1000000,
+            compress: bool = True,
+            ack: bool = False,
+            channel: str = None,
+            ack_timeout: int = 60,
+            ack_interval: float = 1.0,
+            timeout: int = 30,
+            pool_size: int = 10,
+            retries: int = 3,
+            verify: bool = True
+    ):
+        """
+        Sends the issues to a Splunk HTTP Event Collector. Events are concatenated into batches that are sent in a
+        single request over a pooled session.
+
+        :param url: Base URL of the HEC, I.E. https://splunk.example.com:8088, or the full collector event URL
+        :param token: HEC token
+        :param index: Index to write to, defaults to the default index of the token
+        :param sourcetype: Sourcetype of the events
+        :param source: Source of the events
+        :param host: Host of the events, defaults to the host of the token
+        :param batch_events: Maximum number of events per request
+        :param batch_bytes: Maximum uncompressed size of a request body in bytes
+        :param compress: Gzip the request bodies
+        :param ack: Wait for indexer acknowledgement of every batch, the token needs indexer acknowledgement enabled
+        :param channel: HEC channel to send on, a random one is used if not set
+        :param ack_timeout: Seconds to wait for the acknowledgements before reporting the batches as failed
+        :param ack_interval: Seconds between acknowledgement polls
+        :param timeout: Request timeout in seconds
+        :param pool_size: Number of pooled connections
+        :param retries: Number of retries for requests answered with 429 or 503, see create_session
+        :param verify: Verify the TLS certificate of the HEC
+        """
+        url = url.rstrip("/")
+        if "/services/collector" in url:
+            self.url = url
+            url = url.split("/services/collector", 1)[0]
+        else:
+            self.url = f"{url}/services/collector/event"
+        self.ack_url = f"{url}/services/collector/ack"
+        self.index = index
+        self.sourcetype = sourcetype
+        self.source = source
+        self.host = host
+        self.batch_events = batch_events
+        self.batch_bytes = batch_bytes
+        self.compress = compress
+        self.ack = ack
+        self.channel = channel or str(uuid.uuid4())
+        self.ack_timeout = ack_timeout
+        self.ack_interval = ack_interval
+        self.timeout = timeout
+        self.session = create_session(retries, pool_size, (429, 503))
+        self.session.verify = verify
+        self.session.headers.update({
+            "Authorization": f"Splunk {token}",
+            "Content-Type": "application/json",
+            "X-Splunk-Request-Channel": self.channel,
+            "User-Agent": "SocketPythonScript/0.0.1"
+        })
+        if self.compress:
+            self.session.headers["Content-Encoding"] = "gzip"
+
+    @staticmethod
+    def get_time(created_at: str) -> float:
+        if created_at:
+            try:
+                date = datetime.strptime(created_at, socket_date_format).replace(tzinfo=timezone.utc)
+                return date.timestamp()
+            except ValueError:
+                pass
+        return time.time()
+
+    def create_event(self, issue: IssueRecord) -> bytes:
+        event = {
+            "time": Splunk.get_time(getattr(issue, "created_at", None)),
+            "source": self.source,
+            "sourcetype": self.sourcetype,
+        }
+        if self.index is not None:
+            event["index"] = self.index
+        if self.host is not None:
+            event["host"] = self.host
+        event["event"] = issue.__dict__
+        return json.dumps(event).encode("utf-8")
+
+    def create_batches(self, events: Iterable) -> Iterable:
+        batch = []
+        size = 0
+        for issue in events:
+            event = self.create_event(issue)
+            if batch and (len(batch) >= self.batch_events or size + len(event) + 1 > self.batch_bytes):
+                yield batch
+                batch = []
+                size = 0
+            batch.append(event)
+            size += len(event) + 1
+        if batch:
+            yield batch
+
+    def send_events(self, events: Iterable) -> list:
+        """
+        Sends the issues, which can be a list or any iterator, in batches
+        :param events: Iterable of IssueRecords
+        :return: List of errors, empty if every batch was delivered
+        """
+        errors = []
+        pending = {}
+        for batch in self.create_batches(events):
+            response = self.send_batch(batch)
+            if response["status_code"] != 200:
+                errors.append(response)
+            elif self.ack and response.get("ack_id") is not None:
+                pending[response["ack_id"]] = len(batch)
+        if pending:
+            errors.extend(self.wait_for_acks(pending))
+        return errors
+
+    def send_batch(self, batch: list) -> dict:
+        """
+        Sends a batch of serialized events in one request
+        :param batch: List of events serialized to JSON
+        :return: Dict with the status code, the response text and the ack id of the batch
+        """
+        body = b"\n".join(batch)
+        if self.compress:
+            body = gzip.compress(body, compresslevel=6)
+        # With indexer acknowledgement the events only count as delivered once they are acknowledged
+        try:
+            with metrics.sink_send("splunk", 0 if self.ack else len(batch)) as send_status:
+                response = self.session.post(self.url, data=body, timeout=self.timeout)
+                send_status["failed"] = response.status_code != 200
+        except requests.exceptions.RequestException as error:
+            log.error(f"Failed to send {len(batch)} issues to Splunk: {error}")
+            return {"status_code": None, "response_text": str(error), "events": len(batch)}
+        result = {"status_code": response.status_code, "response_text": response.text, "events": len(batch)}
+        if response.status_code == 200 and self.ack:
+            try:
+                result["ack_id"] = response.json().get("ackId")
+            except ValueError:
+                log.debug(f"Unable to read the ackId from the HEC response {response.text}")
+        return result
+
+    def wait_for_acks(self, pending: dict) -> list:
+        """
+        Polls the HEC until the batches are acknowledged or ack_timeout passes
+        :param pending: Dict of ack id to the number of events in the batch
+        :return: List of errors for the batches that were not acknowledged
+        """
+        deadline = time.monotonic() + self.ack_timeout
+        while pending:
+            # A failed poll is retried until ack_timeout, the batches still pending then are returned as errors
+            try:
+                with metrics.sink_send("splunk", 0) as send_status:
+                    response = self.session.post(
+                        self.ack_url,
+                        params={"channel": self.channel},
+                        data=json.dumps({"acks": list(pending)}),
+                        headers={"Content-Encoding": None},
+                        timeout=self.timeout
+                    )
+                    send_status["failed"] = response.status_code != 200
+            except requests.exceptions.RequestException as error:
+                log.error(f"Unable to poll the Splunk acknowledgements: {error}")
+                response = None
+            if response is not None and response.status_code == 200:
+                acks = response.json().get("acks", {})
+                acknowledged = 0
+                for ack_id, done in acks.items():
+                    if done:
+                        acknowledged += pending.pop(int(ack_id), 0)
+                if acknowledged:
+                    metrics.increment("socketsync_sink_events_total", acknowledged, sink="splunk")
+            if not pending or time.monotonic() >= deadline:
+                break
+            time.sleep(self.ack_interval)
+        errors = []
+        for ack_id, count in pending.items():
+            log.error(f"Splunk did not acknowledge batch {ack_id} with {count} events")
+            errors.append({
+                "status_code": None,
+                "response_text": f"Batch {ack_id} was not acknowledged",
+                "events": count
+            })
+        return errors
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,259 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from itertools import islice
+from typing import Iterable
+from socketsync import log, metrics
+
+socket_date_format = "%Y-%m-%dT%H:%M:%S.%fZ"
+sqlite_date_format = "%Y-%m-%d %H:%M:%S"
+
+schema = """
+CREATE TABLE IF NOT EXISTS repos (
+    id INTEGER PRIMARY KEY,
+    owner TEXT,
+    name TEXT,
+    UNIQUE (owner, name)
+);
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    report_id TEXT UNIQUE,
+    repo_id INTEGER REFERENCES repos (id),
+    branch TEXT,
+    commit_hash TEXT,
+    pr TEXT,
+    created_at TEXT
+);
+CREATE TABLE IF NOT EXISTS packages (
+    id INTEGER PRIMARY KEY,
+    pkg_id TEXT UNIQUE,
+    pkg_type TEXT,
+    pkg_name TEXT,
+    pkg_version TEXT,
+    pkg_url TEXT
+);
+CREATE TABLE IF NOT EXISTS alert_types (
+    id INTEGER PRIMARY KEY,
+    type TEXT UNIQUE,
+    category TEXT,
+    title TEXT,
+    description TEXT,
+    suggestion TEXT,
+    next_step_title TEXT
+);
+CREATE TABLE IF NOT EXISTS issues (
+    id INTEGER PRIMARY KEY,
+    report_id INTEGER REFERENCES reports (id),
+    repo_id INTEGER REFERENCES repos (id),
+    package_id INTEGER REFERENCES packages (id),
+    alert_type_id INTEGER REFERENCES alert_types (id),
+    severity TEXT,
+    key TEXT,
+    props TEXT,
+    introduced_by TEXT,
+    manifests TEXT,
+    is_error INTEGER,
+    direct INTEGER,
+    action TEXT,
+    delta TEXT,
+    created_at TEXT,
+    -- key and delta are stored as '' instead of NULL, NULLs never conflict in a UNIQUE constraint
+    UNIQUE (report_id, package_id, alert_type_id, key, delta)
+);
+CREATE INDEX IF NOT EXISTS issues_repo ON issues (repo_id, created_at);
+CREATE INDEX IF NOT EXISTS issues_severity ON issues (severity, created_at);
+CREATE INDEX IF NOT EXISTS issues_type ON issues (alert_type_id, created_at);
+CREATE INDEX IF NOT EXISTS issues_created_at ON issues (created_at);
+CREATE INDEX IF NOT EXISTS repos_name ON repos (name);
+CREATE VIEW IF NOT EXISTS issues_view AS
+SELECT
+    repos.owner AS owner,
+    repos.name AS repo,
+    reports.branch AS branch,
+    reports.report_id AS report_id,
+    reports.commit_hash AS 'commit',
+    reports.pr AS pr,
+    issues.created_at AS created_at,
+    packages.pkg_type AS pkg_type,
+    packages.pkg_name AS pkg_name,
+    packages.pkg_version AS pkg_version,
+    packages.pkg_id AS pkg_id,
+    packages.pkg_url AS pkg_url,
+    alert_types.type AS type,
+    issues.severity AS severity,
+    alert_types.category AS category,
+    issues.key AS key,
+    issues.props AS props,
+    alert_types.title AS title,
+    alert_types.description AS description,
+    alert_types.suggestion AS suggestion,
+    alert_types.next_step_title AS next_step_title,
+    issues.introduced_by AS introduced_by,
+    issues.manifests AS manifests,
+    issues.is_error AS is_error,
+    issues.direct AS direct,
+    issues.action AS action,
+    NULLIF(issues.delta, '') AS delta
+FROM issues
+JOIN repos ON repos.id = issues.repo_id
+JOIN reports ON reports.id = issues.report_id
+JOIN packages ON packages.id = issues.package_id
+JOIN alert_types ON alert_types.id = issues.alert_type_id;
+"""
+
+
+class SQLite:
+    file: str
+    batch_size: int
+
+    def __init__(self, file: str, batch_size: int = 10000):
+        """
+        Stores the issues in a local SQLite database for ad hoc queries. Repos, reports, packages and alert types are
+        kept in lookup tables and the issues reference them, the issues_view view joins them back together. Issues
+        that are already stored are skipped.
+
+        :param file: Path of the SQLite database. Created if it does not exist
+        :param batch_size: Number of issues inserted per transaction
+        """
+        self.file = file
+        self.batch_size = batch_size
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.file, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(schema)
+        self.clear_lookups()
+
+    def clear_lookups(self) -> None:
+        self.repos = {}
+        self.reports = {}
+        self.packages = {}
+        self.alert_types = {}
+
+    @staticmethod
+    def format_date(created_at: str) -> str:
+        if not created_at:
+            return created_at
+        try:
+            return datetime.strptime(created_at, socket_date_format).strftime(sqlite_date_format)
+        except ValueError:
+            return created_at
+
+    def lookup(self, cache: dict, key, insert: str, select: str, values: tuple) -> int:
+        row_id = cache.get(key)
+        if row_id is None:
+            # Looked up with IS before inserting, UNIQUE does not stop rows with a NULL key from being inserted again
+            row = self.connection.execute(select, key if isinstance(key, tuple) else (key,)).fetchone()
+            if row is None:
+                row_id = self.connection.execute(insert, values).lastrowid
+            else:
+                row_id = row[0]
+            cache[key] = row_id
+        return row_id
+
+    def create_row(self, issue) -> tuple:
+        repo_key = (issue.owner, issue.repo)
+        repo_id = self.lookup(
+            self.repos,
+            repo_key,
+            "INSERT INTO repos (owner, name) VALUES (?, ?)",
+            "SELECT id FROM repos WHERE owner IS ? AND name IS ?",
+            repo_key
+        )
+        created_at = SQLite.format_date(issue.created_at)
+        report_id = self.lookup(
+            self.reports,
+            issue.report_id,
+            "INSERT INTO reports (report_id, repo_id, branch, commit_hash, pr, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            "SELECT id FROM reports WHERE report_id IS ?",
+            (issue.report_id, repo_id, issue.branch, issue.commit, issue.pr, created_at)
+        )
+        package_id = self.lookup(
+            self.packages,
+            issue.pkg_id,
+            "INSERT INTO packages (pkg_id, pkg_type, pkg_name, pkg_version, pkg_url) VALUES (?, ?, ?, ?, ?)",
+            "SELECT id FROM packages WHERE pkg_id IS ?",
+            (issue.pkg_id, issue.pkg_type, issue.pkg_name, issue.pkg_version, issue.pkg_url)
+        )
+        alert_type_id = self.lookup(
+            self.alert_types,
+            issue.type,
+            "INSERT INTO alert_types (type, category, title, description, suggestion, next_step_title) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            "SELECT id FROM alert_types WHERE type IS ?",
+            (
+                issue.type,
+                getattr(issue, "category", None),
+                getattr(issue, "title", None),
+                getattr(issue, "description", None),
+                getattr(issue, "suggestion", None),
+                getattr(issue, "next_step_title", None)
+            )
+        )
+        return (
+            report_id,
+            repo_id,
+            package_id,
+            alert_type_id,
+            issue.severity,
+            getattr(issue, "key", None) or "",
+            json.dumps(getattr(issue, "props", None)),
+            json.dumps(issue.introduced_by),
+            issue.manifests,
+            int(bool(getattr(issue, "is_error", False))),
+            int(bool(issue.direct)),
+            getattr(issue, "action", None),
+            getattr(issue, "delta", None) or "",
+            created_at,
+        )
+
+    def write(self, issues: Iterable) -> int:
+        """
+        Inserts the issues, which can be a list or any iterator, batch_size issues per transaction
+        :param issues: Iterable of IssueRecords
+        :return: Number of issues that were inserted
+        """
+        inserted = 0
+        issues = iter(issues)
+        with self.lock:
+            while True:
+                batch = list(islice(issues, self.batch_size))
+                if not batch:
+                    break
+                with metrics.sink_send("sqlite", len(batch)):
+                    try:
+                        with self.connection:
+                            rows = [self.create_row(issue) for issue in batch]
+                            before = self.connection.total_changes
+                            self.connection.executemany(
+                                "INSERT OR IGNORE INTO issues (report_id, repo_id, package_id, alert_type_id, "
+                                "severity, key, props, introduced_by, manifests, is_error, direct, action, delta, "
+                                "created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                rows
+                            )
+                            inserted += self.connection.total_changes - before
+                    except Exception:
+                        # The lookup rows of the batch were rolled back with it
+                        self.clear_lookups()
+                        raise
+        log.debug(f"Inserted {inserted} issues into {self.file}")
+        return inserted
+
+    def query(self, sql: str, params: tuple = ()) -> list:
+        """
+        Runs a query against the database, I.E. against issues_view
+        :param sql: str - SQL query
+        :param params: tuple - Query parameters
+        :return: List of rows as dicts
+        """
+        with self.lock:
+            cursor = self.connection.execute(sql, params)
+            names = [column[0] for column in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
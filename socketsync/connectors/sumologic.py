@@ -1,6 +1,7 @@
 import requests
 import io
 import json
+from socketsync import metrics
 from socketsync.classes import IssueRecord
 
 
@@ -44,10 +45,12 @@ class Sumologic:
         """
 
         try:
-            response = requests.post(
-                self.http_source_url,
-                files=event_data
-            )
+            with metrics.sink_send("sumologic") as send_status:
+                response = requests.post(
+                    self.http_source_url,
+                    files=event_data
+                )
+                send_status["failed"] = response.status_code != 200
             if response.status_code == 200:
                 return {"status": "success", "message": "Event sent successfully."}
             else:
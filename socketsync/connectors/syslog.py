@@ -0,0 +1,318 @@
+import socket
+import ssl
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Iterable
+
+from socketsync import log, metrics
+from socketsync.classes import IssueRecord
+
+# Syslog severity of each Socket severity, RFC 5424 section 6.2.1
+syslog_severities = {
+    "critical": 2,
+    "high": 3,
+    "middle": 4,
+    "low": 5,
+}
+# CEF and LEEF severity of each Socket severity, 0 to 10
+event_severities = {
+    "critical": 10,
+    "high": 8,
+    "middle": 5,
+    "low": 3,
+}
+# CEF extension keys of the issue attributes, the six CEF custom strings are labelled with the attribute name
+cef_fields = [
+    ("cat", "category"),
+    ("act", "action"),
+    ("msg", "description"),
+    ("request", "pkg_url"),
+    ("externalId", "report_id"),
+]
+cef_custom_fields = [
+    "repo",
+    "branch",
+    "pkg_name",
+    "pkg_version",
+    "pkg_type",
+    "manifests",
+]
+leef_fields = [
+    "owner",
+    "repo",
+    "branch",
+    "commit",
+    "pr",
+    "report_id",
+    "pkg_type",
+    "pkg_name",
+    "pkg_version",
+    "pkg_id",
+    "pkg_url",
+    "category",
+    "key",
+    "action",
+    "manifests",
+    "title",
+    "description",
+]
+
+
+class Syslog:
+    host: str
+    port: int
+    protocol: str
+    format: str
+    framing: str
+    facility: int
+    app_name: str
+    hostname: str
+    buffer_bytes: int
+    timeout: int
+
+    def __init__(
+            self,
+            host: str,
+            port: int = 514,
+            protocol: str = "tcp",
+            format: str = "cef",
+            framing: str = "octet",
+            facility: int = 16,
+            app_name: str = "socket-sync",
+            hostname: str = None,
+            vendor: str = "Socket",
+            product: str = "Socket Sync",
+            version: str = "1.0",
+            buffer_bytes: int = 65536,
+            timeout: int = 10,
+            ca_file: str = None,
+            verify: bool = True
+    ):
+        """
+        Streams the issues as CEF or LEEF messages to a syslog receiver over one persistent connection. Messages are
+        RFC 5424 formatted and written in buffers of buffer_bytes.
+
+        :param host: Host of the syslog receiver
+        :param port: Port of the syslog receiver
+        :param protocol: tcp, tls or udp
+        :param format: cef or leef
+        :param framing: octet for octet counting (RFC 6587) or newline, only used for tcp and tls
+        :param facility: Syslog facility, defaults to 16 (local0)
+        :param app_name: APP-NAME of the messages
+        :param hostname: HOSTNAME of the messages, defaults to the name of this host
+        :param vendor: Device vendor in the CEF/LEEF header
+        :param product: Device product in the CEF/LEEF header
+        :param version: Device version in the CEF/LEEF header
+        :param buffer_bytes: Messages are buffered until this many bytes are pending. UDP sends each message on its own
+        :param timeout: Connect and send timeout in seconds
+        :param ca_file: CA bundle to verify the receiver certificate with, for tls
+        :param verify: Verify the receiver certificate, for tls
+        """
+        self.host = host
+        self.port = port
+        self.protocol = protocol.lower()
+        if self.protocol not in ("tcp", "tls", "udp"):
+            raise ValueError(f"Unsupported protocol {protocol}, use tcp, tls or udp")
+        self.format = format.lower()
+        if self.format not in ("cef", "leef"):
+            raise ValueError(f"Unsupported format {format}, use cef or leef")
+        self.framing = framing.lower()
+        if self.framing not in ("octet", "newline"):
+            raise ValueError(f"Unsupported framing {framing}, use octet or newline")
+        self.facility = facility
+        self.app_name = app_name
+        self.hostname = hostname or socket.gethostname()
+        self.buffer_bytes = buffer_bytes
+        self.timeout = timeout
+        self.ca_file = ca_file
+        self.verify = verify
+        header = [Syslog.escape_header(value) for value in (vendor, product, version)]
+        if self.format == "cef":
+            self.prefix = f"CEF:0|{header[0]}|{header[1]}|{header[2]}|"
+        else:
+            self.prefix = f"LEEF:1.0|{header[0]}|{header[1]}|{header[2]}|"
+        self.connection = None
+        self.buffer = bytearray()
+        self.pending = 0
+        self.last_timestamps = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def escape_header(value) -> str:
+        return str(value).replace("\\", "\\\\").replace("|", "\\|")
+
+    @staticmethod
+    def escape_cef(value) -> str:
+        value = str(value).replace("\\", "\\\\").replace("=", "\\=")
+        return value.replace("\r\n", "\\n").replace("\n", "\\n").replace("\r", "\\r")
+
+    @staticmethod
+    def escape_leef(value) -> str:
+        return str(value).replace("\t", " ").replace("\r\n", " ").replace("\n", " ").replace("\r", " ")
+
+    @staticmethod
+    def get_time(created_at: str) -> datetime:
+        if created_at:
+            try:
+                return datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+            except ValueError:
+                pass
+        return datetime.now(timezone.utc)
+
+    def get_timestamps(self, created_at: str) -> tuple:
+        # The issues of a report share its created_at, so the last one parsed is kept
+        last = self.last_timestamps
+        if created_at is None or last is None or created_at != last[0]:
+            date = Syslog.get_time(created_at)
+            last = (created_at, int(date.timestamp() * 1000), date.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z")
+            self.last_timestamps = last
+        return last[1], last[2]
+
+    def format_cef(self, issue: IssueRecord, created_at: int, severity: str) -> str:
+        name = getattr(issue, "title", None) or issue.type
+        header = (
+            f"{self.prefix}{Syslog.escape_header(issue.type)}|{Syslog.escape_header(name)}|"
+            f"{event_severities.get(severity, 0)}|"
+        )
+        extension = [f"rt={created_at}"]
+        for key, attribute in cef_fields:
+            value = getattr(issue, attribute, None)
+            if value is not None and value != "":
+                extension.append(f"{key}={Syslog.escape_cef(value)}")
+        for index, attribute in enumerate(cef_custom_fields, start=1):
+            value = getattr(issue, attribute, None)
+            if value is not None and value != "":
+                extension.append(f"cs{index}Label={attribute} cs{index}={Syslog.escape_cef(value)}")
+        return header + " ".join(extension)
+
+    def format_leef(self, issue: IssueRecord, created_at: int, severity: str) -> str:
+        attributes = [
+            f"devTime={created_at}",
+            "devTimeFormat=epoch",
+            f"sev={event_severities.get(severity, 0)}",
+            f"severity={Syslog.escape_leef(severity)}",
+        ]
+        for attribute in leef_fields:
+            value = getattr(issue, attribute, None)
+            if value is not None and value != "":
+                attributes.append(f"{attribute}={Syslog.escape_leef(value)}")
+        return f"{self.prefix}{Syslog.escape_header(issue.type)}|" + "\t".join(attributes)
+
+    def create_message(self, issue: IssueRecord) -> bytes:
+        """
+        Formats an issue as an RFC 5424 syslog message with a CEF or LEEF body
+        :param issue: IssueRecord
+        :return: Encoded message without framing
+        """
+        severity = getattr(issue, "severity", None) or ""
+        created_at, timestamp = self.get_timestamps(getattr(issue, "created_at", None))
+        if self.format == "cef":
+            body = self.format_cef(issue, created_at, severity)
+        else:
+            body = self.format_leef(issue, created_at, severity)
+        priority = self.facility * 8 + syslog_severities.get(severity, 6)
+        return f"<{priority}>1 {timestamp} {self.hostname} {self.app_name} - {issue.type} - {body}".encode("utf-8")
+
+    def connect(self) -> None:
+        if self.protocol == "udp":
+            address = socket.getaddrinfo(self.host, self.port, type=socket.SOCK_DGRAM)[0]
+            self.connection = socket.socket(address[0], socket.SOCK_DGRAM)
+            self.connection.connect(address[4])
+            return
+        connection = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.protocol == "tls":
+            context = ssl.create_default_context(cafile=self.ca_file)
+            if not self.verify:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            connection = context.wrap_socket(connection, server_hostname=self.host)
+        self.connection = connection
+
+    def send_events(self, events: Iterable) -> int:
+        """
+        Sends the issues, which can be a list or any iterator, and flushes the buffer
+        :param events: Iterable of IssueRecords
+        :return: Number of issues sent
+        """
+        sent = 0
+        for issue in events:
+            self.send(issue)
+            sent += 1
+        self.flush()
+        return sent
+
+    def send(self, issue: IssueRecord) -> None:
+        """
+        Adds an issue to the buffer and writes the buffer once it is full
+        :param issue: IssueRecord
+        :return:
+        """
+        message = self.create_message(issue)
+        with self.lock:
+            if self.protocol == "udp":
+                with metrics.sink_send("syslog"):
+                    self.write(message)
+                return
+            if self.framing == "octet":
+                self.buffer += f"{len(message)} ".encode("ascii")
+                self.buffer += message
+            else:
+                self.buffer += message
+                self.buffer += b"\n"
+            self.pending += 1
+            if len(self.buffer) >= self.buffer_bytes:
+                self.flush_buffer()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered messages
+        :return:
+        """
+        with self.lock:
+            self.flush_buffer()
+
+    def flush_buffer(self) -> None:
+        if not self.buffer:
+            return
+        data = bytes(self.buffer)
+        events = self.pending
+        self.buffer.clear()
+        self.pending = 0
+        with metrics.sink_send("syslog", events):
+            self.write(data)
+
+    def write(self, data: bytes) -> None:
+        # A persistent connection can be dropped by the receiver between writes, reconnect and retry once
+        for attempt in range(2):
+            if self.connection is None:
+                self.connect()
+            try:
+                self.connection.sendall(data)
+                return
+            except OSError as error:
+                self.close_connection()
+                if attempt == 1:
+                    raise
+                log.debug(f"Syslog connection to {self.host}:{self.port} failed, reconnecting: {error}")
+                time.sleep(0.1)
+
+    def close_connection(self) -> None:
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except OSError:
+                pass
+            self.connection = None
+
+    def close(self) -> None:
+        """
+        Writes the buffered messages and closes the connection
+        :return:
+        """
+        with self.lock:
+            try:
+                self.flush_buffer()
+            finally:
+                self.close_connection()
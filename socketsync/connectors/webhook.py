@@ -1,8 +1,14 @@
 import json
+import threading
 import urllib.parse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Iterable
 
 import requests
 import urllib
+from socketsync import log, metrics
+from socketsync.connectors import create_session
 
 
 class Webhook:
@@ -12,6 +18,11 @@ class Webhook:
     auth_headers: dict
     timeout: int
     url: str
+    batch_size: int
+    batch_format: str
+    fields: dict
+    max_in_flight: int
+    retries: int
 
     def __init__(
             self,
@@ -20,26 +31,60 @@ class Webhook:
             auth_headers: dict = None,
             method: str = "POST",
             params: dict = None,
-            timeout: int = 10
+            timeout: int = 10,
+            batch_size: int = 100,
+            batch_format: str = "json",
+            fields: [list, dict] = None,
+            max_in_flight: int = 4,
+            retries: int = 3
     ):
+        """
+        Sends issues to an HTTP endpoint, one per request with send or in batches with send_batch
+
+        :param url: URL of the WebHook
+        :param headers: Headers to use instead of the default ones
+        :param auth_headers: Headers added to the default ones to authenticate to the WebHook
+        :param method: HTTP method
+        :param params: Query parameters
+        :param timeout: Request timeout in seconds
+        :param batch_size: Number of issues per send_batch request
+        :param batch_format: json to send a JSON array or ndjson to send newline delimited JSON
+        :param fields: Issue fields to send with send_batch, a list of field names or a dict of payload name to
+            field name. Defaults to every field
+        :param max_in_flight: Maximum number of send_batch requests in flight at the same time
+        :param retries: Number of retries of send_batch requests answered with 429 or a 5xx status, see create_session
+        """
         self.headers = headers
         self.auth_headers = auth_headers
         self.method = method
         self.params = params
         self.timeout = timeout
         self.url = url
+        self.batch_size = batch_size
+        self.batch_format = batch_format.lower()
+        if self.batch_format not in ("json", "ndjson"):
+            raise ValueError(f"Unsupported batch format {batch_format}, use json or ndjson")
+        self.fields = fields
+        if isinstance(fields, (list, tuple)):
+            self.fields = {name: name for name in fields}
+        self.max_in_flight = max_in_flight
+        self.retries = retries
+        self.session = None
+        self.session_lock = threading.Lock()
 
     def send(self, payload: dict):
         headers = self.get_headers()
         url = self.create_url(self.url, self.params)
         data = json.dumps(payload)
-        response = requests.request(
-            self.method.upper(),
-            url,
-            headers=headers,
-            data=data,
-            timeout=self.timeout
-        )
+        with metrics.sink_send("webhook") as send_status:
+            response = requests.request(
+                self.method.upper(),
+                url,
+                headers=headers,
+                data=data,
+                timeout=self.timeout
+            )
+            send_status["failed"] = response.status_code != 200
         if response.status_code != 200:
             print("Failed to post data")
             print(response.text)
@@ -67,3 +112,66 @@ class Webhook:
         elif self.headers is not None:
             headers = self.headers
         return headers
+
+    def get_session(self) -> requests.Session:
+        with self.session_lock:
+            if self.session is None:
+                session = create_session(self.retries, self.max_in_flight)
+                self.session = session
+        return self.session
+
+    def create_record(self, issue) -> dict:
+        record = issue if isinstance(issue, dict) else issue.__dict__
+        if self.fields is None:
+            return record
+        return {name: record.get(field) for name, field in self.fields.items()}
+
+    def create_body(self, batch: list) -> bytes:
+        records = [self.create_record(issue) for issue in batch]
+        if self.batch_format == "ndjson":
+            return "\n".join(json.dumps(record) for record in records).encode("utf-8")
+        return json.dumps(records).encode("utf-8")
+
+    def send_batch(self, issues: Iterable) -> list:
+        """
+        Sends the issues, which can be a list or any iterator of IssueRecords or dicts, batch_size per request with
+        up to max_in_flight requests at the same time
+        :param issues: Iterable of IssueRecords or dicts
+        :return: List of errors, empty if every request was delivered
+        """
+        session = self.get_session()
+        headers = self.get_headers()
+        if self.batch_format == "ndjson" and self.headers is None:
+            headers["Content-Type"] = "application/x-ndjson"
+        url = self.create_url(self.url, self.params)
+        issues = iter(issues)
+        errors = []
+        in_flight = set()
+        with ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="webhook") as executor:
+            while True:
+                batch = list(islice(issues, self.batch_size))
+                if not batch:
+                    break
+                if len(in_flight) >= self.max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    errors.extend(error for error in (future.result() for future in done) if error is not None)
+                in_flight.add(executor.submit(self.post_batch, session, url, headers, batch))
+            for future in in_flight:
+                error = future.result()
+                if error is not None:
+                    errors.append(error)
+        return errors
+
+    def post_batch(self, session: requests.Session, url: str, headers: dict, batch: list) -> dict:
+        body = self.create_body(batch)
+        try:
+            with metrics.sink_send("webhook", len(batch)) as send_status:
+                response = session.request(self.method.upper(), url, headers=headers, data=body, timeout=self.timeout)
+                send_status["failed"] = response.status_code // 100 != 2
+        except requests.exceptions.RequestException as error:
+            log.error(f"Failed to send {len(batch)} issues to the WebHook: {error}")
+            return {"status_code": None, "response_text": str(error), "events": len(batch)}
+        if response.status_code // 100 != 2:
+            log.error(f"Failed to send {len(batch)} issues to the WebHook: {response.status_code} {response.text}")
+            return {"status_code": response.status_code, "response_text": response.text, "events": len(batch)}
+        return None
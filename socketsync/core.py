@@ -1,11 +1,22 @@
 import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
 import logging
 from socketdev import socketdev
+from socketsync import metrics, profiling
+from socketsync.checkpoint import Checkpoint
+from socketsync.fingerprints import FingerprintStore
 from socketsync.classes import Repository
-from socketsync.issues import AllIssues
+from socketsync.issues import get_issue_type
 from socketsync.licenses import Licenses
-from socketsync.classes import Report, IssueRecord, Package, Alert, Purl
+from socketsync.classes import Report, IssueRecord, Package, Alert, Purl, Diff
+from socketsync.filters import RepoFilter
+from socketsync.graph import ScanIndex
+from socketsync.policy import PolicyDecisions, compile_policy
 
 global encoded_key
 global socket
@@ -17,18 +28,28 @@ repos: dict
 socket: socketdev
 org_id: str
 org_slug: str
-filter_repos: list = []
+org_slugs: list = []
+org_policies: dict = {}
+org_decisions: dict = {}
+filter_repos: RepoFilter = RepoFilter()
 report_from_time: int
 actions: list[str]
 timeout = 30
 full_scan_path = ""
 repository_path = ""
-all_issues = AllIssues()
 licenses = Licenses()
 all_new_alerts = False
+new_alerts_only = False
+include_resolved_alerts = False
 default_branch_names = ["master", "main"]
 default_only = False
 security_policy = {}
+policy_decisions: PolicyDecisions
+issue_templates: dict = {}
+process_workers = 0
+process_shard_size = 2000
+process_pool: ProcessPoolExecutor = None
+process_pool_lock = threading.Lock()
 date_format = "%Y-%m-%d %H:%M"
 socket_date_format = "%Y-%m-%dT%H:%M:%S.%fZ"
 
@@ -52,6 +73,15 @@ class Core:
     enable_all_alerts: bool
     properties: list
     repos_filter: list
+    orgs: list
+    all_orgs: bool
+    org_workers: int
+    checkpoint: Checkpoint
+    profile: bool
+    process_workers: int
+    delta_mode: bool
+    include_resolved: bool
+    fingerprints: FingerprintStore
 
     def __init__(
         self,
@@ -67,6 +97,19 @@ class Core:
         actions_override: list = None,
         properties: list = None,
         repos_filter: list = None,
+        orgs: list = None,
+        all_orgs: bool = False,
+        org_workers: int = 4,
+        checkpoint_file: str = None,
+        metrics_port: int = None,
+        profile: bool = None,
+        profile_dir: str = None,
+        process_workers: int = None,
+        process_shard_size: int = None,
+        delta_mode: bool = False,
+        include_resolved: bool = False,
+        fingerprint_db: str = None,
+        fingerprint_ttl: int = None,
     ):
         self.actions_override = actions_override
         global actions
@@ -77,7 +120,7 @@ class Core:
         self.from_time = from_time
         if repos_filter is not None and len(repos_filter) > 0:
             global filter_repos
-            filter_repos = repos_filter
+            filter_repos = RepoFilter(repos_filter)
         self.properties = properties
         if self.default_branches is not None:
             global default_branch_names
@@ -108,26 +151,138 @@ class Core:
         if enable_all_alerts:
             global all_new_alerts
             all_new_alerts = True
+        self.delta_mode = delta_mode
+        self.include_resolved = include_resolved
+        global new_alerts_only, include_resolved_alerts
+        new_alerts_only = self.delta_mode
+        include_resolved_alerts = self.include_resolved
         self.plugins = {}
+        self.process_workers = process_workers
+        if self.process_workers is not None:
+            Core.set_process_workers(self.process_workers, process_shard_size)
+        self.orgs = orgs
+        self.all_orgs = all_orgs
+        self.org_workers = org_workers
+        self.checkpoint = None
+        if checkpoint_file is not None:
+            self.checkpoint = Checkpoint(checkpoint_file)
+        self.fingerprints = None
+        if fingerprint_db is not None:
+            if fingerprint_ttl is not None:
+                self.fingerprints = FingerprintStore(fingerprint_db, fingerprint_ttl)
+            else:
+                self.fingerprints = FingerprintStore(fingerprint_db)
+        if metrics_port is not None:
+            metrics.serve_metrics(metrics_port)
+        if profile is None:
+            profile = os.getenv(profiling.profile_env_var, "").lower() in ("1", "true", "yes")
+        self.profile = profile
+        if self.profile and profiling.get_profiler() is None:
+            if profile_dir is None:
+                profile_dir = os.getenv(profiling.profile_dir_env_var) or "socketsync-profiles"
+            profiling.set_profiler(profiling.Profiler(output_dir=profile_dir))
+        licenses.check()
         global socket
         socket = socketdev(token=self.api_key, timeout=timeout)
-        Core.set_org_vars()
+        Core.instrument_client(socket)
+        Core.set_org_vars(self.orgs, self.all_orgs)
+
+    @staticmethod
+    def stop_profiling() -> str:
+        """
+        Writes the profile report of the run and disables profiling. Call it once the issues were sent to the
+        connectors so that their sends are included in the report
+        :return: Path of the report, None if profiling is not enabled
+        """
+        return profiling.stop()
+
+    @staticmethod
+    def instrument_client(client: socketdev) -> None:
+        """
+        Wraps the request method of the Socket SDK client to record the number, duration, failures and response bytes
+        of every API call
+        :param client: socketdev - Socket SDK client
+        :return:
+        """
+        api = getattr(client, "api", None)
+        if api is None or getattr(api, "instrumented", False):
+            return
+        do_request = api.do_request
+
+        def instrumented_request(path: str, *args, **kwargs):
+            endpoint = Core.endpoint_name(path)
+            start = time.perf_counter()
+            try:
+                response = do_request(path, *args, **kwargs)
+            except Exception:
+                metrics.increment("socketsync_api_errors_total", endpoint=endpoint)
+                raise
+            finally:
+                metrics.increment("socketsync_api_calls_total", endpoint=endpoint)
+                metrics.observe("socketsync_api_call_seconds", time.perf_counter() - start, endpoint=endpoint)
+            metrics.increment("socketsync_api_bytes_total", len(response.content), endpoint=endpoint)
+            return response
+
+        api.do_request = instrumented_request
+        api.instrumented = True
+
+    @staticmethod
+    def endpoint_name(path: str) -> str:
+        """
+        Replaces the Org slug and IDs in an API path so that calls to the same endpoint share one metric label
+        :param path: str - API path, I.E. orgs/example/full-scans/1234/metadata
+        :return:
+        """
+        parts = path.split("?", 1)[0].split("/")
+        for index in range(1, len(parts)):
+            if parts[index - 1] in ("orgs", "full-scans", "repos") and parts[index] != "diff":
+                parts[index] = "{id}"
+        return "/".join(parts)
 
     @staticmethod
-    def set_org_vars() -> None:
+    def set_org_vars(orgs: list = None, all_orgs: bool = False) -> None:
         """
         Sets the main shared global variables
+        :param orgs: list - Optional list of Org Slugs to sync instead of the single Org for the API Token
+        :param all_orgs: bool - If enabled sync every Org visible to the API Token
         :return:
         """
         log.debug("Getting Organization Configuration")
-        global org_id, org_slug, full_scan_path, repository_path, security_policy
-        org_id, org_slug = Core.get_org_id_slug()
+        global org_id, org_slug, full_scan_path, repository_path, security_policy, org_slugs, org_policies
+        global org_decisions, policy_decisions
+        if orgs or all_orgs:
+            visible_orgs = Core.get_orgs()
+            if all_orgs:
+                org_slugs = list(visible_orgs.values())
+            else:
+                org_slugs = []
+                for slug in orgs:
+                    if slug not in visible_orgs.values():
+                        log.warning(f"Org {slug} is not visible to the API Token and will be skipped")
+                        continue
+                    org_slugs.append(slug)
+            if len(org_slugs) == 0:
+                raise Exception("No organizations available to sync for the API Token")
+            org_slug = org_slugs[0]
+            for key in visible_orgs:
+                if visible_orgs[key] == org_slug:
+                    org_id = key
+        else:
+            org_id, org_slug = Core.get_org_id_slug()
+            org_slugs = [org_slug]
+        org_policies = {}
+        org_decisions = {}
+        for slug in org_slugs:
+            org_policies[slug] = Core.get_security_policy(slug)
+            org_decisions[slug] = compile_policy(org_policies[slug], actions, all_new_alerts)
         base_path = f"orgs/{org_slug}"
         full_scan_path = f"{base_path}/full-scans"
         repository_path = f"{base_path}/repos"
-        security_policy = Core.get_security_policy()
+        security_policy = org_policies[org_slug]
+        policy_decisions = org_decisions[org_slug]
         output = {
             "org_id": org_id,
+            "org_slugs": org_slugs,
             "base_path": base_path,
             "full_scan_path": full_scan_path,
             "repository_path": repository_path,
@@ -147,6 +302,34 @@ class Core:
         timeout = request_timeout
         socketdev.set_timeout(timeout)
 
+    @staticmethod
+    def set_process_workers(workers: int, shard_size: int = None) -> None:
+        """
+        Sets the number of worker processes used to extract the Issue Alerts from the scans. 0 or 1 extracts them in
+        the calling thread.
+        :param workers: int - Number of worker processes
+        :param shard_size: int - Maximum number of packages sent to a worker at a time, large scans are split into
+            shards of this size
+        :return:
+        """
+        global process_workers, process_shard_size, process_pool
+        log.debug(f"Extracting alerts with {workers} worker processes")
+        with process_pool_lock:
+            if process_pool is not None and workers != process_workers:
+                process_pool.shutdown()
+                process_pool = None
+            process_workers = workers
+            if shard_size is not None:
+                process_shard_size = shard_size
+
+    @staticmethod
+    def get_process_pool() -> ProcessPoolExecutor:
+        global process_pool
+        with process_pool_lock:
+            if process_pool is None:
+                process_pool = ProcessPoolExecutor(max_workers=process_workers, initializer=profiling.disable)
+            return process_pool
+
     @staticmethod
     def get_org_id_slug() -> (str, str):
         """
@@ -164,31 +347,51 @@ class Core:
         return new_org_id, new_org_slug
 
     @staticmethod
-    def get_security_policy() -> dict:
+    def get_orgs() -> dict:
+        """
+        Gets all the Orgs visible to the API Token
+        :return: Dict of Org ID to Org Slug
+        """
+        organizations = socket.org.get()
+        orgs = organizations.get("organizations") or {}
+        visible_orgs = {}
+        for key in orgs:
+            visible_orgs[key] = orgs[key].get("slug")
+        return visible_orgs
+
+    @staticmethod
+    def get_security_policy(org: str = None) -> dict:
         """
         Get the Security policy and determine the effective Org security policy
+        :param org: str - Org Slug to get the policy for, defaults to the Org for the API Token
         :return:
         """
-        response = socket.settings.get(org_slug)
+        if org is None:
+            org = org_slug
+        response = socket.settings.get(org)
         org_rules = response.get('securityPolicyRules')
         if org_rules is None:
             raise Exception("Unable to get security policy results")
         return org_rules
 
     @staticmethod
-    def get_latest_default_branch() -> list:
+    def get_latest_default_branch(org: str = None, from_timestamp: int = None) -> list:
         log.debug("Looking for latest default branches")
+        if org is None:
+            org = org_slug
+        if from_timestamp is None:
+            from_timestamp = report_from_time
+        from_time = datetime.fromtimestamp(int(from_timestamp), timezone.utc)
         all_reports = []
-        Core.get_repos()
-        for repo_id in repos:
+        org_repos = Core.get_repos(org)
+        for repo_id in org_repos:
             repo: Repository
-            repo = repos[repo_id]
+            repo = org_repos[repo_id]
             if repo.head_full_scan_id is not None and repo.head_full_scan_id != "":
                 try:
-                    report_data = socket.fullscans.metadata(org_slug, repo.head_full_scan_id)
+                    report_data = socket.fullscans.metadata(org, repo.head_full_scan_id)
                     report = Report(**report_data)
-                    from_time = datetime.now() - timedelta(seconds=int(report_from_time))
-                    created_at = datetime.strptime(report.created_at, socket_date_format)
+                    created_at = datetime.strptime(report.created_at, socket_date_format).replace(tzinfo=timezone.utc)
                     if created_at > from_time:
                         all_reports.append(report)
                 except Exception as error:
@@ -197,73 +400,147 @@ class Core:
         return all_reports
 
     @staticmethod
-    def get_repos() -> None:
+    def get_repos(org: str = None) -> dict:
+        if org is None:
+            org = org_slug
         repos_info = {}
         params = {"sort": "name", "direction": "asc", "per_page": "10", "page": 1}
-        repos_data = socket.repos.get(org_slug, **params)
+        repos_data = socket.repos.get(org, **params)
         log.info(f"Found {len(repos_data['results'])} repositories")
         all_repos = repos_data["results"]
         next_page = repos_data["nextPage"]
         while next_page is not None:
             params["page"] = next_page
-            repos_data = socket.repos.get(org_slug, **params)
+            repos_data = socket.repos.get(org, **params)
             all_repos.extend(repos_data["results"])
             next_page = repos_data["nextPage"]
             if next_page == 0:
                 next_page = None
         for repo_data in all_repos:
             repo = Repository(**repo_data)
-            if len(filter_repos) > 0 and repo.name not in filter_repos:
+            if filter_repos and repo.name not in filter_repos:
                 continue
             repos_info[repo.id] = repo
         global repos
         repos = repos_info
-        return
+        return repos_info
 
     @staticmethod
     def create_reports_list(raw_reports: dict, report_id: str = None) -> list:
         reports = []
-        commits = []
+        commits = set()
         for raw_report in raw_reports:
             report = Report(**raw_report)
-            if len(filter_repos) > 0 and report.repo not in filter_repos:
+            if filter_repos and report.repo not in filter_repos:
                 continue
             if report_id is not None and report_id == report.id:
                 reports.append(report)
             elif report_id is None:
                 if report.commit not in commits or report.commit is None or report.commit == "":
                     reports.append(report)
-                    commits.append(report.commit)
+                    commits.add(report.commit)
                 else:
                     reports.append(report)
         return reports
 
     def get_issues(self) -> list:
-        reports = self.get_reports()
+        issue_templates.clear()
+        if len(org_slugs) > 1:
+            return self.get_org_issues()
+        return self.sync_org(org_slug)
 
-        log.debug(f"Found {len(reports)} Socket Scans")
-        issues = Core.handle_reports(reports, [])
+    def get_org_issues(self) -> list:
+        """
+        Syncs all the configured Orgs in parallel, limited to org_workers at a time, and merges the results into a
+        single list of issues ordered by Org. An Org that fails to sync is logged and skipped so that it does not stop
+        the other Orgs and its checkpoint is not advanced.
+        :return:
+        """
+        org_issues = {}
+        with ThreadPoolExecutor(max_workers=self.org_workers) as executor:
+            futures = {executor.submit(self.sync_org, slug): slug for slug in org_slugs}
+            for future in as_completed(futures):
+                slug = futures[future]
+                try:
+                    org_issues[slug] = future.result()
+                except Exception as error:
+                    log.error(f"Unable to sync org {slug}")
+                    log.error(error)
+        issues = []
+        for slug in org_slugs:
+            issues.extend(org_issues.get(slug, []))
         return issues
 
-    def get_reports(self) -> list:
+    def sync_org(self, org: str) -> list:
+        """
+        Gets the issues for a single Org. If a checkpoint file is configured the Org resumes from its last successful
+        sync, and the start of this sync is staged so that commit_checkpoints can advance the checkpoint.
+        :param org: str - Org Slug to sync
+        :return:
+        """
+        sync_started = int(datetime.now(timezone.utc).timestamp())
+        from_timestamp = report_from_time
+        if self.checkpoint is not None:
+            from_timestamp = self.checkpoint.get(org, report_from_time)
+        reports = self.get_reports(org, from_timestamp)
+        log.debug(f"Found {len(reports)} Socket Scans for org {org}")
+        issues = Core.handle_reports(reports, [], org)
+        if self.fingerprints is not None:
+            issue_count = len(issues)
+            issues = self.fingerprints.filter(issues)
+            metrics.increment("socketsync_alerts_suppressed_total", issue_count - len(issues), org=org)
+        if self.checkpoint is not None:
+            self.checkpoint.stage(org, sync_started)
+        return issues
+
+    def mark_delivered(self, issues: list) -> None:
+        """
+        Records the issues as delivered in the fingerprint store so later runs do not return them again. Call it
+        after the issues were sent to the connectors.
+        :param issues: list - IssueRecords that were delivered
+        :return:
+        """
+        if self.fingerprints is not None:
+            self.fingerprints.mark_delivered(issues)
+
+    def commit_checkpoints(self) -> None:
+        """
+        Advances the checkpoint of every Org synced by get_issues so the next run resumes from this sync. Call it
+        after the issues were sent to the connectors so that a failed delivery is synced again on the next run.
+        :return:
+        """
+        if self.checkpoint is not None:
+            self.checkpoint.commit()
+
+    def get_reports(self, org: str = None, from_timestamp: int = None) -> list:
+        if org is None:
+            org = org_slug
+        if from_timestamp is None:
+            from_timestamp = report_from_time
+        with profiling.section("get_reports", org):
+            with metrics.timer("socketsync_stage_seconds", stage="get_reports", org=org):
+                reports = self.fetch_reports(org, from_timestamp)
+        metrics.increment("socketsync_reports_found_total", len(reports), org=org)
+        return reports
+
+    def fetch_reports(self, org: str, from_timestamp: int) -> list:
         if self.report_id is not None:
-            report_data = socket.fullscans.metadata(org_slug, self.report_id)
+            report_data = socket.fullscans.metadata(org, self.report_id)
             report = Report(**report_data)
             return [report]
 
         if self.default_branch_only:
-            reports = Core.get_latest_default_branch()
+            reports = Core.get_latest_default_branch(org, from_timestamp)
             return reports
 
         done = False
         reports = []
         next_page = None
-        print(report_from_time)
         while not done:
             if next_page == 0:
                 done = True
-            params = {"per_page": 100, "from": int(report_from_time), "page": next_page}
-            results = socket.fullscans.get(org_slug, params)
+            params = {"per_page": 100, "from": int(from_timestamp), "page": next_page}
+            results = socket.fullscans.get(org, params)
             next_page = results.get("nextPage")
             if results.get("success") is False:
                 log.error(f"Unable to get full scans: {results.get('message')}")
@@ -278,123 +555,521 @@ class Core:
         return reports
 
     @staticmethod
-    def handle_reports(reports: list, issues: list) -> list:
+    def handle_reports(reports: list, issues: list, org: str = None) -> list:
+        if org is None:
+            org = org_slug
+        decisions = org_decisions.get(org, policy_decisions)
+        previous_scans = None
+        if new_alerts_only:
+            reports = sorted(reports, key=lambda item: item.created_at or "")
+            previous_scans = {}
+        seen = {Core.issue_identity(issue) for issue in issues}
+        if process_workers > 1:
+            return Core.handle_reports_parallel(reports, issues, org, decisions, previous_scans, seen)
         for report in reports:
             # report: Report
-            if len(filter_repos) > 0 and report.repo not in filter_repos:
+            if filter_repos and report.repo not in filter_repos:
                 continue
-            log.debug(f"Getting results for report id {report.id}")
-            log.debug(f"Getting results for scan id {report.id}")
-            packages = socket.fullscans.stream(org_slug, report.id)
+            with profiling.section("handle_reports", report.id):
+                issues = Core.handle_report(report, issues, org, decisions, previous_scans, seen)
+        return issues
 
-            if packages.get("success") is False:
-                log.error(f"Unable to stream full scan {report.id}: {packages.get('message')}")
-                raise Exception(packages.get("message"))
+    @staticmethod
+    def stream_report(report: Report, org: str) -> dict:
+        log.debug(f"Getting results for report id {report.id}")
+        log.debug(f"Getting results for scan id {report.id}")
+        packages = socket.fullscans.stream(org, report.id)
 
-            if packages.get("success"):
-                del packages["success"]
-            if packages.get("status"):
-                del packages["status"]
+        if packages.get("success") is False:
+            log.error(f"Unable to stream full scan {report.id}: {packages.get('message')}")
+            raise Exception(packages.get("message"))
+
+        if packages.get("success"):
+            del packages["success"]
+        if packages.get("status"):
+            del packages["status"]
+        return packages
 
-            log.debug(f"Finding issues in {report.id}")
+    @staticmethod
+    def handle_report(
+            report: Report,
+            issues: list,
+            org: str,
+            decisions: PolicyDecisions,
+            previous_scans: dict = None,
+            seen: set = None
+    ) -> list:
+        """
+        Streams a single scan and adds the Issue Alerts found in its packages
+        :param report: Report - Scan to process
+        :param issues: list - All found Issue Alerts so far
+        :param org: str - Org Slug the scan belongs to
+        :param decisions: PolicyDecisions - Compiled security policy of the Org
+        :param previous_scans: dict - Alerts of the last scan per repo and branch, only adds the alerts that changed
+            since the previous scan when set
+        :param seen: set - Identities of the found Issue Alerts, see add_issue_rows
+        :return:
+        """
+        scan_start = time.perf_counter()
+        packages = Core.stream_report(report, org)
+        log.debug(f"Finding issues in {report.id}")
+        issue_count = len(issues)
+        if previous_scans is not None:
+            rows = Core.get_scan_rows(packages, decisions, report.id)
+            issues = Core.add_delta_rows(rows, set(packages), issues, report, org, decisions, previous_scans, seen)
+        else:
+            index = ScanIndex(packages)
             for package_id in packages:
                 package: Package
                 package = Package(**packages[package_id])
-                issues = Core.create_issue_alerts(package, issues, packages, report)
+                with profiling.section("create_issue_alerts", report.id):
+                    issues = Core.create_issue_alerts(package, issues, packages, report, decisions, seen, index)
+        Core.record_report_metrics(org, len(packages), len(issues) - issue_count, scan_start)
         return issues
 
     @staticmethod
-    def create_issue_alerts(package: Package, alerts: list, packages: dict, report: Report) -> list:
+    def record_report_metrics(org: str, package_count: int, issue_count: int, scan_start: float) -> None:
+        metrics.increment("socketsync_reports_processed_total", org=org)
+        metrics.increment("socketsync_packages_parsed_total", package_count, org=org)
+        metrics.increment("socketsync_alerts_emitted_total", issue_count, org=org)
+        metrics.observe("socketsync_scan_seconds", time.perf_counter() - scan_start, org=org)
+
+    @staticmethod
+    def handle_reports_parallel(
+            reports: list,
+            issues: list,
+            org: str,
+            decisions: PolicyDecisions,
+            previous_scans: dict = None,
+            seen: set = None
+    ) -> list:
+        """
+        Extracts the Issue Alerts in worker processes. Scans are streamed in this thread while the workers process the
+        previous ones, and the results are added in the order of the reports so the output matches handle_reports.
+        At most two scans per worker are kept in memory at a time.
+        :param reports: list - Reports to process
+        :param issues: list - All found Issue Alerts so far
+        :param org: str - Org Slug the scans belong to
+        :param decisions: PolicyDecisions - Compiled security policy of the Org
+        :param previous_scans: dict - Alerts of the last scan per repo and branch for delta mode
+        :param seen: set - Identities of the found Issue Alerts, see add_issue_rows
+        :return:
+        """
+        executor = Core.get_process_pool()
+        pending = deque()
+
+        def add_results() -> list:
+            report, shards, package_ids, scan_start = pending.popleft()
+            with profiling.section("handle_reports", report.id):
+                issue_count = len(issues)
+                result = issues
+                if previous_scans is not None:
+                    rows = []
+                    for shard in shards:
+                        rows.extend(shard.result())
+                    result = Core.add_delta_rows(
+                        rows, package_ids, result, report, org, decisions, previous_scans, seen
+                    )
+                else:
+                    for shard in shards:
+                        result = Core.add_issue_rows(shard.result(), result, report, decisions, seen=seen)
+                Core.record_report_metrics(org, len(package_ids), len(result) - issue_count, scan_start)
+            return result
+
+        for report in reports:
+            if filter_repos and report.repo not in filter_repos:
+                continue
+            scan_start = time.perf_counter()
+            packages = Core.stream_report(report, org)
+            shards = []
+            for shard_packages, package_ids in Core.shard_scan(packages, process_shard_size):
+                shards.append(executor.submit(extract_alerts, shard_packages, package_ids, decisions))
+            pending.append((report, shards, set(packages), scan_start))
+            del packages
+            while len(pending) > process_workers * 2:
+                issues = add_results()
+        while pending:
+            issues = add_results()
+        return issues
+
+    @staticmethod
+    def get_scan_rows(packages: dict, decisions: PolicyDecisions, report_id: str = None) -> list:
+        rows = []
+        index = ScanIndex(packages)
+        for package_id in packages:
+            package: Package
+            package = Package(**packages[package_id])
+            with profiling.section("create_issue_alerts", report_id):
+                rows.extend(Core.get_alert_rows(package, packages, decisions, report_id, index))
+        return rows
+
+    @staticmethod
+    def alert_identity(row: tuple) -> tuple:
+        """
+        Identity of an alert across scans, the package ID, alert type and alert key
+        :param row: tuple - Alert row from get_alert_rows
+        :return:
+        """
+        return row[3], row[4], row[7]
+
+    @staticmethod
+    def add_delta_rows(
+            rows: list,
+            package_ids: set,
+            issues: list,
+            report: Report,
+            org: str,
+            decisions: PolicyDecisions,
+            previous_scans: dict,
+            seen: set = None
+    ) -> list:
+        """
+        Compares the alerts of a scan against the previous scan of the same repo and branch and only adds the Issue
+        Alerts that were introduced, plus the resolved ones if include_resolved is enabled. A scan without a previous
+        scan adds all of its alerts.
+        :param rows: list - Alert rows of the scan
+        :param package_ids: set - Package IDs in the scan
+        :param issues: list - All found Issue Alerts so far
+        :param report: Report - Scan the rows belong to
+        :param org: str - Org Slug the scan belongs to
+        :param decisions: PolicyDecisions - Compiled security policy of the Org
+        :param previous_scans: dict - (repo, branch) -> (scan ID, alert rows by identity, package IDs) of the last scan
+            processed in this run, updated with the current scan
+        :param seen: set - Identities of the found Issue Alerts, see add_issue_rows
+        :return:
+        """
+        current = {}
+        for row in rows:
+            current.setdefault(Core.alert_identity(row), row)
+        scan_key = (report.repo, report.branch)
+        previous = previous_scans.get(scan_key)
+        if previous is None:
+            previous = Core.get_previous_scan(report, org, decisions)
+        previous_scans[scan_key] = (report.id, current, package_ids)
+        diff = Core.create_diff(report.id, previous, current, package_ids)
+        unchanged = len(current) - len(diff.new_alerts)
+        log.debug(
+            f"Scan {report.id} has {len(diff.new_alerts)} new, {len(diff.removed_alerts)} resolved and {unchanged} "
+            f"unchanged alerts"
+        )
+        metrics.increment("socketsync_alerts_unchanged_total", unchanged, org=org)
+        issues = Core.add_issue_rows(diff.new_alerts, issues, report, decisions, "added", seen)
+        if include_resolved_alerts:
+            issues = Core.add_issue_rows(diff.removed_alerts, issues, report, decisions, "resolved", seen)
+        return issues
+
+    @staticmethod
+    def get_previous_report(report: Report, org: str) -> Report:
+        """
+        Gets the scan of the same repo and branch that was created before the report. The scans of the branch are
+        paged newest first until one older than the report is found, so newer scans of a busy branch are skipped.
+        :param report: Report - Current scan
+        :param org: str - Org Slug the scan belongs to
+        :return: The previous scan or None if this is the first scan of the branch
+        """
+        params = {
+            "repo": report.repo,
+            "branch": report.branch,
+            "sort": "created_at",
+            "direction": "desc",
+            "per_page": 100,
+            "page": 1
+        }
+        while params["page"]:
+            results = socket.fullscans.get(org, params)
+            for report_data in results.get("results") or []:
+                previous = Report(**report_data)
+                if previous.id != report.id and (previous.created_at or "") < (report.created_at or ""):
+                    return previous
+            params["page"] = results.get("nextPage")
+        return None
+
+    @staticmethod
+    def get_previous_scan(report: Report, org: str, decisions: PolicyDecisions) -> tuple:
+        """
+        Streams the previous scan of the repo and branch of the report and finds its alerts
+        :param report: Report - Current scan
+        :param org: str - Org Slug the scan belongs to
+        :param decisions: PolicyDecisions - Compiled security policy of the Org
+        :return: (scan ID, alert rows by identity, package IDs) or None if there is no previous scan
+        """
+        previous_report = Core.get_previous_report(report, org)
+        if previous_report is None:
+            log.debug(f"No previous scan found for {report.repo} {report.branch}")
+            return None
+        log.debug(f"Comparing scan {report.id} against previous scan {previous_report.id}")
+        packages = Core.stream_report(previous_report, org)
+        rows = {}
+        for row in Core.get_scan_rows(packages, decisions, previous_report.id):
+            rows.setdefault(Core.alert_identity(row), row)
+        return previous_report.id, rows, set(packages)
+
+    @staticmethod
+    def create_diff(report_id: str, previous: tuple, current: dict, package_ids: set) -> Diff:
+        """
+        Creates the Diff between the previous scan and the current scan
+        :param report_id: str - ID of the current scan
+        :param previous: tuple - (scan ID, alert rows by identity, package IDs) of the previous scan or None
+        :param current: dict - Alert rows by identity of the current scan
+        :param package_ids: set - Package IDs of the current scan
+        :return:
+        """
+        diff = Diff(id=report_id)
+        if previous is None:
+            diff.new_alerts = list(current.values())
+            diff.new_packages = list(package_ids)
+            return diff
+        _, previous_rows, previous_package_ids = previous
+        diff.new_alerts = [row for identity, row in current.items() if identity not in previous_rows]
+        diff.removed_alerts = [row for identity, row in previous_rows.items() if identity not in current]
+        diff.new_packages = [package_id for package_id in package_ids if package_id not in previous_package_ids]
+        diff.removed_packages = [
+            package_id for package_id in previous_package_ids if package_id not in package_ids
+        ]
+        return diff
+
+    @staticmethod
+    def shard_scan(packages: dict, shard_size: int) -> list:
+        """
+        Splits a scan into shards of at most shard_size packages. Each shard also carries the top level ancestors of its
+        packages so the introduced by data can be built without the rest of the scan.
+        :param packages: dict - All packages of the scan
+        :param shard_size: int - Maximum number of packages to extract alerts from per shard
+        :return: List of (packages, package_ids) tuples
+        """
+        package_ids = list(packages)
+        if len(package_ids) <= shard_size:
+            return [(packages, package_ids)]
+        shards = []
+        for start in range(0, len(package_ids), shard_size):
+            shard_ids = package_ids[start:start + shard_size]
+            shard_packages = {}
+            for package_id in shard_ids:
+                package_data = packages[package_id]
+                shard_packages[package_id] = package_data
+                for top_id in package_data.get("topLevelAncestors") or []:
+                    if top_id in packages:
+                        shard_packages[top_id] = packages[top_id]
+            shards.append((shard_packages, shard_ids))
+        return shards
+
+    @staticmethod
+    def create_issue_alerts(
+            package: Package,
+            alerts: list,
+            packages: dict,
+            report: Report,
+            decisions: PolicyDecisions = None,
+            seen: set = None,
+            index: ScanIndex = None
+    ) -> list:
         """
         Create the Issue Alerts from the package and base alert data.
         :param package: Package - Current package that is being looked at for Alerts
         :param alerts: Dict - All found Issue Alerts across all packages
         :param packages: Dict - All packages detected in the SBOM and needed to find top level packages
         :param report: Report - Report object
+        :param decisions: PolicyDecisions - Compiled security policy of the Org the report belongs to, defaults to the
+            main Org policy
+        :param seen: set - Identities of the found Issue Alerts, see add_issue_rows
+        :param index: ScanIndex - Dependency graph of the scan, see get_source_data
         :return:
         """
+        if decisions is None:
+            decisions = policy_decisions
+        rows = Core.get_alert_rows(package, packages, decisions, report.id, index)
+        return Core.add_issue_rows(rows, alerts, report, decisions, seen=seen)
+
+    @staticmethod
+    def get_alert_rows(
+            package: Package,
+            packages: dict,
+            decisions: PolicyDecisions,
+            report_id: str = None,
+            index: ScanIndex = None
+    ) -> list:
+        """
+        Finds the alerts of a package that are included by the security policy
+        :param package: Package - Current package that is being looked at for Alerts
+        :param packages: Dict - All packages detected in the SBOM and needed to find top level packages
+        :param decisions: PolicyDecisions - Compiled security policy
+        :param report_id: str - Scan the package belongs to, only used for profiling
+        :param index: ScanIndex - Dependency graph of the scan, see get_source_data
+        :return: List of (pkg_type, pkg_name, pkg_version, pkg_id, type, severity, category, key, props, introduced_by,
+            direct) tuples
+        """
+        rows = []
+        introduced_by = None
         for item in package.alerts:
             alert = Alert(**item)
-            try:
-                props = getattr(all_issues, alert.type)
-            except AttributeError:
-                # log.warning(f"Unable to get issue type props: {alert.type}")
-                props = None
-            if props is not None:
-                description = props.description
-                title = props.title
-                suggestion = props.suggestion
-                next_step_title = props.nextStepTitle
-            else:
-                description = ""
-                title = None
-                suggestion = ""
-                next_step_title = ""
-            introduced_by = Core.get_source_data(package, packages)
-            pr = str(report.pull_request)
-            is_error = Core.is_error(alert)
-            issue_alert = IssueRecord(
-                owner=report.owner,
-                repo=report.repo,
-                branch=report.branch,
-                report_id=report.id,
-                pr=pr,
-                commit=report.commit,
-                created_at=report.created_at,
-                pkg_type=package.type,
-                pkg_name=package.name,
-                pkg_version=package.version,
-                pkg_id=package.id,
-                type=alert.type,
-                severity=alert.severity,
-                category=alert.category,
-                key=alert.key,
-                props=alert.props,
-                description=description,
-                title=title,
-                suggestion=suggestion,
-                next_step_title=next_step_title,
-                introduced_by=introduced_by,
-                is_error=is_error,
-                direct=package.direct,
+            if not decisions[alert.type].include:
+                continue
+            if introduced_by is None:
+                with profiling.section("get_source_data", report_id):
+                    introduced_by = Core.get_source_data(package, packages, index)
+            rows.append((
+                package.type,
+                package.name,
+                package.version,
+                package.id,
+                alert.type,
+                alert.severity,
+                alert.category,
+                alert.key,
+                alert.props,
+                introduced_by,
+                package.direct,
+            ))
+        return rows
+
+    @staticmethod
+    def issue_identity(issue: IssueRecord) -> tuple:
+        """
+        Identity of an Issue Alert within a run. Two Issue Alerts with the same identity have the same attributes, so
+        it replaces comparing the Issue Alerts attribute by attribute.
+        :param issue: IssueRecord
+        :return:
+        """
+        return issue.report_id, issue.pkg_id, issue.type, issue.key, getattr(issue, "delta", None)
+
+    @staticmethod
+    def get_issue_template(row: tuple) -> tuple:
+        """
+        Gets the report independent part of an Issue Alert for a package alert. Templates are cached for the run keyed
+        by package ID, alert type and alert key, so a package@version found in many scans is only looked up once.
+        :param row: tuple - Alert row from get_alert_rows
+        :return: Template for IssueRecord.from_template
+        """
+        template_key = (row[3], row[4], row[7])
+        template = issue_templates.get(template_key)
+        if template is not None:
+            return template
+        pkg_type, pkg_name, pkg_version, pkg_id, alert_type, severity, category, key, alert_props = row[:9]
+        props = get_issue_type(alert_type)
+        if props is not None:
+            description = props.description
+            title = props.title
+            suggestion = props.suggestion
+            next_step_title = props.nextStepTitle
+        else:
+            description = ""
+            title = None
+            suggestion = ""
+            next_step_title = ""
+        fields = {
+            "pkg_type": pkg_type,
+            "pkg_name": pkg_name,
+            "pkg_version": pkg_version,
+            "pkg_id": pkg_id,
+            "type": alert_type,
+            "severity": severity,
+            "category": category,
+            "key": key,
+            "props": alert_props,
+            "description": description,
+            "title": title,
+            "suggestion": suggestion,
+            "next_step_title": next_step_title,
+        }
+        defaults = {
+            "manifests": "",
+            "warn": False,
+            "error": False,
+            "ignore": False,
+            "monitor": False,
+            "pkg_url": f"https://socket.dev/{pkg_type}/package/{pkg_name}/overview/{pkg_version}",
+        }
+        template = (fields, defaults)
+        issue_templates[template_key] = template
+        return template
+
+    @staticmethod
+    def add_issue_rows(
+            rows: list,
+            alerts: list,
+            report: Report,
+            decisions: PolicyDecisions,
+            delta: str = None,
+            seen: set = None
+    ) -> list:
+        """
+        Creates the Issue Alerts for alert rows from get_alert_rows and adds them to the found Issue Alerts
+        :param rows: list - Alert rows of a package or a scan
+        :param alerts: list - All found Issue Alerts across all packages
+        :param report: Report - Report the rows belong to
+        :param decisions: PolicyDecisions - Compiled security policy
+        :param delta: str - Set in delta mode, added or resolved
+        :param seen: set - Identities of the Issue Alerts in alerts, updated with the added ones. Duplicates are found
+            by comparing against every Issue Alert in alerts when not set
+        :return:
+        """
+        created_at = report.created_at
+        if created_at is not None:
+            created_at = created_at.strip(" (Coordinated Universal Time)")
+        report_fields = {
+            "owner": report.owner,
+            "pr": str(report.pull_request),
+            "commit": report.commit,
+            "created_at": created_at,
+            "repo": report.repo,
+            "branch": report.branch,
+            "report_id": report.id,
+        }
+        keep_duplicates = actions is not None and not all_new_alerts
+        for row in rows:
+            if not keep_duplicates and seen is not None:
+                identity = (report.id, row[3], row[4], row[7], delta)
+                if identity in seen:
+                    continue
+            decision = decisions[row[4]]
+            issue_alert = IssueRecord.from_template(
+                report_fields,
+                Core.get_issue_template(row),
+                row[9],
+                decision.is_error,
+                row[10]
             )
-            if alert.type in security_policy:
-                action = security_policy[alert.type]["action"]
-                setattr(issue_alert, action, True)
-                setattr(issue_alert, "action", action)
-            if (not all_new_alerts and actions is None and (issue_alert.error or issue_alert.warn)) or all_new_alerts:
-                log.debug(f"Found issue {issue_alert.title} for scan {report.id}")
-                if issue_alert not in alerts:
-                    alerts.append(issue_alert)
-            elif actions is not None:
-                for override in actions:
-                    if issue_alert.action == override.lower():
-                        log.debug(f"Found issue {issue_alert.title} for scan {report.id}")
-                        alerts.append(issue_alert)
+            if decision.action is not None:
+                setattr(issue_alert, decision.action, True)
+                setattr(issue_alert, "action", decision.action)
+            if delta is not None:
+                issue_alert.delta = delta
+            log.debug(f"Found issue {issue_alert.title} for scan {report.id}")
+            if keep_duplicates:
+                alerts.append(issue_alert)
+            elif seen is not None:
+                seen.add(identity)
+                alerts.append(issue_alert)
+            elif issue_alert not in alerts:
+                alerts.append(issue_alert)
         return alerts
 
     @staticmethod
-    def is_error(alert: Alert):
+    def is_error(alert: Alert, decisions: PolicyDecisions = None):
         """
         Compare the current alert against the Security Policy to determine if it should be included. Can be overridden
         with all_new_alerts Global setting if desired to return all alerts and not just the error category from the
         security policy.
         :param alert:
+        :param decisions: PolicyDecisions - Compiled security policy to compare against, defaults to the main Org policy
         :return:
         """
-        if all_new_alerts or (alert.type in security_policy and security_policy[alert.type]["action"] == "error"):
-            return True
-        else:
-            return False
+        if decisions is None:
+            decisions = policy_decisions
+        return decisions[alert.type].is_error
 
     @staticmethod
-    def get_source_data(package: Package, packages: dict) -> list:
+    def get_source_data(package: Package, packages: dict, index: ScanIndex = None) -> list:
         """
         Creates the properties for source data of the source manifest file(s) and top level packages.
         :param package: Package - Current package being evaluated
         :param packages: Dict - All packages, used to determine top level package information for transitive packages
+        :param index: ScanIndex - Dependency graph of the scan. When set the source data is looked up in the index,
+            which builds it once per package instead of once per call
         :return:
         """
+        if index is not None and package.id in index:
+            return index.get_source_data(package.id)
         introduced_by = []
         if package.direct:
             manifests = ""
@@ -407,7 +1082,9 @@ class Core:
         else:
             for top_id in package.topLevelAncestors:
                 top_package: Package
-                top_package = Package(**packages[top_id])
+                top_package = packages[top_id]
+                if isinstance(top_package, dict):
+                    top_package = Package(**top_package)
                 manifests = ""
                 top_purl = f"{top_package.type}/{top_package.name}@{top_package.version}"
                 for manifest_data in top_package.manifestFiles:
@@ -419,17 +1096,22 @@ class Core:
         return introduced_by
 
     @staticmethod
-    def create_purl(package_id: str, packages: dict) -> (Purl, Package):
+    def create_purl(package_id: str, packages: dict, index: ScanIndex = None) -> (Purl, Package):
         """
         Creates the extended PURL data to use in the added or removed package details. Primarily used for outputting
         data in the results for detections.
         :param package_id: Str - Package ID of the package to create the PURL data
         :param packages: dict - All packages to use for look up from transitive packages
+        :param index: ScanIndex - Dependency graph of the scan. Build it once per scan and pass it for every package of
+            the scan, without it the source data is looked up directly from the package's top level ancestors
         :return:
         """
         package: Package
         package = packages[package_id]
-        introduced_by = Core.get_source_data(package, packages)
+        introduced_by = Core.get_source_data(package, packages, index)
+        transitives = package.transitives
+        if index is not None:
+            transitives = index.get_transitives(package_id)
         purl = Purl(
             id=package.id,
             name=package.name,
@@ -439,7 +1121,7 @@ class Core:
             introduced_by=introduced_by,
             author=package.author or [],
             size=package.size,
-            transitives=package.transitives,
+            transitives=transitives,
         )
         return purl, package
 
@@ -451,7 +1133,6 @@ class Core:
         :return:
         """
         packages = {}
-        top_level_count = {}
         for item in sbom:
             package = Package(**item)
             if package.id in packages:
@@ -459,21 +1140,32 @@ class Core:
             else:
                 package = Core.get_license_details(package)
                 packages[package.id] = package
-                for top_id in package.topLevelAncestors:
-                    if top_id not in top_level_count:
-                        top_level_count[top_id] = 1
-                    else:
-                        top_level_count[top_id] += 1
-        if len(top_level_count) > 0:
-            for package_id in top_level_count:
-                packages[package_id].transitives = top_level_count[package_id]
+        index = ScanIndex(packages)
+        for package_id in packages:
+            transitives = index.get_transitives(package_id)
+            if transitives > 0:
+                packages[package_id].transitives = transitives
         return packages
 
     @staticmethod
     def get_license_details(package: Package) -> Package:
-        license_raw = package.license
-        license_str = Licenses.make_python_safe(license_raw)
-        if license_str is not None and hasattr(licenses, license_str):
-            license_obj = getattr(licenses, license_str)
-            package.license_text = license_obj.licenseText
+        license_obj = licenses.get(package.license)
+        if license_obj is not None:
+            package.set_license(license_obj)
         return package
+
+
+def extract_alerts(packages: dict, package_ids: list, decisions: PolicyDecisions) -> list:
+    """
+    Worker process entry point for Core.handle_reports_parallel, extracts the alert rows of a scan or a shard of it
+    :param packages: dict - Packages of the scan, or of the shard and their top level ancestors
+    :param package_ids: list - Packages to extract the alerts from
+    :param decisions: PolicyDecisions - Compiled security policy
+    :return:
+    """
+    rows = []
+    index = ScanIndex(packages)
+    for package_id in package_ids:
+        package = Package(**packages[package_id])
+        rows.extend(Core.get_alert_rows(package, packages, decisions, index=index))
+    return rows
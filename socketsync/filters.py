@@ -0,0 +1,53 @@
+import fnmatch
+import json
+import re
+
+
+__all__ = ["RepoFilter"]
+
+
+class RepoFilter:
+    names: frozenset
+    patterns: list
+    pattern: re.Pattern
+    matched: dict
+
+    def __init__(self, repos: list = None):
+        """
+        Matches repo names against a list of repo filters. Plain names are kept in a frozenset, names containing glob
+        characters (`*`, `?`, `[`) and names prefixed with `re:` are compiled once into a single regular expression.
+        Patterns have to match the whole repo name.
+
+        :param repos: List of repo names, glob patterns or `re:` prefixed regular expressions
+        """
+        names = set()
+        self.patterns = []
+        for repo in repos or []:
+            if repo.startswith("re:"):
+                self.patterns.append(repo[3:])
+            elif any(char in repo for char in "*?["):
+                self.patterns.append(fnmatch.translate(repo))
+            else:
+                names.add(repo)
+        self.names = frozenset(names)
+        self.pattern = None
+        if len(self.patterns) > 0:
+            self.pattern = re.compile("|".join(f"(?:{pattern})" for pattern in self.patterns))
+        self.matched = {}
+
+    def __contains__(self, repo: str) -> bool:
+        if repo in self.names:
+            return True
+        if self.pattern is None or repo is None:
+            return False
+        matched = self.matched.get(repo)
+        if matched is None:
+            matched = self.pattern.fullmatch(repo) is not None
+            self.matched[repo] = matched
+        return matched
+
+    def __len__(self):
+        return len(self.names) + len(self.patterns)
+
+    def __str__(self):
+        return json.dumps({"names": sorted(self.names), "patterns": self.patterns})
@@ -0,0 +1,126 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from socketsync import log
+
+
+__all__ = ["FingerprintStore", "fingerprint"]
+
+default_ttl = 30 * 24 * 60 * 60
+query_batch_size = 500
+
+
+def fingerprint(issue) -> bytes:
+    """
+    Fingerprint of an issue across runs, the Org, repo, package@version, alert type and alert key
+    :param issue: IssueRecord - Issue to fingerprint
+    :return: 16 byte digest
+    """
+    value = (
+        f"{issue.owner}|{issue.repo}|{issue.pkg_type}/{issue.pkg_name}@{issue.pkg_version}|{issue.type}|{issue.key}"
+    )
+    return hashlib.blake2b(value.encode(), digest_size=16).digest()
+
+
+class FingerprintStore:
+    file: str
+    ttl: int
+
+    def __init__(self, file: str, ttl: int = default_ttl):
+        """
+        SQLite store of the fingerprints of the issues that were already delivered. Issues whose fingerprint was
+        delivered within the TTL are dropped by filter, so an alert is only sent again once it expires. In delta mode
+        the last delivered delta state of each fingerprint is kept, and an issue is only dropped when its delta matches
+        it, so an alert that was resolved and comes back is sent again.
+
+        :param file: Path of the SQLite database. Created if it does not exist
+        :param ttl: Seconds a delivered fingerprint suppresses the same issue. Defaults to 30 days
+        """
+        self.file = file
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.file, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints "
+            "(fingerprint BLOB PRIMARY KEY, delivered_at INTEGER NOT NULL, delta TEXT) WITHOUT ROWID"
+        )
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(fingerprints)")]
+        if "delta" not in columns:
+            self.connection.execute("ALTER TABLE fingerprints ADD COLUMN delta TEXT")
+        self.connection.commit()
+        self.expire()
+
+    def expire(self) -> int:
+        """
+        Deletes the fingerprints that are older than the TTL
+        :return: Number of deleted fingerprints
+        """
+        with self.lock:
+            cursor = self.connection.execute(
+                "DELETE FROM fingerprints WHERE delivered_at < ?", (int(time.time()) - self.ttl,)
+            )
+            self.connection.commit()
+        if cursor.rowcount > 0:
+            log.debug(f"Expired {cursor.rowcount} fingerprints from {self.file}")
+        return cursor.rowcount
+
+    def delivered(self, fingerprints: list) -> dict:
+        """
+        Finds which of the fingerprints were delivered within the TTL
+        :param fingerprints: list - Fingerprints to look up
+        :return: Dict of the delivered fingerprints to the delta state they were last delivered with
+        """
+        found = {}
+        oldest = int(time.time()) - self.ttl
+        with self.lock:
+            for start in range(0, len(fingerprints), query_batch_size):
+                batch = fingerprints[start:start + query_batch_size]
+                placeholders = ",".join("?" * len(batch))
+                rows = self.connection.execute(
+                    f"SELECT fingerprint, delta FROM fingerprints WHERE delivered_at >= ? "
+                    f"AND fingerprint IN ({placeholders})",
+                    [oldest, *batch]
+                )
+                found.update((row[0], row[1]) for row in rows)
+        return found
+
+    def filter(self, issues: list) -> list:
+        """
+        Drops the issues that were already delivered with the same delta state, and repeats of the same issue and state
+        within the list
+        :param issues: list - IssueRecords to filter
+        :return: IssueRecords that still have to be delivered
+        """
+        fingerprints = [fingerprint(issue) for issue in issues]
+        seen = self.delivered(list(set(fingerprints)))
+        new_issues = []
+        for issue, issue_fingerprint in zip(issues, fingerprints):
+            delta = getattr(issue, "delta", None)
+            if issue_fingerprint in seen and seen[issue_fingerprint] == delta:
+                continue
+            seen[issue_fingerprint] = delta
+            new_issues.append(issue)
+        log.debug(f"Suppressed {len(issues) - len(new_issues)} already delivered issues")
+        return new_issues
+
+    def mark_delivered(self, issues: list) -> None:
+        """
+        Records the issues as delivered, along with their delta state. Call this once the issues were sent to every
+        connector so that a failed delivery is retried on the next run.
+        :param issues: list - IssueRecords that were delivered
+        :return:
+        """
+        now = int(time.time())
+        with self.lock:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO fingerprints (fingerprint, delivered_at, delta) VALUES (?, ?, ?)",
+                ((fingerprint(issue), now, getattr(issue, "delta", None)) for issue in issues)
+            )
+            self.connection.commit()
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,120 @@
+from array import array
+from socketsync import log
+
+
+__all__ = ["ScanIndex"]
+
+
+def get_field(item, name: str, default=None):
+    if isinstance(item, dict):
+        return item.get(name, default)
+    return getattr(item, name, default)
+
+
+class ScanIndex:
+    ids: list
+    index: dict
+    direct: bytearray
+    ancestor_offsets: array
+    ancestors: array
+    transitives: array
+
+    def __init__(self, packages: dict):
+        """
+        Dependency graph of a single scan. Package IDs are mapped to integers, and the top level ancestors of every
+        package are stored in two flat arrays: the ancestors of package i are ancestors[ancestor_offsets[i]:
+        ancestor_offsets[i + 1]]. The manifest string, purl and source data of a package are built on first use and
+        kept, so each one is only built once per scan.
+
+        :param packages: dict - Package ID -> raw package dict from the full scan stream, or Package
+        """
+        self.packages = packages
+        self.ids = list(packages)
+        self.index = {package_id: position for position, package_id in enumerate(self.ids)}
+        size = len(self.ids)
+        self.direct = bytearray(size)
+        self.ancestor_offsets = array("I", [0])
+        self.ancestors = array("I")
+        self.transitives = array("I", bytes(4 * size))
+        missing = 0
+        for position, package_id in enumerate(self.ids):
+            item = packages[package_id]
+            if get_field(item, "direct", False):
+                self.direct[position] = 1
+            for top_id in get_field(item, "topLevelAncestors") or []:
+                top_position = self.index.get(top_id)
+                if top_position is None:
+                    missing += 1
+                    continue
+                self.ancestors.append(top_position)
+                self.transitives[top_position] += 1
+            self.ancestor_offsets.append(len(self.ancestors))
+        if missing > 0:
+            log.debug(f"Skipped {missing} top level ancestors that are not in the scan")
+        self.manifests = [None] * size
+        self.purls = [None] * size
+        self.sources = [None] * size
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, package_id: str) -> bool:
+        return package_id in self.index
+
+    def get_ancestors(self, package_id: str) -> list:
+        """
+        Gets the IDs of the top level ancestors of a package
+        :param package_id: str - Package ID
+        :return:
+        """
+        position = self.index[package_id]
+        start = self.ancestor_offsets[position]
+        end = self.ancestor_offsets[position + 1]
+        return [self.ids[top_position] for top_position in self.ancestors[start:end]]
+
+    def get_manifests(self, position: int) -> str:
+        manifests = self.manifests[position]
+        if manifests is None:
+            item = self.packages[self.ids[position]]
+            files = [manifest_data.get("file") for manifest_data in get_field(item, "manifestFiles") or []]
+            manifests = ";".join(f"{manifest_file}" for manifest_file in files).rstrip(";")
+            self.manifests[position] = manifests
+        return manifests
+
+    def get_purl(self, position: int) -> str:
+        purl = self.purls[position]
+        if purl is None:
+            item = self.packages[self.ids[position]]
+            purl = f"{get_field(item, 'type')}/{get_field(item, 'name')}@{get_field(item, 'version')}"
+            self.purls[position] = purl
+        return purl
+
+    def get_source_data(self, package_id: str) -> list:
+        """
+        Gets the manifest files of a direct package, or the purl and manifest files of each top level ancestor of a
+        transitive package. Same result as Core.get_source_data.
+        :param package_id: str - Package ID
+        :return: List of (purl or "direct", manifests) tuples
+        """
+        position = self.index[package_id]
+        sources = self.sources[position]
+        if sources is None:
+            if self.direct[position]:
+                sources = [("direct", self.get_manifests(position))]
+            else:
+                start = self.ancestor_offsets[position]
+                end = self.ancestor_offsets[position + 1]
+                sources = [
+                    (self.get_purl(top_position), self.get_manifests(top_position))
+                    for top_position in self.ancestors[start:end]
+                ]
+            self.sources[position] = sources
+        return sources
+
+    def get_transitives(self, package_id: str) -> int:
+        """
+        Gets the number of packages in the scan that have the package as a top level ancestor
+        :param package_id: str - Package ID
+        :return:
+        """
+        return self.transitives[self.index[package_id]]
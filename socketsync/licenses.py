@@ -0,0 +1,177 @@
+import json
+import os
+import struct
+import threading
+import zlib
+from socketsync import log
+
+
+__all__ = ["License", "Licenses", "write_table", "default_table_file"]
+
+default_table_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "licenses.bin")
+magic = b"SLIC1\n"
+header = struct.Struct(">I")
+
+
+class License:
+    __slots__ = ("licenseId", "name", "offset", "length", "table")
+    licenseId: str
+    name: str
+
+    def __init__(self, license_id: str, name: str, offset: int, length: int, table: "Licenses"):
+        self.licenseId = license_id
+        self.name = name
+        self.offset = offset
+        self.length = length
+        self.table = table
+
+    @property
+    def licenseText(self) -> str:
+        return self.table.read_text(self)
+
+    def __str__(self):
+        return json.dumps({"licenseId": self.licenseId, "name": self.name})
+
+
+class Licenses:
+    file: str
+
+    def __init__(self, file: str = default_table_file):
+        """
+        SPDX license table. Only the index of the table is read, on first use, and each license text is decompressed
+        from the table file the first time it is needed. A missing table file is treated as an empty table, see check.
+
+        :param file: Path of the license table written by scripts/generate_licenses.py
+        """
+        self.file = file
+        self.licenses = None
+        self.lookup = None
+        self.safe_names = None
+        self.texts = {}
+        self.data_start = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def make_python_safe(name: str) -> str:
+        """
+        Converts an SPDX license id into the attribute name used by the previous attribute based table
+        :param name: str - SPDX license id, I.E. Apache-2.0
+        :return: I.E. Apache_2_0
+        """
+        if name is None or name == "":
+            return None
+        safe_name = str(name).replace("-", "_").replace(".", "_").replace("+", "_plus")
+        if safe_name[0].isdigit():
+            safe_name = f"_{safe_name}"
+        return safe_name
+
+    def check(self) -> bool:
+        """
+        Checks that the table file exists without loading it, logging a warning if it does not
+        :return: True if the table file exists
+        """
+        if os.path.isfile(self.file):
+            return True
+        log.warning(
+            f"License table {self.file} not found, license texts are not available. "
+            "Generate it with scripts/generate_licenses.py"
+        )
+        return False
+
+    def load(self) -> None:
+        with self.lock:
+            if self.licenses is not None:
+                return
+            licenses = {}
+            try:
+                with open(self.file, "rb") as table_file:
+                    if table_file.read(len(magic)) != magic:
+                        raise ValueError("not a license table")
+                    (index_length,) = header.unpack(table_file.read(header.size))
+                    index = json.loads(zlib.decompress(table_file.read(index_length)))
+                    self.data_start = len(magic) + header.size + index_length
+                for license_id, (offset, length, name) in index["licenses"].items():
+                    licenses[license_id] = License(license_id, name, offset, length, self)
+            except FileNotFoundError:
+                log.debug(f"License table {self.file} not found, license texts are not available")
+            except (OSError, ValueError, KeyError, zlib.error) as error:
+                log.warning(f"Unable to load license table {self.file}, license texts are not available")
+                log.warning(error)
+            self.lookup = {license_id.lower(): license_obj for license_id, license_obj in licenses.items()}
+            self.safe_names = {
+                Licenses.make_python_safe(license_id): license_obj for license_id, license_obj in licenses.items()
+            }
+            self.licenses = licenses
+
+    def get(self, license_id: str) -> License:
+        """
+        Looks up a license by SPDX id, ignoring case
+        :param license_id: str - SPDX license id
+        :return: License or None if the id is not in the table
+        """
+        if self.licenses is None:
+            self.load()
+        if license_id is None:
+            return None
+        license_obj = self.licenses.get(license_id)
+        if license_obj is None:
+            license_obj = self.lookup.get(str(license_id).lower())
+        return license_obj
+
+    def read_text(self, license_obj: License) -> str:
+        """
+        Decompresses the text of a license, texts are kept once read
+        :param license_obj: License
+        :return:
+        """
+        text = self.texts.get(license_obj.licenseId)
+        if text is None:
+            with self.lock:
+                with open(self.file, "rb") as table_file:
+                    table_file.seek(self.data_start + license_obj.offset)
+                    data = table_file.read(license_obj.length)
+            text = zlib.decompress(data).decode("utf-8")
+            self.texts[license_obj.licenseId] = text
+        return text
+
+    def __len__(self):
+        if self.licenses is None:
+            self.load()
+        return len(self.licenses)
+
+    def __contains__(self, license_id: str) -> bool:
+        return self.get(license_id) is not None
+
+    def __getattr__(self, name: str) -> License:
+        if name.startswith("__") or name in ("licenses", "lookup", "safe_names"):
+            raise AttributeError(name)
+        if self.licenses is None:
+            self.load()
+        license_obj = self.safe_names.get(name)
+        if license_obj is None:
+            raise AttributeError(name)
+        return license_obj
+
+
+def write_table(licenses: list, file: str = default_table_file, version: str = None) -> None:
+    """
+    Writes a license table. Each text is compressed on its own so it can be read without decompressing the others.
+    :param licenses: list - (SPDX id, name, text) tuples
+    :param file: Path to write the table to
+    :param version: Version of the SPDX license list the texts come from
+    :return:
+    """
+    index = {}
+    blob = bytearray()
+    for license_id, name, text in licenses:
+        data = zlib.compress((text or "").encode("utf-8"), 9)
+        index[license_id] = [len(blob), len(data), name]
+        blob.extend(data)
+    index_data = zlib.compress(json.dumps({"version": version, "licenses": index}).encode("utf-8"), 9)
+    tmp_file = f"{file}.tmp"
+    with open(tmp_file, "wb") as table_file:
+        table_file.write(magic)
+        table_file.write(header.pack(len(index_data)))
+        table_file.write(index_data)
+        table_file.write(blob)
+    os.replace(tmp_file, file)
@@ -0,0 +1,271 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketsync import profiling
+
+
+__all__ = [
+    "MetricsRecorder",
+    "InMemoryRecorder",
+    "set_recorder",
+    "get_recorder",
+    "increment",
+    "observe",
+    "timer",
+    "sink_send",
+    "render_prometheus",
+    "serve_metrics",
+]
+
+default_buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class MetricsRecorder:
+    """
+    Base recorder, drops every metric. Subclass it and pass it to set_recorder to send metrics somewhere else, I.E.
+    StatsD or an OpenTelemetry meter.
+    """
+
+    def increment(self, name: str, value: float = 1, labels: dict = None) -> None:
+        pass
+
+    def observe(self, name: str, value: float, labels: dict = None) -> None:
+        pass
+
+
+class Histogram:
+    buckets: tuple
+    counts: list
+    sum: float
+    count: int
+
+    def __init__(self, buckets: tuple = default_buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for index, bucket in enumerate(self.buckets):
+            if value <= bucket:
+                self.counts[index] += 1
+                break
+
+    def __str__(self):
+        return json.dumps({"buckets": self.buckets, "counts": self.counts, "sum": self.sum, "count": self.count})
+
+
+class InMemoryRecorder(MetricsRecorder):
+    counters: dict
+    histograms: dict
+
+    def __init__(self, buckets: tuple = default_buckets):
+        """
+        Keeps counters and histograms in memory so they can be read with snapshot or exported with render_prometheus
+
+        :param buckets: Upper bounds of the histogram buckets in seconds
+        """
+        self.buckets = buckets
+        self.counters = {}
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def label_key(labels: dict) -> tuple:
+        if not labels:
+            return ()
+        return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+    def increment(self, name: str, value: float = 1, labels: dict = None) -> None:
+        key = (name, InMemoryRecorder.label_key(labels))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: dict = None) -> None:
+        key = (name, InMemoryRecorder.label_key(labels))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = Histogram(self.buckets)
+                self.histograms[key] = histogram
+            histogram.observe(value)
+
+    def snapshot(self) -> dict:
+        """
+        Copies the current values of all metrics
+        :return: Dict with the counters and the histogram count/sum keyed by metric name and labels
+        """
+        with self.lock:
+            counters = {}
+            for (name, labels), value in self.counters.items():
+                counters.setdefault(name, {})[labels] = value
+            histograms = {}
+            for (name, labels), histogram in self.histograms.items():
+                histograms.setdefault(name, {})[labels] = {"count": histogram.count, "sum": histogram.sum}
+        return {"counters": counters, "histograms": histograms}
+
+    def reset(self) -> None:
+        with self.lock:
+            self.counters = {}
+            self.histograms = {}
+
+
+recorder = MetricsRecorder()
+
+
+def set_recorder(new_recorder: MetricsRecorder) -> MetricsRecorder:
+    """
+    Sets the recorder that receives all socketsync metrics
+    :param new_recorder: MetricsRecorder - Recorder to use, MetricsRecorder() disables metrics again
+    :return: The recorder that was set
+    """
+    global recorder
+    recorder = new_recorder
+    return recorder
+
+
+def get_recorder() -> MetricsRecorder:
+    return recorder
+
+
+def increment(name: str, value: float = 1, **labels) -> None:
+    recorder.increment(name, value, labels)
+
+
+def observe(name: str, value: float, **labels) -> None:
+    recorder.observe(name, value, labels)
+
+
+@contextmanager
+def timer(name: str, **labels):
+    """
+    Observes the seconds spent in the with block on the histogram `name`
+    :param name: str - Histogram name
+    :param labels: Labels for the observation
+    :return:
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.observe(name, time.perf_counter() - start, labels)
+
+
+@contextmanager
+def sink_send(sink: str, events: int = 1):
+    """
+    Records the latency of a request to a sink and whether it delivered its events. The block can mark the send as
+    failed by setting status["failed"], an exception raised in the block also counts as a failure. The send is also
+    profiled per sink when profiling is enabled.
+    :param sink: str - Name of the sink, I.E. panther
+    :param events: int - Number of events sent in the request
+    :return: Dict with the failed flag for the block to update
+    """
+    status = {"failed": False}
+    start = time.perf_counter()
+    try:
+        with profiling.section("sink_send", sink):
+            yield status
+    except Exception:
+        status["failed"] = True
+        raise
+    finally:
+        recorder.observe("socketsync_sink_send_seconds", time.perf_counter() - start, {"sink": sink})
+        recorder.increment("socketsync_sink_requests_total", 1, {"sink": sink})
+        if status["failed"]:
+            recorder.increment("socketsync_sink_failures_total", 1, {"sink": sink})
+        else:
+            recorder.increment("socketsync_sink_events_total", events, {"sink": sink})
+
+
+def format_labels(labels: tuple, extra: tuple = ()) -> str:
+    pairs = list(extra) + list(labels)
+    if len(pairs) == 0:
+        return ""
+    values = []
+    for name, value in pairs:
+        value = value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        values.append(f'{name}="{value}"')
+    return "{" + ",".join(values) + "}"
+
+
+def format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_prometheus(metrics_recorder: InMemoryRecorder = None) -> str:
+    """
+    Renders the metrics of an InMemoryRecorder in the Prometheus text exposition format
+    :param metrics_recorder: InMemoryRecorder - Recorder to render, defaults to the current recorder
+    :return:
+    """
+    if metrics_recorder is None:
+        metrics_recorder = recorder
+    if not isinstance(metrics_recorder, InMemoryRecorder):
+        return ""
+    lines = []
+    with metrics_recorder.lock:
+        counters = {}
+        for (name, labels), value in metrics_recorder.counters.items():
+            counters.setdefault(name, []).append((labels, value))
+        histograms = {}
+        for (name, labels), histogram in metrics_recorder.histograms.items():
+            histograms.setdefault(name, []).append((labels, histogram))
+        for name in sorted(counters):
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in sorted(counters[name]):
+                lines.append(f"{name}{format_labels(labels)} {format_number(value)}")
+        for name in sorted(histograms):
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in sorted(histograms[name], key=lambda item: item[0]):
+                cumulative = 0
+                for bucket, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    bucket_labels = format_labels(labels, (("le", format_number(bucket)),))
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                lines.append(f"{name}_bucket{format_labels(labels, (('le', '+Inf'),))} {histogram.count}")
+                lines.append(f"{name}_sum{format_labels(labels)} {format_number(histogram.sum)}")
+                lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+    return "\n".join(lines) + "\n"
+
+
+def serve_metrics(port: int = 9464, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """
+    Serves the current recorder in the Prometheus text format on /metrics from a background thread. Meant for long
+    running processes that call get_issues on a schedule. Installs an InMemoryRecorder if metrics are not enabled yet.
+    :param port: int - Port to listen on
+    :param host: str - Address to listen on
+    :return: The running server, call shutdown() on it to stop serving
+    """
+    if not isinstance(recorder, InMemoryRecorder):
+        set_recorder(InMemoryRecorder())
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = render_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
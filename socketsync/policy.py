@@ -0,0 +1,64 @@
+import json
+import sys
+
+
+__all__ = ["PolicyDecision", "PolicyDecisions", "compile_policy"]
+
+
+class PolicyDecision:
+    __slots__ = ("include", "action", "is_error")
+    include: bool
+    action: str
+    is_error: bool
+
+    def __init__(self, include: bool, action: str = None, is_error: bool = False):
+        self.include = include
+        self.action = action
+        self.is_error = is_error
+
+    def __str__(self):
+        return json.dumps({"include": self.include, "action": self.action, "is_error": self.is_error})
+
+
+class PolicyDecisions(dict):
+    """
+    Alert type -> PolicyDecision. Alert types that are not in the security policy get the default decision, which is
+    stored on first use so every later lookup is a plain dict hit.
+    """
+    default: PolicyDecision
+
+    def __init__(self, default: PolicyDecision):
+        super().__init__()
+        self.default = default
+
+    def __missing__(self, alert_type: str) -> PolicyDecision:
+        self[alert_type] = self.default
+        return self.default
+
+
+def compile_policy(
+        security_policy: dict,
+        actions_override: list = None,
+        enable_all_alerts: bool = False
+) -> PolicyDecisions:
+    """
+    Compiles the Org security policy and the alert filter options into a decision for every alert type
+    :param security_policy: dict - Security policy rules from the Org settings, alert type -> {"action": action}
+    :param actions_override: list - Actions to include instead of the default error and warn
+    :param enable_all_alerts: bool - Include every alert regardless of the security policy
+    :return:
+    """
+    overrides = None
+    if actions_override is not None:
+        overrides = {override.lower() for override in actions_override}
+    decisions = PolicyDecisions(PolicyDecision(enable_all_alerts, None, enable_all_alerts))
+    for alert_type, rule in security_policy.items():
+        action = sys.intern(rule["action"])
+        if enable_all_alerts:
+            include = True
+        elif overrides is None:
+            include = action == "error" or action == "warn"
+        else:
+            include = action in overrides
+        decisions[sys.intern(alert_type)] = PolicyDecision(include, action, enable_all_alerts or action == "error")
+    return decisions
@@ -0,0 +1,253 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from socketsync import log
+
+
+__all__ = [
+    "Profiler",
+    "set_profiler",
+    "get_profiler",
+    "stop",
+    "disable",
+    "section",
+    "profile_env_var",
+    "profile_dir_env_var",
+]
+
+profile_env_var = "SOCKET_SYNC_PROFILE"
+profile_dir_env_var = "SOCKET_SYNC_PROFILE_DIR"
+disabled_section = nullcontext()
+
+
+class SectionStats:
+    calls: int
+    wall: float
+    cpu: float
+    memory: int
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.memory = 0
+
+    def add(self, wall: float, cpu: float, memory: int) -> None:
+        self.calls += 1
+        self.wall += wall
+        self.cpu += cpu
+        self.memory += memory
+
+    def __str__(self):
+        return json.dumps(self.__dict__)
+
+
+class Profiler:
+    output_dir: str
+    memory: bool
+    top: int
+    sections: dict
+    keys: dict
+    profiles: dict
+
+    def __init__(self, output_dir: str = "socketsync-profiles", memory: bool = True, top: int = 25):
+        """
+        Collects wall time, CPU time and allocated memory per profiled section, and per scan or sink inside each
+        section. The outermost section of a thread also runs cProfile so the report shows the hot functions. The
+        report is written by stop, or at the end of the with block when used as a context manager.
+
+        :param output_dir: Folder the run reports are written to
+        :param memory: Trace allocations with tracemalloc, this slows the run down noticeably
+        :param top: Number of functions and allocation sites listed in the report
+        """
+        self.output_dir = output_dir
+        self.memory = memory
+        self.top = top
+        self.sections = {}
+        self.keys = {}
+        self.profiles = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.cprofile_active = False
+        self.started = datetime.now()
+        self.report_file = None
+        self.stopped = False
+        self.started_tracing = False
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+
+    def __enter__(self) -> "Profiler":
+        set_profiler(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if profiler is self:
+            set_profiler(None)
+        self.stop()
+
+    @contextmanager
+    def section(self, name: str, key: str = None):
+        """
+        Profiles the with block
+        :param name: str - Section name, I.E. handle_reports
+        :param key: str - What the section is working on, I.E. a scan id or a sink name
+        :return:
+        """
+        profile = None
+        depth = getattr(self.local, "depth", 0)
+        if depth == 0:
+            with self.lock:
+                if not self.cprofile_active:
+                    self.cprofile_active = True
+                    profile = cProfile.Profile()
+        self.local.depth = depth + 1
+        memory_start = tracemalloc.get_traced_memory()[0] if self.memory else 0
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            memory = tracemalloc.get_traced_memory()[0] - memory_start if self.memory else 0
+            self.local.depth = depth
+            with self.lock:
+                if name not in self.sections:
+                    self.sections[name] = SectionStats()
+                self.sections[name].add(wall, cpu, memory)
+                if key is not None:
+                    if (name, key) not in self.keys:
+                        self.keys[(name, key)] = SectionStats()
+                    self.keys[(name, key)].add(wall, cpu, memory)
+                if profile is not None:
+                    self.profiles.setdefault(name, []).append(profile)
+                    self.cprofile_active = False
+
+    def write_report(self) -> str:
+        """
+        Writes the report for this run to the output folder along with a pstats file per profiled section that can be
+        loaded into tools like snakeviz
+        :return: Path of the report
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        prefix = f"socketsync-profile-{self.started.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        report_file = os.path.join(self.output_dir, f"{prefix}.txt")
+        with self.lock:
+            sections = dict(self.sections)
+            keys = dict(self.keys)
+            profiles = {name: list(items) for name, items in self.profiles.items()}
+        lines = [f"socketsync profile started {self.started.isoformat()}", "", "Sections"]
+        lines.append(f"{'section':<28}{'calls':>10}{'wall s':>12}{'cpu s':>12}{'alloc MB':>12}")
+        for name, stats in sorted(sections.items(), key=lambda item: item[1].wall, reverse=True):
+            lines.append(
+                f"{name:<28}{stats.calls:>10}{stats.wall:>12.3f}{stats.cpu:>12.3f}{stats.memory / 1048576:>12.2f}"
+            )
+        lines += ["", "Scans and sinks"]
+        lines.append(f"{'section':<28}{'key':<44}{'calls':>10}{'wall s':>12}{'cpu s':>12}{'alloc MB':>12}")
+        for (name, key), stats in sorted(keys.items(), key=lambda item: item[1].wall, reverse=True)[:self.top * 4]:
+            lines.append(
+                f"{name:<28}{str(key):<44}{stats.calls:>10}{stats.wall:>12.3f}{stats.cpu:>12.3f}"
+                f"{stats.memory / 1048576:>12.2f}"
+            )
+        for name, items in sorted(profiles.items()):
+            stats = pstats.Stats(items[0])
+            for profile in items[1:]:
+                stats.add(profile)
+            stats.dump_stats(os.path.join(self.output_dir, f"{prefix}-{name}.pstats"))
+            output = io.StringIO()
+            stats.stream = output
+            stats.sort_stats("cumulative").print_stats(self.top)
+            lines += ["", f"cProfile {name}", output.getvalue()]
+        if self.memory and tracemalloc.is_tracing():
+            lines += ["", "Top allocation sites"]
+            snapshot = tracemalloc.take_snapshot()
+            for statistic in snapshot.statistics("lineno")[:self.top]:
+                lines.append(str(statistic))
+        with open(report_file, "w") as file:
+            file.write("\n".join(lines) + "\n")
+        log.info(f"Wrote profile report to {report_file}")
+        return report_file
+
+    def stop(self) -> str:
+        """
+        Writes the report of the run, once, and stops tracing allocations if this profiler started it
+        :return: Path of the report
+        """
+        with self.lock:
+            if self.stopped:
+                return self.report_file
+            self.stopped = True
+        self.report_file = self.write_report()
+        if self.started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return self.report_file
+
+
+profiler = None
+
+
+def set_profiler(new_profiler: Profiler = None) -> Profiler:
+    """
+    Enables profiling for the process, or disables it when called without a profiler. The report is not written until
+    the profiler is stopped, see stop
+    :param new_profiler: Profiler - Profiler to use
+    :return: The profiler that was set
+    """
+    global profiler
+    profiler = new_profiler
+    return profiler
+
+
+def get_profiler() -> Profiler:
+    return profiler
+
+
+def stop() -> str:
+    """
+    Disables profiling and writes the report of the run. Call it once the issues were sent to the connectors so their
+    sends are included
+    :return: Path of the report, None if profiling was not enabled
+    """
+    current = profiler
+    if current is None:
+        return None
+    set_profiler(None)
+    return current.stop()
+
+
+def disable() -> None:
+    """
+    Disables profiling without writing a report. Used as the initializer of worker processes, which would otherwise
+    profile into a copy of the profiler of the parent that is never written
+    :return:
+    """
+    current = profiler
+    if current is None:
+        return
+    set_profiler(None)
+    if current.started_tracing and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def section(name: str, key: str = None):
+    """
+    Profiles the with block if profiling is enabled, otherwise does nothing
+    :param name: str - Section name
+    :param key: str - What the section is working on, I.E. a scan id or a sink name
+    :return:
+    """
+    if profiler is None:
+        return disabled_section
+    return profiler.section(name, key)
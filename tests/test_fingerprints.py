@@ -0,0 +1,69 @@
+import sqlite3
+
+from socketsync.classes import IssueRecord
+from socketsync.fingerprints import FingerprintStore, fingerprint
+
+
+def create_issue(**kwargs) -> IssueRecord:
+    return IssueRecord(
+        owner="example",
+        repo="app",
+        created_at="2024-09-10T10:00:00Z",
+        pkg_type="npm",
+        pkg_name="lodash",
+        pkg_version="4.17.20",
+        type="criticalCVE",
+        key="CVE-2021-23337",
+        **kwargs
+    )
+
+
+def test_fingerprint_ignores_delta():
+    assert fingerprint(create_issue(delta="added")) == fingerprint(create_issue(delta="resolved"))
+    assert fingerprint(create_issue()) == fingerprint(create_issue(delta="added"))
+
+
+def test_store_keeps_resolved_after_added(tmp_path):
+    store = FingerprintStore(str(tmp_path / "fingerprints.db"))
+    added = create_issue(delta="added")
+    resolved = create_issue(delta="resolved")
+    assert store.filter([added, resolved]) == [added, resolved]
+    store.mark_delivered([added])
+    assert store.filter([create_issue(delta="added"), resolved]) == [resolved]
+    store.mark_delivered([resolved])
+    assert store.filter([create_issue(delta="resolved")]) == []
+    store.close()
+
+
+def test_store_sends_alert_that_comes_back(tmp_path):
+    store = FingerprintStore(str(tmp_path / "fingerprints.db"))
+    store.mark_delivered([create_issue(delta="added")])
+    store.mark_delivered([create_issue(delta="resolved")])
+    added = create_issue(delta="added")
+    assert store.filter([added]) == [added]
+    store.mark_delivered([added])
+    assert store.filter([create_issue(delta="added")]) == []
+    store.close()
+
+
+def test_store_without_delta(tmp_path):
+    store = FingerprintStore(str(tmp_path / "fingerprints.db"))
+    issue = create_issue()
+    assert store.filter([issue, create_issue()]) == [issue]
+    store.mark_delivered([issue])
+    assert store.filter([create_issue()]) == []
+    store.close()
+
+
+def test_store_adds_delta_column(tmp_path):
+    file = str(tmp_path / "fingerprints.db")
+    connection = sqlite3.connect(file)
+    connection.execute(
+        "CREATE TABLE fingerprints (fingerprint BLOB PRIMARY KEY, delivered_at INTEGER NOT NULL) WITHOUT ROWID"
+    )
+    connection.close()
+    store = FingerprintStore(file)
+    resolved = create_issue(delta="resolved")
+    store.mark_delivered([resolved])
+    assert store.filter([create_issue(delta="resolved")]) == []
+    store.close()
@@ -0,0 +1,83 @@
+import json
+import os
+import sys
+from collections import defaultdict
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import fake_kafka  # noqa: E402
+from fixtures import generate_issues  # noqa: E402
+from socketsync import metrics  # noqa: E402
+from socketsync.connectors.kafka import Kafka  # noqa: E402
+
+topic = "socket-issues"
+labels = (("sink", "kafka"),)
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    monkeypatch.delitem(sys.modules, "confluent_kafka", raising=False)
+    recorder = metrics.set_recorder(metrics.InMemoryRecorder())
+    yield recorder
+    metrics.set_recorder(metrics.MetricsRecorder())
+
+
+def test_keeps_order_per_repo(recorder):
+    broker = fake_kafka.install(fake_kafka.FakeBroker(partitions=4))
+    issues = generate_issues(2000)
+    kafka = Kafka("localhost:9092", topic, linger_ms=1, batch_bytes=16384)
+    assert kafka.send_events(issues) == []
+    expected = defaultdict(list)
+    for issue in issues:
+        expected[f"{issue.owner}/{issue.repo}"].append((issue.report_id, issue.pkg_id, issue.key))
+    received = defaultdict(list)
+    partitions = defaultdict(set)
+    for partition, messages in enumerate(broker.topics[topic]):
+        for message in messages:
+            issue = json.loads(message.value())
+            received[message.key().decode()].append((issue["report_id"], issue["pkg_id"], issue["key"]))
+            partitions[message.key()].add(partition)
+    assert received == expected
+    assert all(len(partition) == 1 for partition in partitions.values())
+    counters = recorder.snapshot()["counters"]
+    assert counters["socketsync_sink_events_total"][labels] == len(issues)
+
+
+def test_reports_delivery_failures(recorder):
+    broker = fake_kafka.install(fake_kafka.FakeBroker(partitions=2, fail_ratio=0.5))
+    issues = generate_issues(1000)
+    kafka = Kafka("localhost:9092", topic, linger_ms=1, batch_bytes=4096)
+    errors = kafka.send_events(issues)
+    delivered = sum(len(messages) for messages in broker.topics[topic])
+    assert broker.failed_requests > 0
+    assert len(errors) == len(issues) - delivered > 0
+    counters = recorder.snapshot()["counters"]
+    assert counters["socketsync_sink_failures_total"][labels] == len(errors)
+    assert counters["socketsync_sink_events_total"][labels] == delivered
+
+
+def test_retries_when_the_queue_is_full(recorder):
+    broker = fake_kafka.install(fake_kafka.FakeBroker(partitions=2))
+    issues = generate_issues(500)
+    kafka = Kafka(
+        "localhost:9092",
+        topic,
+        linger_ms=1,
+        config={"queue.buffering.max.messages": 20}
+    )
+    produce = kafka.producer.produce
+    queue_full = []
+
+    def counting_produce(*args, **kwargs):
+        try:
+            return produce(*args, **kwargs)
+        except BufferError:
+            queue_full.append(True)
+            raise
+
+    kafka.producer.produce = counting_produce
+    assert kafka.send_events(issues) == []
+    assert len(queue_full) > 0
+    assert sum(len(messages) for messages in broker.topics[topic]) == len(issues)